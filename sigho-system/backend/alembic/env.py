@@ -0,0 +1,74 @@
+"""
+Entorno de Alembic
+Usa los modelos registrados en app.database.base y la DATABASE_URL de la
+configuración. En SQLite las migraciones se generan y ejecutan en modo
+batch (copiar y renombrar la tabla), ya que ALTER TABLE es limitado.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from app.core.config import settings
+from app.database.base import Base
+
+config = context.config
+
+# Al migrar desde el arranque del servidor no se toca la configuración de logs
+if config.config_file_name is not None and config.attributes.get("configure_logging", True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_object(obj, name, type_, reflected, compare_to):
+    """Excluye de autogenerate los índices de trigramas de PostgreSQL (migración 0003)"""
+    return not (type_ == "index" and name is not None and name.endswith("_trgm"))
+
+
+def run_migrations_offline() -> None:
+    """Genera el SQL de las migraciones sin conectarse (alembic upgrade --sql)"""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=settings.DATABASE_URL.startswith("sqlite"),
+        compare_type=True,
+        include_object=include_object
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations(connection) -> None:
+    """Ejecuta las migraciones pendientes sobre una conexión abierta"""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
+        compare_type=True,
+        include_object=include_object
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Migra la base de datos configurada (o la conexión recibida del servidor)"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations(connection)
+        return
+
+    connectable = create_engine(settings.DATABASE_URL, poolclass=pool.NullPool)
+    with connectable.connect() as connection:
+        run_migrations(connection)
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,451 @@
+"""Esquema base
+
+Esquema completo de la aplicación al adoptar Alembic. Las bases creadas
+antes con Base.metadata.create_all se adoptan con esta misma revisión: solo
+se crean las tablas y los índices que falten.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 14:05:03.838452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tipos enum que PostgreSQL crea junto con las tablas (SQLite no los tiene)
+ENUM_TYPES = (
+    'amenitycategory', 'documenttype', 'inventorycategory', 'invoicestatus',
+    'maintenancepriority', 'maintenancestatus', 'maintenancetype', 'movementtype',
+    'paymentmethod', 'paymentstatus', 'pricingruletype', 'reservationstatus',
+    'roomstatus', 'userrole',
+)
+
+
+def _create_table(name, *columns):
+    """Crea la tabla salvo que ya exista (bases previas a las migraciones)"""
+    if not sa.inspect(op.get_bind()).has_table(name):
+        op.create_table(name, *columns)
+
+
+def upgrade() -> None:
+    _create_table('amenities',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('icon', sa.String(length=50), nullable=True),
+    sa.Column('category', sa.Enum('BASIC', 'PREMIUM', 'LUXURY', name='amenitycategory'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_amenities_id', 'amenities', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_amenities_name', 'amenities', ['name'], unique=True, if_not_exists=True)
+
+    _create_table('archive_partitions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=20), nullable=False),
+    sa.Column('min_date', sa.Date(), nullable=True),
+    sa.Column('max_date', sa.Date(), nullable=True),
+    sa.Column('reservation_count', sa.Integer(), nullable=False),
+    sa.Column('payment_count', sa.Integer(), nullable=False),
+    sa.Column('invoice_count', sa.Integer(), nullable=False),
+    sa.Column('movement_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_index('ix_archive_partitions_id', 'archive_partitions', ['id'], unique=False, if_not_exists=True)
+
+    _create_table('guests',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('first_name', sa.String(length=50), nullable=False),
+    sa.Column('last_name', sa.String(length=50), nullable=False),
+    sa.Column('id_type', sa.String(length=20), nullable=False),
+    sa.Column('id_number', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=True),
+    sa.Column('phone', sa.String(length=20), nullable=False),
+    sa.Column('phone_alternative', sa.String(length=20), nullable=True),
+    sa.Column('address', sa.Text(), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('state', sa.String(length=100), nullable=True),
+    sa.Column('country', sa.String(length=100), nullable=False),
+    sa.Column('date_of_birth', sa.Date(), nullable=True),
+    sa.Column('nationality', sa.String(length=50), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_guests_email', 'guests', ['email'], unique=False, if_not_exists=True)
+    op.create_index('ix_guests_id', 'guests', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_guests_id_number', 'guests', ['id_number'], unique=True, if_not_exists=True)
+
+    _create_table('inventory',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('item_code', sa.String(length=50), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('category', sa.Enum('CLEANING', 'MAINTENANCE', 'BEDDING', 'BATHROOM', 'KITCHEN', 'ELECTRONICS', 'FURNITURE', 'FOOD_BEVERAGE', 'OTHER', name='inventorycategory'), nullable=False),
+    sa.Column('unit_of_measure', sa.String(length=20), nullable=False),
+    sa.Column('current_quantity', sa.Integer(), nullable=False),
+    sa.Column('minimum_quantity', sa.Integer(), nullable=False),
+    sa.Column('maximum_quantity', sa.Integer(), nullable=True),
+    sa.Column('unit_cost', sa.Float(), nullable=False),
+    sa.Column('currency', sa.String(length=3), nullable=False),
+    sa.Column('supplier_name', sa.String(length=200), nullable=True),
+    sa.Column('supplier_contact', sa.String(length=100), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('storage_location', sa.String(length=100), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_restock_date', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_inventory_id', 'inventory', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_inventory_item_code', 'inventory', ['item_code'], unique=True, if_not_exists=True)
+
+    _create_table('room_types',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('capacity', sa.Integer(), nullable=False),
+    sa.Column('base_price_ves', sa.Float(), nullable=False),
+    sa.Column('base_price_usd', sa.Float(), nullable=False),
+    sa.Column('base_price_eur', sa.Float(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_index('ix_room_types_id', 'room_types', ['id'], unique=False, if_not_exists=True)
+
+    _create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(length=50), nullable=False),
+    sa.Column('email', sa.String(length=100), nullable=False),
+    sa.Column('full_name', sa.String(length=100), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('role', sa.Enum('ADMIN', 'MANAGER', 'RECEPTIONIST', 'MAINTENANCE', 'INVENTORY', 'VIEWER', name='userrole'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_superuser', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_login', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_users_email', 'users', ['email'], unique=True, if_not_exists=True)
+    op.create_index('ix_users_id', 'users', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True, if_not_exists=True)
+
+    _create_table('exchange_rates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('currency', sa.String(length=3), nullable=False),
+    sa.Column('rate_date', sa.Date(), nullable=False),
+    sa.Column('rate', sa.Float(), nullable=False),
+    sa.Column('source', sa.String(length=100), nullable=True),
+    sa.Column('created_by', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('currency', 'rate_date', name='uq_exchange_rate_currency_date')
+    )
+    op.create_index('ix_exchange_rates_id', 'exchange_rates', ['id'], unique=False, if_not_exists=True)
+
+    _create_table('guest_stats',
+    sa.Column('guest_id', sa.Integer(), nullable=False),
+    sa.Column('reservation_count', sa.Integer(), nullable=False),
+    sa.Column('stay_count', sa.Integer(), nullable=False),
+    sa.Column('cancelled_count', sa.Integer(), nullable=False),
+    sa.Column('total_nights', sa.Integer(), nullable=False),
+    sa.Column('total_spent', sa.JSON(), nullable=False),
+    sa.Column('first_stay_date', sa.Date(), nullable=True),
+    sa.Column('last_stay_date', sa.Date(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['guest_id'], ['guests.id'], ),
+    sa.PrimaryKeyConstraint('guest_id')
+    )
+    op.create_index('ix_guest_stats_last_stay_date', 'guest_stats', ['last_stay_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_guest_stats_total_nights', 'guest_stats', ['total_nights'], unique=False, if_not_exists=True)
+
+    _create_table('inventory_movements',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('movement_code', sa.String(length=20), nullable=False),
+    sa.Column('inventory_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('movement_type', sa.Enum('IN', 'OUT', 'ADJUSTMENT', 'TRANSFER', name='movementtype'), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('previous_quantity', sa.Integer(), nullable=False),
+    sa.Column('new_quantity', sa.Integer(), nullable=False),
+    sa.Column('reason', sa.String(length=200), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('reference_document', sa.String(length=100), nullable=True),
+    sa.Column('movement_date', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['inventory_id'], ['inventory.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_inventory_movements_id', 'inventory_movements', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_inventory_movements_item_date', 'inventory_movements', ['inventory_id', 'movement_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_inventory_movements_movement_code', 'inventory_movements', ['movement_code'], unique=True, if_not_exists=True)
+
+    _create_table('inventory_snapshots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('inventory_id', sa.Integer(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('cutoff_at', sa.DateTime(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('unit_cost', sa.Float(), nullable=False),
+    sa.Column('currency', sa.String(length=3), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['inventory_id'], ['inventory.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('inventory_id', 'snapshot_date', name='uq_inventory_snapshot_item_date')
+    )
+    op.create_index('ix_inventory_snapshots_id', 'inventory_snapshots', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_inventory_snapshots_inventory_id', 'inventory_snapshots', ['inventory_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_inventory_snapshots_snapshot_date', 'inventory_snapshots', ['snapshot_date'], unique=False, if_not_exists=True)
+
+    _create_table('pricing_rules',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('rule_type', sa.Enum('SEASON', 'DAY_OF_WEEK', 'LENGTH_OF_STAY', 'OCCUPANCY', name='pricingruletype'), nullable=False),
+    sa.Column('room_type_id', sa.Integer(), nullable=True),
+    sa.Column('start_date', sa.Date(), nullable=True),
+    sa.Column('end_date', sa.Date(), nullable=True),
+    sa.Column('days_of_week', sa.String(length=20), nullable=True),
+    sa.Column('min_nights', sa.Integer(), nullable=True),
+    sa.Column('min_occupancy', sa.Float(), nullable=True),
+    sa.Column('adjustment_percent', sa.Float(), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['room_type_id'], ['room_types.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_pricing_rules_id', 'pricing_rules', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_pricing_rules_room_type_id', 'pricing_rules', ['room_type_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_pricing_rules_rule_type', 'pricing_rules', ['rule_type'], unique=False, if_not_exists=True)
+
+    _create_table('room_rates',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('room_type_id', sa.Integer(), nullable=False),
+    sa.Column('rate_date', sa.Date(), nullable=False),
+    sa.Column('currency', sa.String(length=3), nullable=False),
+    sa.Column('price', sa.Float(), nullable=False),
+    sa.Column('adjustment_percent', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['room_type_id'], ['room_types.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('room_type_id', 'rate_date', 'currency', name='uq_room_rate_type_date_currency')
+    )
+    op.create_index('ix_room_rates_id', 'room_rates', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_room_rates_rate_date', 'room_rates', ['rate_date'], unique=False, if_not_exists=True)
+
+    _create_table('room_type_amenities',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('room_type_id', sa.Integer(), nullable=False),
+    sa.Column('amenity_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['amenity_id'], ['amenities.id'], ),
+    sa.ForeignKeyConstraint(['room_type_id'], ['room_types.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_room_type_amenities_id', 'room_type_amenities', ['id'], unique=False, if_not_exists=True)
+
+    _create_table('rooms',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('room_number', sa.String(length=10), nullable=False),
+    sa.Column('floor', sa.Integer(), nullable=False),
+    sa.Column('room_type_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('AVAILABLE', 'OCCUPIED', 'CLEANING', 'MAINTENANCE', 'OUT_OF_SERVICE', name='roomstatus'), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['room_type_id'], ['room_types.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_rooms_id', 'rooms', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_rooms_room_number', 'rooms', ['room_number'], unique=True, if_not_exists=True)
+
+    _create_table('maintenance',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('maintenance_code', sa.String(length=20), nullable=False),
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('reported_by', sa.Integer(), nullable=False),
+    sa.Column('assigned_to', sa.Integer(), nullable=True),
+    sa.Column('title', sa.String(length=200), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.Column('maintenance_type', sa.Enum('PREVENTIVE', 'CORRECTIVE', 'EMERGENCY', name='maintenancetype'), nullable=False),
+    sa.Column('priority', sa.Enum('LOW', 'MEDIUM', 'HIGH', 'URGENT', name='maintenancepriority'), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='maintenancestatus'), nullable=False),
+    sa.Column('scheduled_date', sa.Date(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('estimated_cost', sa.Float(), nullable=True),
+    sa.Column('actual_cost', sa.Float(), nullable=True),
+    sa.Column('currency', sa.String(length=3), nullable=False),
+    sa.Column('resolution_notes', sa.Text(), nullable=True),
+    sa.Column('materials_used', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['assigned_to'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['reported_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_maintenance_id', 'maintenance', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_maintenance_maintenance_code', 'maintenance', ['maintenance_code'], unique=True, if_not_exists=True)
+
+    _create_table('reservations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('confirmation_code', sa.String(length=20), nullable=False),
+    sa.Column('guest_id', sa.Integer(), nullable=False),
+    sa.Column('room_id', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('check_in_date', sa.Date(), nullable=False),
+    sa.Column('check_out_date', sa.Date(), nullable=False),
+    sa.Column('actual_check_in', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('actual_check_out', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('num_adults', sa.Integer(), nullable=False),
+    sa.Column('num_children', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'CONFIRMED', 'CHECKED_IN', 'CHECKED_OUT', 'CANCELLED', 'NO_SHOW', name='reservationstatus'), nullable=False),
+    sa.Column('currency', sa.String(length=3), nullable=False),
+    sa.Column('price_per_night', sa.Float(), nullable=False),
+    sa.Column('total_nights', sa.Integer(), nullable=False),
+    sa.Column('subtotal', sa.Float(), nullable=False),
+    sa.Column('tax_percentage', sa.Float(), nullable=False),
+    sa.Column('tax_amount', sa.Float(), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=False),
+    sa.Column('paid_amount', sa.Float(), nullable=False),
+    sa.Column('balance', sa.Float(), nullable=False),
+    sa.Column('is_paid', sa.Boolean(), nullable=True),
+    sa.Column('special_requests', sa.Text(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('cancellation_reason', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['guest_id'], ['guests.id'], ),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_reservations_check_in_date', 'reservations', ['check_in_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_reservations_check_out_date', 'reservations', ['check_out_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_reservations_confirmation_code', 'reservations', ['confirmation_code'], unique=True, if_not_exists=True)
+    op.create_index('ix_reservations_id', 'reservations', ['id'], unique=False, if_not_exists=True)
+
+    _create_table('invoices',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('invoice_number', sa.String(length=30), nullable=False),
+    sa.Column('reservation_id', sa.Integer(), nullable=True),
+    sa.Column('guest_id', sa.Integer(), nullable=False),
+    sa.Column('created_by', sa.Integer(), nullable=False),
+    sa.Column('guest_document_type', sa.Enum('V', 'E', 'J', 'G', 'P', name='documenttype'), nullable=False),
+    sa.Column('guest_document_number', sa.String(length=20), nullable=False),
+    sa.Column('guest_name', sa.String(length=200), nullable=False),
+    sa.Column('guest_address', sa.Text(), nullable=True),
+    sa.Column('guest_phone', sa.String(length=30), nullable=True),
+    sa.Column('guest_email', sa.String(length=100), nullable=True),
+    sa.Column('currency', sa.String(length=3), nullable=False),
+    sa.Column('subtotal', sa.Float(), nullable=False),
+    sa.Column('tax_percentage', sa.Float(), nullable=False),
+    sa.Column('tax_amount', sa.Float(), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=False),
+    sa.Column('paid_amount', sa.Float(), nullable=False),
+    sa.Column('balance', sa.Float(), nullable=False),
+    sa.Column('status', sa.Enum('DRAFT', 'ISSUED', 'PAID', 'CANCELLED', 'VOID', name='invoicestatus'), nullable=False),
+    sa.Column('issue_date', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['guest_id'], ['guests.id'], ),
+    sa.ForeignKeyConstraint(['reservation_id'], ['reservations.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_invoices_id', 'invoices', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_invoices_invoice_number', 'invoices', ['invoice_number'], unique=True, if_not_exists=True)
+
+    _create_table('payments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('payment_code', sa.String(length=20), nullable=False),
+    sa.Column('reservation_id', sa.Integer(), nullable=False),
+    sa.Column('processed_by', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('currency', sa.String(length=3), nullable=False),
+    sa.Column('payment_method', sa.Enum('CASH_VES', 'CASH_USD', 'CASH_EUR', 'TRANSFER', 'MOBILE_PAYMENT', 'CREDIT_CARD', 'DEBIT_CARD', 'OTHER', name='paymentmethod'), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'COMPLETED', 'FAILED', 'REFUNDED', name='paymentstatus'), nullable=False),
+    sa.Column('reference_number', sa.String(length=100), nullable=True),
+    sa.Column('bank_name', sa.String(length=100), nullable=True),
+    sa.Column('account_number', sa.String(length=50), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('payment_date', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['processed_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['reservation_id'], ['reservations.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_payments_currency', 'payments', ['currency'], unique=False, if_not_exists=True)
+    op.create_index('ix_payments_id', 'payments', ['id'], unique=False, if_not_exists=True)
+    op.create_index('ix_payments_payment_code', 'payments', ['payment_code'], unique=True, if_not_exists=True)
+    op.create_index('ix_payments_payment_date', 'payments', ['payment_date'], unique=False, if_not_exists=True)
+    op.create_index('ix_payments_payment_method', 'payments', ['payment_method'], unique=False, if_not_exists=True)
+    op.create_index('ix_payments_reservation_id', 'payments', ['reservation_id'], unique=False, if_not_exists=True)
+
+    _create_table('invoice_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('invoice_id', sa.Integer(), nullable=False),
+    sa.Column('description', sa.String(length=500), nullable=False),
+    sa.Column('quantity', sa.Float(), nullable=False),
+    sa.Column('unit_price', sa.Float(), nullable=False),
+    sa.Column('subtotal', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['invoice_id'], ['invoices.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_invoice_items_id', 'invoice_items', ['id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_table('invoice_items')
+    op.drop_table('payments')
+    op.drop_table('invoices')
+    op.drop_table('reservations')
+    op.drop_table('maintenance')
+    op.drop_table('rooms')
+    op.drop_table('room_type_amenities')
+    op.drop_table('room_rates')
+    op.drop_table('pricing_rules')
+    op.drop_table('inventory_snapshots')
+    op.drop_table('inventory_movements')
+    op.drop_table('guest_stats')
+    op.drop_table('exchange_rates')
+    op.drop_table('users')
+    op.drop_table('room_types')
+    op.drop_table('inventory')
+    op.drop_table('guests')
+    op.drop_table('archive_partitions')
+    op.drop_table('amenities')
+
+    # drop_table no elimina los tipos enum de PostgreSQL
+    if op.get_bind().dialect.name == 'postgresql':
+        for enum_type in ENUM_TYPES:
+            op.execute(f'DROP TYPE IF EXISTS {enum_type}')
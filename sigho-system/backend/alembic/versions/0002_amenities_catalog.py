@@ -0,0 +1,109 @@
+"""Catálogo de amenidades y eliminación de los campos booleanos de room_types
+
+Reemplaza a scripts/migrate_amenities.py con sentencias por conjunto: el
+catálogo se inserta en un solo executemany y cada campo has_* se convierte
+en asociaciones con un INSERT ... SELECT, sin recorrer los tipos de
+habitación fila por fila. Luego elimina las columnas has_* en modo batch
+(SQLite recrea la tabla). En bases nuevas las columnas no existen y solo se
+carga el catálogo.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Las categorías se guardan con el nombre del enum AmenityCategory
+INITIAL_AMENITIES = [
+    {"name": "WiFi", "description": "Internet inalámbrico de alta velocidad", "category": "BASIC", "icon": "wifi"},
+    {"name": "TV", "description": "Televisión por cable", "category": "BASIC", "icon": "tv"},
+    {"name": "Aire Acondicionado", "description": "Climatización", "category": "BASIC", "icon": "ac"},
+    {"name": "Minibar", "description": "Frigobar con bebidas", "category": "PREMIUM", "icon": "minibar"},
+    {"name": "Balcón", "description": "Balcón privado", "category": "PREMIUM", "icon": "balcony"},
+    {"name": "Cocina", "description": "Cocineta equipada", "category": "PREMIUM", "icon": "kitchen"},
+    {"name": "Caja Fuerte", "description": "Caja de seguridad", "category": "BASIC", "icon": "safe"},
+    {"name": "Servicio de Habitación", "description": "Room service 24/7", "category": "PREMIUM", "icon": "room-service"},
+    {"name": "Vista al Mar", "description": "Vista panorámica al mar", "category": "LUXURY", "icon": "ocean-view"},
+    {"name": "Jacuzzi", "description": "Jacuzzi privado", "category": "LUXURY", "icon": "jacuzzi"},
+]
+
+# Campos booleanos antiguos de room_types y su amenidad
+LEGACY_COLUMNS = {
+    "has_wifi": "WiFi",
+    "has_tv": "TV",
+    "has_ac": "Aire Acondicionado",
+    "has_minibar": "Minibar",
+    "has_balcony": "Balcón",
+    "has_kitchen": "Cocina",
+}
+
+INSERT_AMENITY_SQL = sa.text("""
+    INSERT INTO amenities (name, description, category, icon, is_active)
+    SELECT :name, :description, :category, :icon, TRUE
+    WHERE NOT EXISTS (SELECT 1 FROM amenities WHERE name = :name)
+""")
+
+# {column} es siempre una clave de LEGACY_COLUMNS
+LINK_AMENITY_SQL = """
+    INSERT INTO room_type_amenities (room_type_id, amenity_id)
+    SELECT rt.id, a.id
+    FROM room_types rt
+    JOIN amenities a ON a.name = :amenity
+    WHERE rt.{column} = TRUE
+      AND NOT EXISTS (
+          SELECT 1 FROM room_type_amenities rta
+          WHERE rta.room_type_id = rt.id AND rta.amenity_id = a.id
+      )
+"""
+
+RESTORE_COLUMN_SQL = """
+    UPDATE room_types SET {column} = EXISTS (
+        SELECT 1
+        FROM room_type_amenities rta
+        JOIN amenities a ON a.id = rta.amenity_id
+        WHERE rta.room_type_id = room_types.id AND a.name = :amenity
+    )
+"""
+
+
+def _legacy_columns():
+    """Campos has_* que aún existen en room_types"""
+    existing = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("room_types")}
+    return [column for column in LEGACY_COLUMNS if column in existing]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    bind.execute(INSERT_AMENITY_SQL, INITIAL_AMENITIES)
+
+    columns = _legacy_columns()
+    for column in columns:
+        bind.execute(sa.text(LINK_AMENITY_SQL.format(column=column)), {"amenity": LEGACY_COLUMNS[column]})
+
+    if columns:
+        with op.batch_alter_table('room_types', schema=None) as batch_op:
+            for column in columns:
+                batch_op.drop_column(column)
+
+
+def downgrade() -> None:
+    # El catálogo y las asociaciones se conservan; solo se restauran los campos
+    with op.batch_alter_table('room_types', schema=None) as batch_op:
+        for column in LEGACY_COLUMNS:
+            batch_op.add_column(sa.Column(column, sa.Boolean(), server_default=sa.false(), nullable=True))
+
+    bind = op.get_bind()
+    for column, amenity in LEGACY_COLUMNS.items():
+        bind.execute(sa.text(RESTORE_COLUMN_SQL.format(column=column)), {"amenity": amenity})
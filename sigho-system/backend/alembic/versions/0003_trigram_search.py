@@ -0,0 +1,71 @@
+"""Índices de trigramas para la búsqueda de texto (solo PostgreSQL)
+
+En PostgreSQL instala la extensión pg_trgm y crea índices GIN sobre las
+columnas de las búsquedas de huéspedes y reservas, de modo que
+ILIKE '%texto%' se resuelva con el índice en lugar de recorrer la tabla.
+En SQLite no hace nada. Si el servidor no ofrece pg_trgm (paquete
+contrib de PostgreSQL) la migración se completa sin índices y la búsqueda
+funciona igual, recorriendo la tabla.
+
+Los índices no se declaran en los modelos: alembic/env.py los excluye de
+la comparación de autogenerate.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 18:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Nombre del índice -> (tabla, columna); el sufijo _trgm lo excluye de autogenerate
+TRIGRAM_INDEXES = {
+    "ix_guests_first_name_trgm": ("guests", "first_name"),
+    "ix_guests_last_name_trgm": ("guests", "last_name"),
+    "ix_guests_id_number_trgm": ("guests", "id_number"),
+    "ix_guests_email_trgm": ("guests", "email"),
+    "ix_guests_phone_trgm": ("guests", "phone"),
+    "ix_reservations_confirmation_code_trgm": ("reservations", "confirmation_code"),
+}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Con --sql no hay conexión para consultar: se asume que pg_trgm está disponible
+    if not context.is_offline_mode():
+        available = bind.execute(
+            sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        ).first()
+        if available is None:
+            print("[INFO] pg_trgm no está disponible: la búsqueda de texto funcionará sin índices de trigramas")
+            return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        op.create_index(
+            name, table, [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # La extensión se conserva: otras bases del servidor pueden usarla
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,195 @@
+"""
+Especificación genérica de consultas para endpoints de listado
+
+Permite a los clientes pedir solo las columnas que necesitan, ordenar y
+filtrar en el servidor. Todos los nombres se validan contra las columnas
+del modelo y se compilan a SQL:
+
+    ?fields=id,confirmation_code,status
+    ?sort=-check_in_date,id
+    ?total_amount__gte=100&status__in=confirmed,checked_in
+"""
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+import enum
+
+from fastapi import HTTPException, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Boolean, Date, DateTime, Enum, Float, Integer, inspect
+from sqlalchemy.orm import Query as ORMQuery
+
+
+# Operadores de filtro soportados: sufijo del parámetro -> constructor SQL
+FILTER_OPERATORS = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "in": lambda column, value: column.in_(value),
+    "contains": lambda column, value: column.icontains(value, autoescape=True),
+    "startswith": lambda column, value: column.istartswith(value, autoescape=True),
+    "isnull": lambda column, value: column.is_(None) if value else column.isnot(None),
+}
+
+
+class QuerySpec:
+    """Proyección, orden y filtros solicitados por el cliente"""
+
+    def __init__(
+        self,
+        fields: Optional[List[str]] = None,
+        sort: Optional[List[Tuple[str, bool]]] = None,
+        filters: Optional[List[Tuple[str, str, str]]] = None
+    ):
+        """
+        Args:
+            fields: Columnas a devolver (None = respuesta completa)
+            sort: Lista de (columna, descendente)
+            filters: Lista de (columna, operador, valor en texto)
+        """
+        self.fields = fields
+        self.sort = sort or []
+        self.filters = filters or []
+
+    @property
+    def is_projected(self) -> bool:
+        """Indica si el cliente pidió un subconjunto de columnas"""
+        return bool(self.fields)
+
+    def apply(self, query: ORMQuery, model, allowed: Optional[set] = None) -> ORMQuery:
+        """
+        Aplica filtros y orden a la consulta validando contra las columnas del modelo
+
+        Args:
+            query: Consulta base (con los filtros propios del endpoint ya aplicados)
+            model: Modelo SQLAlchemy consultado
+            allowed: Columnas permitidas (por defecto todas las del modelo)
+        """
+        columns = _model_columns(model, allowed)
+
+        for field, operator, raw_value in self.filters:
+            column = _get_column(columns, field)
+            value = _coerce_value(column, operator, raw_value)
+            query = query.filter(FILTER_OPERATORS[operator](column, value))
+
+        for field, descending in self.sort:
+            column = _get_column(columns, field)
+            query = query.order_by(column.desc() if descending else column.asc())
+
+        return query
+
+    def project(self, query: ORMQuery, model, allowed: Optional[set] = None) -> ORJSONResponse:
+        """
+        Ejecuta la consulta devolviendo solo las columnas pedidas.
+        La clave primaria se incluye siempre para que el cliente pueda identificar las filas.
+        """
+        columns = _model_columns(model, allowed)
+
+        names = ["id"] + [name for name in self.fields if name != "id"]
+        selected = [_get_column(columns, name) for name in names]
+
+        rows = query.with_entities(*selected).all()
+        return ORJSONResponse(
+            content=jsonable_encoder([dict(zip(names, row)) for row in rows])
+        )
+
+
+def _model_columns(model, allowed: Optional[set] = None) -> Dict[str, Any]:
+    """Obtiene las columnas del modelo, opcionalmente restringidas"""
+    columns = {column.key: getattr(model, column.key) for column in inspect(model).column_attrs}
+    if allowed is not None:
+        columns = {name: column for name, column in columns.items() if name in allowed}
+    return columns
+
+
+def _get_column(columns: Dict[str, Any], field: str):
+    """Obtiene una columna o lanza 400 si no existe"""
+    column = columns.get(field)
+    if column is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Campo no válido: {field}"
+        )
+    return column
+
+
+def _coerce_value(column, operator: str, raw_value: str) -> Any:
+    """Convierte el valor recibido al tipo de la columna"""
+    if operator == "isnull":
+        return raw_value.lower() in ("1", "true", "yes", "si")
+
+    if operator == "in":
+        return [_coerce_scalar(column, value) for value in raw_value.split(",") if value]
+
+    if operator in ("contains", "startswith"):
+        return raw_value
+
+    return _coerce_scalar(column, raw_value)
+
+
+def _coerce_scalar(column, raw_value: str) -> Any:
+    """Convierte un valor individual según el tipo SQL de la columna"""
+    column_type = column.type
+    try:
+        if isinstance(column_type, Enum) and column_type.enum_class is not None:
+            enum_class = column_type.enum_class
+            if issubclass(enum_class, enum.Enum):
+                return enum_class(raw_value)
+        if isinstance(column_type, Boolean):
+            return raw_value.lower() in ("1", "true", "yes", "si")
+        if isinstance(column_type, Integer):
+            return int(raw_value)
+        if isinstance(column_type, Float):
+            return float(raw_value)
+        if isinstance(column_type, DateTime):
+            return datetime.fromisoformat(raw_value)
+        if isinstance(column_type, Date):
+            return date.fromisoformat(raw_value)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Valor no válido para {column.key}: {raw_value}"
+        )
+    return raw_value
+
+
+def get_query_spec(
+    request: Request,
+    fields: Optional[str] = Query(None, description="Columnas a devolver, separadas por coma"),
+    sort: Optional[str] = Query(None, description="Columnas de orden; prefijo '-' para descendente")
+) -> QuerySpec:
+    """
+    Dependency que construye la especificación de consulta desde los query params.
+    Los filtros se expresan como `campo__operador=valor`.
+    """
+    field_list = None
+    if fields:
+        field_list = [name.strip() for name in fields.split(",") if name.strip()]
+
+    sort_list = []
+    if sort:
+        for name in sort.split(","):
+            name = name.strip()
+            if not name:
+                continue
+            if name.startswith("-"):
+                sort_list.append((name[1:], True))
+            else:
+                sort_list.append((name.lstrip("+"), False))
+
+    filters = []
+    for key, value in request.query_params.multi_items():
+        if "__" not in key:
+            continue
+        field, operator = key.rsplit("__", 1)
+        if operator not in FILTER_OPERATORS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Operador de filtro no válido: {operator}"
+            )
+        filters.append((field, operator, value))
+
+    return QuerySpec(fields=field_list, sort=sort_list, filters=filters)
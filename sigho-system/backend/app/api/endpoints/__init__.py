@@ -14,7 +14,11 @@ from . import (
     inventory,
     reports,
     dashboard,
-    invoices
+    invoices,
+    profiler,
+    pricing,
+    exchange_rates,
+    analytics
 )
 
 __all__ = [
@@ -30,5 +34,9 @@ __all__ = [
     "inventory",
     "reports",
     "dashboard",
-    "invoices"
+    "invoices",
+    "profiler",
+    "pricing",
+    "exchange_rates",
+    "analytics"
 ]
@@ -0,0 +1,72 @@
+"""
+Endpoints de Analítica (ocupación, ADR y RevPAR de varios años)
+"""
+import time
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Literal, Optional
+from datetime import date
+from app.schemas.analytics import AnalyticsStatus, OccupancyCube
+from app.models.user import User, UserRole
+from app.api.dependencies.auth import require_role
+from app.services.analytics_service import analytics_service, AnalyticsUnavailable
+from app.core.config import settings
+
+router = APIRouter()
+
+
+@router.get("/status", response_model=AnalyticsStatus)
+def get_analytics_status(
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    """
+    Indica si el motor analítico (DuckDB) está disponible
+    """
+    return analytics_service.status()
+
+
+@router.get("/occupancy", response_model=OccupancyCube)
+def get_occupancy_cube(
+    start_date: date,
+    end_date: date,
+    granularity: Literal["month", "quarter", "year"] = "month",
+    room_type_id: Optional[int] = None,
+    base_currency: Optional[str] = None,
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    """
+    Ocupación, ADR y RevPAR por período y tipo de habitación, con la
+    comparación contra el mismo período del año anterior
+    """
+    if end_date <= start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="La fecha final debe ser posterior a la inicial"
+        )
+    if (end_date - start_date).days > 366 * 10:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El rango máximo es de diez años"
+        )
+    base_currency = base_currency or settings.REPORTING_CURRENCY
+    if base_currency not in settings.currencies_list:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Moneda no soportada: {base_currency}"
+        )
+
+    started = time.perf_counter()
+    try:
+        rows = analytics_service.occupancy_cube(
+            start_date, end_date, granularity, room_type_id, base_currency
+        )
+    except AnalyticsUnavailable as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "granularity": granularity,
+        "base_currency": base_currency,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "rows": rows
+    }
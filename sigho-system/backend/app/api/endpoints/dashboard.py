@@ -1,9 +1,9 @@
 """
 Endpoints de Dashboard (Estadísticas y Métricas)
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import func, and_, or_, case
 from datetime import date, datetime, timedelta
 from typing import Dict, Any
 from app.database.session import get_db
@@ -15,12 +15,23 @@ from app.models.inventory import Inventory
 from app.models.guest import Guest
 from app.models.user import User
 from app.api.dependencies.auth import get_current_active_user
+from app.core.config import settings
+from app.services.exchange_rate_service import normalized_amount, missing_rate_count
+from app.services.occupancy_service import occupancy_service
 
 router = APIRouter()
 
 
+def normalized_payment_amount(base_currency: str):
+    """Monto del pago convertido a la moneda base con la tasa de su fecha"""
+    return normalized_amount(
+        Payment.amount, Payment.currency, func.date(Payment.payment_date), base_currency
+    )
+
+
 @router.get("/overview")
 def get_dashboard_overview(
+    base_currency: str = settings.REPORTING_CURRENCY,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
@@ -87,20 +98,19 @@ def get_dashboard_overview(
         Inventory.is_active == True
     ).count()
     
-    # Ingresos del mes actual
+    # Ingresos del mes actual y de hoy, todas las monedas normalizadas a la moneda base
     first_day_of_month = today.replace(day=1)
-    monthly_revenue = db.query(func.sum(Payment.amount)).filter(
-        Payment.status == PaymentStatus.COMPLETED,
-        Payment.payment_date >= first_day_of_month,
-        Payment.currency == "USD"  # Puedes ajustar esto
-    ).scalar() or 0
-    
-    # Ingresos de hoy
-    today_revenue = db.query(func.sum(Payment.amount)).filter(
+    amount = normalized_payment_amount(base_currency)
+    monthly_revenue, today_revenue, unconverted = db.query(
+        func.sum(amount),
+        func.sum(case((func.date(Payment.payment_date) == today, amount), else_=0)),
+        missing_rate_count(Payment.currency, func.date(Payment.payment_date), base_currency)
+    ).filter(
         Payment.status == PaymentStatus.COMPLETED,
-        func.date(Payment.payment_date) == today,
-        Payment.currency == "USD"
-    ).scalar() or 0
+        Payment.payment_date >= first_day_of_month
+    ).one()
+    monthly_revenue = monthly_revenue or 0
+    today_revenue = today_revenue or 0
     
     return {
         "rooms": {
@@ -125,8 +135,10 @@ def get_dashboard_overview(
             "low_stock_items": low_stock_items
         },
         "revenue": {
+            "currency": base_currency,
             "today": round(today_revenue, 2),
-            "monthly": round(monthly_revenue, 2)
+            "monthly": round(monthly_revenue, 2),
+            "unconverted_payments": unconverted or 0  # Pagos sin tasa de cambio para su fecha
         }
     }
 
@@ -145,18 +157,17 @@ def get_occupancy_rate(
     
     total_rooms = db.query(Room).filter(Room.is_active == True).count()
     
+    # Habitaciones ocupadas por noche, en una sola consulta
+    nightly = occupancy_service.nightly(
+        db, start_date, today + timedelta(days=1),
+        [ReservationStatus.CONFIRMED, ReservationStatus.CHECKED_IN]
+    )
+    
     occupancy_data = []
     
-    for i in range(days + 1):
+    for i, occupied in enumerate(nightly):
         current_date = start_date + timedelta(days=i)
         
-        # Contar habitaciones ocupadas en esa fecha
-        occupied = db.query(Reservation).filter(
-            Reservation.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.CHECKED_IN]),
-            Reservation.check_in_date <= current_date,
-            Reservation.check_out_date > current_date
-        ).count()
-        
         rate = (occupied / total_rooms * 100) if total_rooms > 0 else 0
         
         occupancy_data.append({
@@ -174,45 +185,49 @@ def get_occupancy_rate(
 
 @router.get("/revenue-by-period")
 def get_revenue_by_period(
-    days: int = 30,
+    days: int = Query(30, ge=1, le=366),
     currency: str = "USD",
+    normalize: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
     Obtiene los ingresos por período
+    
+    Con `normalize=true` suma los pagos de todas las monedas convertidos a
+    `currency` con la tasa de cada día; si no, solo los pagos en `currency`.
     """
     today = date.today()
     start_date = today - timedelta(days=days)
     
-    # Ingresos por día
-    daily_revenue = []
+    payment_day = func.date(Payment.payment_date)
+    amount = normalized_payment_amount(currency) if normalize else Payment.amount
+    query = db.query(payment_day, func.sum(amount)).filter(
+        Payment.status == PaymentStatus.COMPLETED,
+        Payment.payment_date >= start_date
+    )
+    if not normalize:
+        query = query.filter(Payment.currency == currency)
     
+    # Una consulta agrupada por día en lugar de una por día
+    revenue_by_day = {
+        str(day)[:10]: revenue or 0
+        for day, revenue in query.group_by(payment_day)
+    }
+    
+    daily_revenue = []
     for i in range(days + 1):
-        current_date = start_date + timedelta(days=i)
-        
-        revenue = db.query(func.sum(Payment.amount)).filter(
-            Payment.status == PaymentStatus.COMPLETED,
-            func.date(Payment.payment_date) == current_date,
-            Payment.currency == currency
-        ).scalar() or 0
-        
+        current_date = (start_date + timedelta(days=i)).isoformat()
         daily_revenue.append({
-            "date": current_date.isoformat(),
-            "revenue": round(revenue, 2)
+            "date": current_date,
+            "revenue": round(revenue_by_day.get(current_date, 0), 2)
         })
     
-    # Total del período
-    total_revenue = db.query(func.sum(Payment.amount)).filter(
-        Payment.status == PaymentStatus.COMPLETED,
-        Payment.payment_date >= start_date,
-        Payment.currency == currency
-    ).scalar() or 0
-    
     return {
         "period": f"Last {days} days",
         "currency": currency,
-        "total_revenue": round(total_revenue, 2),
+        "normalized": normalize,
+        "total_revenue": round(sum(revenue_by_day.values()), 2),
         "daily_data": daily_revenue
     }
 
@@ -342,12 +357,31 @@ def get_upcoming_events(
 
 @router.get("/statistics")
 def get_general_statistics(
+    base_currency: str = settings.REPORTING_CURRENCY,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
     Obtiene estadísticas generales del sistema
     """
+    # Ingresos por moneda y total normalizado, en una sola consulta
+    amount = normalized_payment_amount(base_currency)
+    total_usd, total_ves, total_normalized, unconverted = db.query(
+        func.sum(case((Payment.currency == "USD", Payment.amount), else_=0)),
+        func.sum(case((Payment.currency == "VES", Payment.amount), else_=0)),
+        func.sum(amount),
+        missing_rate_count(Payment.currency, func.date(Payment.payment_date), base_currency)
+    ).filter(
+        Payment.status == PaymentStatus.COMPLETED
+    ).one()
+    revenue_totals = {
+        "total_revenue_usd": round(total_usd or 0, 2),
+        "total_revenue_ves": round(total_ves or 0, 2),
+        "total_revenue": round(total_normalized or 0, 2),
+        "revenue_currency": base_currency,
+        "unconverted_payments": unconverted or 0
+    }
+    
     return {
         "total_rooms": db.query(Room).count(),
         "total_guests": db.query(Guest).count(),
@@ -357,18 +391,5 @@ def get_general_statistics(
         "completed_reservations": db.query(Reservation).filter(
             Reservation.status == ReservationStatus.CHECKED_OUT
         ).count(),
-        "total_revenue_usd": round(
-            db.query(func.sum(Payment.amount)).filter(
-                Payment.status == PaymentStatus.COMPLETED,
-                Payment.currency == "USD"
-            ).scalar() or 0,
-            2
-        ),
-        "total_revenue_ves": round(
-            db.query(func.sum(Payment.amount)).filter(
-                Payment.status == PaymentStatus.COMPLETED,
-                Payment.currency == "VES"
-            ).scalar() or 0,
-            2
-        )
+        **revenue_totals
     }
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+Endpoints de Tasas de Cambio
+"""
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+from app.database.session import get_db
+from app.core.config import settings
+from app.schemas.exchange_rate import ExchangeRateCreate, ExchangeRateResponse, CurrencyConversion
+from app.models.exchange_rate import ExchangeRate
+from app.models.user import User, UserRole
+from app.api.dependencies.auth import get_current_active_user, require_role
+from app.services.exchange_rate_service import exchange_rate_service
+
+router = APIRouter()
+
+
+def validate_currency(currency: str) -> str:
+    """Normaliza y valida un código de moneda configurado"""
+    currency = currency.upper()
+    if currency not in settings.currencies_list:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Moneda no válida. Opciones: {', '.join(settings.currencies_list)}"
+        )
+    return currency
+
+
+@router.get("/", response_model=List[ExchangeRateResponse])
+def get_exchange_rates(
+    currency: Optional[str] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    skip: int = 0,
+    limit: int = Query(100, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Obtiene el historial de tasas (más recientes primero)
+    """
+    query = db.query(ExchangeRate)
+    
+    if currency:
+        query = query.filter(ExchangeRate.currency == currency.upper())
+    if from_date:
+        query = query.filter(ExchangeRate.rate_date >= from_date)
+    if to_date:
+        query = query.filter(ExchangeRate.rate_date <= to_date)
+    
+    return query.order_by(
+        ExchangeRate.rate_date.desc(), ExchangeRate.currency
+    ).offset(skip).limit(limit).all()
+
+
+@router.get("/convert", response_model=CurrencyConversion)
+def convert_amount(
+    amount: float,
+    currency: str,
+    base_currency: str = settings.REPORTING_CURRENCY,
+    on_date: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Convierte un monto con las tasas vigentes en una fecha (por defecto hoy)
+    """
+    currency = validate_currency(currency)
+    base_currency = validate_currency(base_currency)
+    on_date = on_date or date.today()
+    
+    return {
+        "amount": amount,
+        "currency": currency,
+        "base_currency": base_currency,
+        "on_date": on_date,
+        "converted_amount": exchange_rate_service.convert(db, amount, currency, base_currency, on_date)
+    }
+
+
+@router.post("/", response_model=ExchangeRateResponse, status_code=status.HTTP_201_CREATED)
+def set_exchange_rate(
+    rate_in: ExchangeRateCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    """
+    Registra la tasa de una moneda para una fecha (reemplaza la existente)
+    """
+    currency = validate_currency(rate_in.currency)
+    if currency == settings.EXCHANGE_PIVOT_CURRENCY:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{currency} es la moneda pivote; su tasa siempre es 1"
+        )
+    
+    rate = db.query(ExchangeRate).filter(
+        ExchangeRate.currency == currency,
+        ExchangeRate.rate_date == rate_in.rate_date
+    ).first()
+    
+    if rate:
+        rate.rate = rate_in.rate
+        rate.source = rate_in.source
+    else:
+        rate = ExchangeRate(
+            currency=currency,
+            rate_date=rate_in.rate_date,
+            rate=rate_in.rate,
+            source=rate_in.source,
+            created_by=current_user.id
+        )
+        db.add(rate)
+    
+    db.commit()
+    db.refresh(rate)
+    
+    return rate
+
+
+@router.delete("/{rate_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_exchange_rate(
+    rate_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN]))
+):
+    """
+    Elimina una tasa de cambio
+    """
+    rate = db.query(ExchangeRate).filter(ExchangeRate.id == rate_id).first()
+    if not rate:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tasa de cambio no encontrada"
+        )
+    
+    db.delete(rate)
+    db.commit()
+    
+    return None
@@ -3,11 +3,15 @@ Endpoints de Huéspedes
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from typing import List, Optional
 from app.database.session import get_db
-from app.schemas.guest import GuestCreate, GuestUpdate, GuestResponse, GuestSearch
+from app.database.dialect import similarity_rank, text_search
+from app.schemas.guest import GuestCreate, GuestUpdate, GuestResponse, GuestSearch, GuestStatsResponse
 from app.models.guest import Guest
+from app.models.guest_stats import GuestStats
+from app.services.guest_stats_service import guest_stats_service
+from app.services.archive_service import archive_service
+from app.models.reservation import Reservation
 from app.models.user import User, UserRole
 from app.api.dependencies.auth import get_current_active_user, require_role
 
@@ -44,18 +48,16 @@ def search_guests(
 ):
     """
     Busca huéspedes por nombre, documento, email o teléfono
+    (en PostgreSQL con pg_trgm, ordenados por similitud)
     """
-    guests = db.query(Guest).filter(
-        or_(
-            Guest.first_name.ilike(f"%{query}%"),
-            Guest.last_name.ilike(f"%{query}%"),
-            Guest.id_number.ilike(f"%{query}%"),
-            Guest.email.ilike(f"%{query}%"),
-            Guest.phone.ilike(f"%{query}%")
-        )
-    ).all()
+    columns = [Guest.first_name, Guest.last_name, Guest.id_number, Guest.email, Guest.phone]
+    search = db.query(Guest).filter(text_search(columns, query))
     
-    return guests
+    rank = similarity_rank(db, columns, query)
+    if rank is not None:
+        search = search.order_by(rank.desc(), Guest.id)
+    
+    return search.all()
 
 
 @router.get("/{guest_id}", response_model=GuestResponse)
@@ -76,6 +78,25 @@ def get_guest(
     return guest
 
 
+@router.get("/{guest_id}/stats", response_model=GuestStatsResponse)
+def get_guest_stats(
+    guest_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Obtiene las estadísticas acumuladas de un huésped
+    (reservas, noches, gasto por moneda y última estadía)
+    """
+    exists = db.query(Guest.id).filter(Guest.id == guest_id).first()
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Huésped no encontrado"
+        )
+    return guest_stats_service.get(db, guest_id)
+
+
 @router.get("/by-document/{id_number}", response_model=GuestResponse)
 def get_guest_by_document(
     id_number: str,
@@ -175,7 +196,7 @@ def delete_guest(
     current_user: User = Depends(require_role([UserRole.ADMIN]))
 ):
     """
-    Elimina un huésped (solo si no tiene reservas)
+    Elimina un huésped (solo si no tiene reservas, activas ni archivadas)
     """
     guest = db.query(Guest).filter(Guest.id == guest_id).first()
     if not guest:
@@ -184,13 +205,15 @@ def delete_guest(
             detail="Huésped no encontrado"
         )
     
-    # Verificar que no tenga reservas
-    if guest.reservations:
+    # Verificar que no tenga reservas (las archivadas siguen en reportes y estadísticas)
+    reservation_count = len(guest.reservations) + archive_service.archived_count(db, Reservation, guest_id=guest_id)
+    if reservation_count:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"No se puede eliminar. El huésped tiene {len(guest.reservations)} reserva(s) registrada(s)"
+            detail=f"No se puede eliminar. El huésped tiene {reservation_count} reserva(s) registrada(s)"
         )
     
+    db.query(GuestStats).filter(GuestStats.guest_id == guest_id).delete(synchronize_session=False)
     db.delete(guest)
     db.commit()
     
@@ -1,7 +1,7 @@
 """
 Endpoints de Inventario
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -14,12 +14,23 @@ from app.schemas.inventory import (
     InventoryResponse,
     InventoryMovementCreate,
     InventoryMovementResponse,
-    InventoryAdjustment
+    InventoryAdjustment,
+    InventoryMovementBatch,
+    InventoryBatchResponse,
+    InventoryForecast
 )
 from app.models.inventory import Inventory, InventoryCategory
 from app.models.inventory_movement import InventoryMovement, MovementType
 from app.models.user import User, UserRole
 from app.api.dependencies.auth import get_current_active_user, require_role
+from app.services.inventory_service import (
+    inventory_service,
+    generate_movement_code,
+    StockError,
+    ItemNotFoundError,
+    StockConflictError
+)
+from app.services.inventory_forecast_service import inventory_forecast_service
 
 router = APIRouter()
 
@@ -29,11 +40,6 @@ def generate_item_code() -> str:
     return 'ITM-' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
 
 
-def generate_movement_code() -> str:
-    """Genera un código de movimiento único"""
-    return 'MOV-' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-
-
 # ========== INVENTORY ==========
 @router.get("/", response_model=List[InventoryResponse])
 def get_inventory_items(
@@ -81,6 +87,30 @@ def get_low_stock_items(
     return items
 
 
+@router.get("/forecast", response_model=List[InventoryForecast])
+def get_inventory_forecast(
+    category: Optional[InventoryCategory] = None,
+    lead_time_days: Optional[int] = Query(None, ge=1, le=180),
+    review_days: Optional[int] = Query(None, ge=1, le=365),
+    only_reorder: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER, UserRole.INVENTORY]))
+):
+    """
+    Pronóstico de consumo, días de cobertura y sugerencias de reposición
+
+    A diferencia de /low-stock (umbral manual), el punto de reorden se
+    calcula del consumo histórico y de la ocupación reservada.
+    """
+    return inventory_forecast_service.forecast(
+        db,
+        category=category,
+        lead_time_days=lead_time_days,
+        review_days=review_days,
+        only_reorder=only_reorder
+    )
+
+
 @router.get("/by-category/{category}", response_model=List[InventoryResponse])
 def get_items_by_category(
     category: InventoryCategory,
@@ -200,54 +230,24 @@ def adjust_inventory(
     """
     Ajusta la cantidad de un item de inventario
     """
-    item = db.query(Inventory).filter(Inventory.id == item_id).first()
-    if not item:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item de inventario no encontrado"
-        )
-    
-    previous_quantity = item.current_quantity
-    new_quantity = adjustment.new_quantity
-    
-    # Calcular la diferencia
-    difference = new_quantity - previous_quantity
-    
-    # Determinar tipo de movimiento
-    if difference > 0:
-        movement_type = MovementType.IN
-        quantity = difference
-        item.last_restock_date = datetime.utcnow()
-    elif difference < 0:
-        movement_type = MovementType.OUT
-        quantity = abs(difference)
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="La nueva cantidad es igual a la actual"
+    try:
+        # Compare-and-set sobre la existencia (ver inventory_service)
+        inventory_service.set_stock(
+            db,
+            inventory_id=item_id,
+            new_quantity=adjustment.new_quantity,
+            user_id=current_user.id,
+            reason=adjustment.reason,
+            notes=adjustment.notes
         )
+    except ItemNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except StockConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except StockError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    # Actualizar cantidad
-    item.current_quantity = new_quantity
-    
-    # Registrar movimiento
-    movement_code = generate_movement_code()
-    movement = InventoryMovement(
-        movement_code=movement_code,
-        inventory_id=item.id,
-        user_id=current_user.id,
-        movement_type=MovementType.ADJUSTMENT,
-        quantity=quantity,
-        previous_quantity=previous_quantity,
-        new_quantity=new_quantity,
-        reason=adjustment.reason,
-        notes=adjustment.notes
-    )
-    
-    db.add(movement)
-    db.commit()
-    db.refresh(item)
-    
+    item = db.query(Inventory).filter(Inventory.id == item_id).first()
     return item
 
 
@@ -333,55 +333,56 @@ def create_inventory_movement(
     """
     Registra un movimiento de inventario (entrada o salida)
     """
-    # Verificar que el item existe
-    item = db.query(Inventory).filter(Inventory.id == movement_in.inventory_id).first()
-    if not item:
+    if movement_in.movement_type not in (MovementType.IN, MovementType.OUT):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Item de inventario no encontrado"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use el endpoint de ajuste para movimientos de tipo ADJUSTMENT"
         )
     
-    previous_quantity = item.current_quantity
+    try:
+        # UPDATE condicional atómico + inserción del movimiento (ver inventory_service)
+        movement = inventory_service.move_stock(
+            db,
+            inventory_id=movement_in.inventory_id,
+            movement_type=movement_in.movement_type,
+            quantity=movement_in.quantity,
+            user_id=current_user.id,
+            reason=movement_in.reason,
+            notes=movement_in.notes,
+            reference_document=movement_in.reference_document
+        )
+    except ItemNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except StockError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    # Calcular nueva cantidad según el tipo de movimiento
-    if movement_in.movement_type == MovementType.IN:
-        new_quantity = previous_quantity + movement_in.quantity
-        item.last_restock_date = datetime.utcnow()
-    elif movement_in.movement_type == MovementType.OUT:
-        if previous_quantity < movement_in.quantity:
+    return movement
+
+
+@router.post("/movements/batch", response_model=InventoryBatchResponse)
+def create_inventory_movements_batch(
+    batch_in: InventoryMovementBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER, UserRole.INVENTORY]))
+):
+    """
+    Registra movimientos en lote (carga masiva, ej. importación CSV)
+
+    Las existencias se actualizan con operaciones por conjunto y los
+    movimientos se insertan con un único executemany. Retorna el resultado
+    de cada línea; con `atomic=true` una línea con error cancela el lote.
+    """
+    for number, line in enumerate(batch_in.movements, start=1):
+        if not line.inventory_id and not line.item_code:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Cantidad insuficiente. Disponible: {previous_quantity}"
+                detail=f"Línea {number}: indique inventory_id o item_code"
             )
-        new_quantity = previous_quantity - movement_in.quantity
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Use el endpoint de ajuste para movimientos de tipo ADJUSTMENT"
-        )
-    
-    # Actualizar cantidad en inventario
-    item.current_quantity = new_quantity
-    
-    # Generar código de movimiento
-    movement_code = generate_movement_code()
-    
-    # Crear movimiento
-    movement = InventoryMovement(
-        movement_code=movement_code,
-        inventory_id=movement_in.inventory_id,
+
+    return inventory_service.apply_batch(
+        db,
+        lines=batch_in.movements,
         user_id=current_user.id,
-        movement_type=movement_in.movement_type,
-        quantity=movement_in.quantity,
-        previous_quantity=previous_quantity,
-        new_quantity=new_quantity,
-        reason=movement_in.reason,
-        notes=movement_in.notes,
-        reference_document=movement_in.reference_document
+        default_reason=batch_in.reason,
+        atomic=batch_in.atomic
     )
-    
-    db.add(movement)
-    db.commit()
-    db.refresh(movement)
-    
-    return movement
\ No newline at end of file
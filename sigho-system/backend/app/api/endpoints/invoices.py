@@ -4,16 +4,18 @@ Endpoints de Facturación
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from typing import List, Optional
 from datetime import datetime, date, timedelta
 
 from app.database.session import get_db
+from app.database.dialect import lock_sequence
 from app.schemas.invoice import (
     InvoiceCreate,
     InvoiceUpdate,
     InvoiceResponse,
     InvoiceListResponse,
+    InvoiceSummary,
     InvoiceGenerateRequest,
     InvoiceAddItemRequest,
     InvoicePaymentRequest
@@ -24,7 +26,7 @@ from app.models.guest import Guest
 from app.models.payment import Payment, PaymentStatus
 from app.models.user import User, UserRole
 from app.api.dependencies.auth import get_current_active_user, require_role
-from app.services.pdf_service import pdf_service
+from app.api.dependencies.query_spec import QuerySpec, get_query_spec
 
 router = APIRouter()
 
@@ -34,6 +36,9 @@ def generate_invoice_number(db: Session) -> str:
     today = datetime.now()
     prefix = f"FAC-{today.strftime('%Y%m%d')}"
     
+    # Otro proceso no puede leer el mismo último número hasta el commit de esta factura
+    lock_sequence(db, Invoice.__tablename__)
+    
     # Buscar el último número del día
     last_invoice = db.query(Invoice).filter(
         Invoice.invoice_number.like(f"{prefix}%")
@@ -61,12 +66,15 @@ def get_invoices(
     currency: Optional[str] = None,
     from_date: Optional[date] = None,
     to_date: Optional[date] = None,
+    spec: QuerySpec = Depends(get_query_spec),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Obtiene la lista de facturas con filtros opcionales
+    Obtiene la lista de facturas con filtros opcionales.
+    Acepta `fields`, `sort` y filtros `campo__operador` (ver query_spec).
     """
+    allowed = set(InvoiceListResponse.model_fields)
     query = db.query(Invoice)
     
     if status:
@@ -84,10 +92,75 @@ def get_invoices(
     if to_date:
         query = query.filter(Invoice.created_at <= datetime.combine(to_date, datetime.max.time()))
     
-    invoices = query.order_by(desc(Invoice.created_at)).offset(skip).limit(limit).all()
+    query = spec.apply(query, Invoice, allowed)
+    if not spec.sort:
+        query = query.order_by(desc(Invoice.created_at))
+    
+    query = query.offset(skip).limit(limit)
+    if spec.is_projected:
+        return spec.project(query, Invoice, allowed)
+    
+    invoices = query.all()
     return invoices
 
 
+@router.get("/summary", response_model=InvoiceSummary)
+def get_invoices_summary(
+    guest_id: Optional[int] = None,
+    currency: Optional[str] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Obtiene conteos por estado y totales por moneda de las facturas
+    con una sola consulta agregada
+    """
+    query = db.query(
+        Invoice.status,
+        Invoice.currency,
+        func.count(Invoice.id),
+        func.coalesce(func.sum(Invoice.total_amount), 0.0),
+        func.coalesce(func.sum(Invoice.paid_amount), 0.0),
+        func.coalesce(func.sum(Invoice.balance), 0.0)
+    )
+    
+    if guest_id:
+        query = query.filter(Invoice.guest_id == guest_id)
+    
+    if currency:
+        query = query.filter(Invoice.currency == currency)
+    
+    if from_date:
+        query = query.filter(Invoice.created_at >= datetime.combine(from_date, datetime.min.time()))
+    
+    if to_date:
+        query = query.filter(Invoice.created_at <= datetime.combine(to_date, datetime.max.time()))
+    
+    summary = {
+        "total": 0,
+        "by_status": {invoice_status.value: 0 for invoice_status in InvoiceStatus},
+        "by_currency": {}
+    }
+    
+    for invoice_status, invoice_currency, count, total, paid, balance in query.group_by(
+        Invoice.status, Invoice.currency
+    ).all():
+        summary["total"] += count
+        summary["by_status"][invoice_status.value] += count
+        
+        totals = summary["by_currency"].setdefault(
+            invoice_currency, {"count": 0, "total_amount": 0.0, "paid_amount": 0.0, "balance": 0.0}
+        )
+        totals["count"] += count
+        totals["total_amount"] += total
+        totals["paid_amount"] += paid
+        totals["balance"] += balance
+    
+    return summary
+
+
 @router.get("/{invoice_id}", response_model=InvoiceResponse)
 def get_invoice(
     invoice_id: int,
@@ -572,6 +645,8 @@ def download_invoice_pdf(
         'notes': invoice.notes
     }
     
+    # ReportLab se carga con el primer PDF, no al arrancar el servidor
+    from app.services.pdf_service import pdf_service
     pdf_buffer = pdf_service.generate_invoice_pdf(invoice_data)
     
     return StreamingResponse(
@@ -624,6 +699,8 @@ def download_receipt_pdf(
         'guest_document_number': invoice.guest_document_number
     }
     
+    # ReportLab se carga con el primer PDF, no al arrancar el servidor
+    from app.services.pdf_service import pdf_service
     pdf_buffer = pdf_service.generate_receipt_pdf(payment_data, invoice_data)
     
     return StreamingResponse(
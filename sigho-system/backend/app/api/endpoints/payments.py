@@ -1,17 +1,22 @@
 """
 Endpoints de Pagos
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import func
+from typing import List, Optional
+from datetime import datetime, date
 import random
 import string
 from app.database.session import get_db
-from app.schemas.payment import PaymentCreate, PaymentUpdate, PaymentResponse
-from app.models.payment import Payment, PaymentStatus
+from app.schemas.payment import PaymentCreate, PaymentUpdate, PaymentResponse, PaymentSummary
+from app.models.payment import Payment, PaymentMethod, PaymentStatus
 from app.models.reservation import Reservation, ReservationStatus
 from app.models.user import User, UserRole
 from app.api.dependencies.auth import get_current_active_user, require_role
+from app.api.dependencies.query_spec import QuerySpec, get_query_spec
+from app.core.config import settings
+from app.services.exchange_rate_service import normalized_amount
 
 router = APIRouter()
 
@@ -23,16 +28,27 @@ def generate_payment_code() -> str:
 
 @router.get("/", response_model=List[PaymentResponse])
 def get_payments(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     reservation_id: int = None,
     status: PaymentStatus = None,
+    currency: Optional[str] = None,
+    payment_method: Optional[PaymentMethod] = None,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
+    spec: QuerySpec = Depends(get_query_spec),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Obtiene la lista de pagos con filtros opcionales
+    Obtiene la lista de pagos con filtros opcionales.
+    Acepta `fields`, `sort` y filtros `campo__operador` (ver query_spec).
+    El total de pagos que cumplen los filtros se devuelve en `X-Total-Count`.
     """
+    allowed = set(PaymentResponse.model_fields)
     query = db.query(Payment)
     
     if reservation_id:
@@ -41,12 +57,93 @@ def get_payments(
     if status:
         query = query.filter(Payment.status == status)
     
-    query = query.order_by(Payment.created_at.desc())
-    payments = query.offset(skip).limit(limit).all()
+    if currency:
+        query = query.filter(Payment.currency == currency.upper())
     
+    if payment_method:
+        query = query.filter(Payment.payment_method == payment_method)
+    
+    if from_date:
+        query = query.filter(Payment.payment_date >= datetime.combine(from_date, datetime.min.time()))
+    
+    if to_date:
+        query = query.filter(Payment.payment_date <= datetime.combine(to_date, datetime.max.time()))
+    
+    if min_amount is not None:
+        query = query.filter(Payment.amount >= min_amount)
+    
+    if max_amount is not None:
+        query = query.filter(Payment.amount <= max_amount)
+    
+    query = spec.apply(query, Payment, allowed)
+    total = query.order_by(None).count()
+    
+    if not spec.sort:
+        query = query.order_by(Payment.created_at.desc())
+    
+    query = query.offset(skip).limit(limit)
+    if spec.is_projected:
+        projected = spec.project(query, Payment, allowed)
+        projected.headers["X-Total-Count"] = str(total)
+        return projected
+    
+    response.headers["X-Total-Count"] = str(total)
+    payments = query.all()
     return payments
 
 
+@router.get("/summary", response_model=PaymentSummary)
+def get_payments_summary(
+    reservation_id: int = None,
+    base_currency: str = settings.REPORTING_CURRENCY,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Obtiene conteos por estado y montos por moneda de los pagos
+    con una sola consulta agregada
+    """
+    normalized = normalized_amount(
+        Payment.amount, Payment.currency, func.date(Payment.payment_date), base_currency
+    )
+    query = db.query(
+        Payment.status,
+        Payment.currency,
+        func.count(Payment.id),
+        func.coalesce(func.sum(Payment.amount), 0.0),
+        func.coalesce(func.sum(normalized), 0.0)
+    )
+    
+    if reservation_id:
+        query = query.filter(Payment.reservation_id == reservation_id)
+    
+    summary = {
+        "total": 0,
+        "by_status": {payment_status.value: 0 for payment_status in PaymentStatus},
+        "by_currency": {},
+        "base_currency": base_currency,
+        "completed_normalized": 0.0
+    }
+    
+    for payment_status, currency, count, amount, amount_normalized in query.group_by(
+        Payment.status, Payment.currency
+    ).all():
+        summary["total"] += count
+        summary["by_status"][payment_status.value] += count
+        
+        totals = summary["by_currency"].setdefault(
+            currency, {"count": 0, "amount": 0.0, "completed_amount": 0.0}
+        )
+        totals["count"] += count
+        totals["amount"] += amount
+        if payment_status == PaymentStatus.COMPLETED:
+            totals["completed_amount"] += amount
+            summary["completed_normalized"] += amount_normalized
+    
+    summary["completed_normalized"] = round(summary["completed_normalized"], 2)
+    return summary
+
+
 @router.get("/reservation/{reservation_id}", response_model=List[PaymentResponse])
 def get_payments_by_reservation(
     reservation_id: int,
@@ -0,0 +1,276 @@
+"""
+Endpoints de Tarifas (reglas de precio, grilla y cotización)
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date, timedelta
+from app.database.session import get_db
+from app.schemas.pricing import (
+    PricingRuleCreate,
+    PricingRuleUpdate,
+    PricingRuleResponse,
+    RoomRateResponse,
+    RateQuote,
+    GridRebuildResponse
+)
+from app.models.pricing import PricingRule, PricingRuleType, RoomRate
+from app.models.room_type import RoomType
+from app.models.user import User, UserRole
+from app.api.dependencies.auth import get_current_active_user, require_role
+from app.services.pricing_service import pricing_service, NIGHTLY_RULE_TYPES
+
+router = APIRouter()
+
+
+def serialize_rule(rule: PricingRule) -> dict:
+    """Convierte la regla a su respuesta (días de la semana como lista)"""
+    return {
+        "id": rule.id,
+        "name": rule.name,
+        "rule_type": rule.rule_type,
+        "room_type_id": rule.room_type_id,
+        "start_date": rule.start_date,
+        "end_date": rule.end_date,
+        "days_of_week": sorted(rule.weekdays) or None,
+        "min_nights": rule.min_nights,
+        "min_occupancy": rule.min_occupancy,
+        "adjustment_percent": rule.adjustment_percent,
+        "priority": rule.priority,
+        "is_active": rule.is_active,
+        "created_at": rule.created_at,
+        "updated_at": rule.updated_at
+    }
+
+
+def rule_scope(rule: PricingRule):
+    """Alcance de la grilla afectado por una regla (None si no se materializa)"""
+    if rule.rule_type not in NIGHTLY_RULE_TYPES:
+        return None
+    return (rule.room_type_id, rule.start_date, rule.end_date)
+
+
+def validate_rule(db: Session, rule: PricingRule):
+    """Valida las condiciones requeridas según el tipo de regla"""
+    if rule.start_date and rule.end_date and rule.end_date < rule.start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="La fecha final debe ser igual o posterior a la inicial"
+        )
+    if rule.rule_type == PricingRuleType.SEASON and not (rule.start_date and rule.end_date):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Una temporada requiere fecha inicial y final"
+        )
+    if rule.rule_type == PricingRuleType.DAY_OF_WEEK and not rule.weekdays:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Indique los días de la semana (0 = lunes ... 6 = domingo)"
+        )
+    if rule.weekdays - set(range(7)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Los días de la semana deben estar entre 0 (lunes) y 6 (domingo)"
+        )
+    if rule.rule_type == PricingRuleType.LENGTH_OF_STAY and not rule.min_nights:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Un descuento por estadía requiere el mínimo de noches"
+        )
+    if rule.rule_type == PricingRuleType.OCCUPANCY and rule.min_occupancy is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Una regla de ocupación requiere el porcentaje mínimo de ocupación"
+        )
+    if rule.room_type_id and not db.query(RoomType.id).filter(RoomType.id == rule.room_type_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tipo de habitación no encontrado"
+        )
+
+
+def join_weekdays(days: Optional[List[int]]) -> Optional[str]:
+    """Lista de días de la semana a la columna de texto"""
+    return ",".join(str(day) for day in sorted(set(days))) if days else None
+
+
+@router.get("/rules", response_model=List[PricingRuleResponse])
+def get_pricing_rules(
+    rule_type: Optional[PricingRuleType] = None,
+    room_type_id: Optional[int] = None,
+    is_active: Optional[bool] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Obtiene las reglas de precio
+    """
+    query = db.query(PricingRule)
+
+    if rule_type:
+        query = query.filter(PricingRule.rule_type == rule_type)
+    if room_type_id:
+        query = query.filter(PricingRule.room_type_id == room_type_id)
+    if is_active is not None:
+        query = query.filter(PricingRule.is_active == is_active)
+
+    rules = query.order_by(PricingRule.rule_type, PricingRule.priority.desc()).all()
+    return [serialize_rule(rule) for rule in rules]
+
+
+@router.post("/rules", response_model=PricingRuleResponse, status_code=status.HTTP_201_CREATED)
+def create_pricing_rule(
+    rule_in: PricingRuleCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    """
+    Crea una regla de precio y regenera la grilla en su alcance
+    """
+    data = rule_in.model_dump()
+    data["days_of_week"] = join_weekdays(data["days_of_week"])
+    rule = PricingRule(**data)
+    validate_rule(db, rule)
+
+    db.add(rule)
+    db.commit()
+    db.refresh(rule)
+
+    scope = rule_scope(rule)
+    if scope:
+        pricing_service.regenerate_scopes(db, [scope])
+
+    return serialize_rule(rule)
+
+
+@router.put("/rules/{rule_id}", response_model=PricingRuleResponse)
+def update_pricing_rule(
+    rule_id: int,
+    rule_in: PricingRuleUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    """
+    Actualiza una regla de precio y regenera la grilla en su alcance
+    anterior y nuevo
+    """
+    rule = db.query(PricingRule).filter(PricingRule.id == rule_id).first()
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Regla de precio no encontrada"
+        )
+
+    previous_scope = rule_scope(rule)
+
+    update_data = rule_in.model_dump(exclude_unset=True)
+    if "days_of_week" in update_data:
+        update_data["days_of_week"] = join_weekdays(update_data["days_of_week"])
+    for field, value in update_data.items():
+        setattr(rule, field, value)
+    validate_rule(db, rule)
+
+    db.commit()
+    db.refresh(rule)
+
+    scopes = [scope for scope in (previous_scope, rule_scope(rule)) if scope]
+    if scopes:
+        pricing_service.regenerate_scopes(db, scopes)
+
+    return serialize_rule(rule)
+
+
+@router.delete("/rules/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_pricing_rule(
+    rule_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))
+):
+    """
+    Elimina una regla de precio y regenera la grilla en su alcance
+    """
+    rule = db.query(PricingRule).filter(PricingRule.id == rule_id).first()
+    if not rule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Regla de precio no encontrada"
+        )
+
+    scope = rule_scope(rule)
+    db.delete(rule)
+    db.commit()
+
+    if scope:
+        pricing_service.regenerate_scopes(db, [scope])
+
+    return None
+
+
+@router.get("/quote", response_model=RateQuote)
+def get_rate_quote(
+    room_type_id: int,
+    check_in: date,
+    check_out: date,
+    currency: str = "USD",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Cotiza una estadía (precio por noche y subtotal antes de impuestos)
+    """
+    room_type = db.query(RoomType).filter(RoomType.id == room_type_id).first()
+    if not room_type:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tipo de habitación no encontrado"
+        )
+
+    try:
+        return pricing_service.quote(db, room_type, check_in, check_out, currency)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/grid", response_model=List[RoomRateResponse])
+def get_rate_grid(
+    room_type_id: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    currency: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Obtiene la grilla de precios por noche (por defecto los próximos 30 días)
+    """
+    start_date = start_date or date.today()
+    end_date = end_date or start_date + timedelta(days=30)
+    if (end_date - start_date).days > 366:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="El rango máximo es de un año"
+        )
+
+    query = db.query(RoomRate).filter(
+        RoomRate.rate_date >= start_date,
+        RoomRate.rate_date <= end_date
+    )
+    if room_type_id:
+        query = query.filter(RoomRate.room_type_id == room_type_id)
+    if currency:
+        query = query.filter(RoomRate.currency == currency)
+
+    return query.order_by(RoomRate.room_type_id, RoomRate.rate_date, RoomRate.currency).all()
+
+
+@router.post("/grid/rebuild", response_model=GridRebuildResponse)
+def rebuild_rate_grid(
+    room_type_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role([UserRole.ADMIN]))
+):
+    """
+    Regenera la grilla completa del horizonte (o de un tipo de habitación)
+    """
+    rows = pricing_service.regenerate(db, [room_type_id] if room_type_id else None)
+    return {"rows_written": rows}
@@ -0,0 +1,98 @@
+"""
+Endpoints del profiler de diagnóstico (solo administradores)
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import PlainTextResponse
+from fastapi.routing import APIRoute
+from app.schemas.profiler import ProfilerStart, ProfilerStatus
+from app.models.user import User
+from app.core.profiler import route_profiler
+from app.api.dependencies.auth import require_admin
+
+router = APIRouter()
+
+
+@router.post("/start", response_model=ProfilerStatus, status_code=status.HTTP_201_CREATED)
+def start_profiler(
+    data: ProfilerStart,
+    request: Request,
+    current_user: User = Depends(require_admin)
+):
+    """
+    Arma el profiler para las próximas N peticiones a una ruta
+    """
+    method = data.method.upper()
+    route = next(
+        (
+            route for route in request.app.router.routes
+            if isinstance(route, APIRoute) and route.path == data.path and method in route.methods
+        ),
+        None
+    )
+    if route is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Ruta no encontrada: {method} {data.path}"
+        )
+    if route.endpoint.__module__ == __name__:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No se puede perfilar el propio profiler"
+        )
+
+    try:
+        session = route_profiler.start(route, method, data.requests, data.mode, data.interval_ms)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return session.status()
+
+
+@router.get("/status", response_model=ProfilerStatus)
+def get_profiler_status(current_user: User = Depends(require_admin)):
+    """
+    Obtiene el estado de la sesión de perfilado actual
+    """
+    if route_profiler.session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No hay sesión de perfilado"
+        )
+    return route_profiler.session.status()
+
+
+@router.get("/result", response_class=PlainTextResponse)
+def get_profiler_result(current_user: User = Depends(require_admin)):
+    """
+    Descarga el perfil capturado en formato collapsed stacks (flamegraph)
+    """
+    session = route_profiler.session
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No hay sesión de perfilado"
+        )
+    if not session.finished:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Sesión en curso: {session.captured}/{session.requests} peticiones capturadas"
+        )
+
+    return PlainTextResponse(
+        session.collapsed(),
+        headers={"Content-Disposition": 'attachment; filename="profile.folded"'}
+    )
+
+
+@router.post("/stop", response_model=ProfilerStatus)
+def stop_profiler(current_user: User = Depends(require_admin)):
+    """
+    Cancela la sesión de perfilado conservando lo capturado
+    """
+    session = route_profiler.stop()
+    if session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No hay sesión de perfilado"
+        )
+    return session.status()
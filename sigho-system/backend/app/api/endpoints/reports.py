@@ -15,8 +15,14 @@ from app.models.maintenance import Maintenance, MaintenanceStatus
 from app.models.inventory import Inventory, InventoryCategory
 from app.models.inventory_movement import InventoryMovement, MovementType
 from app.models.guest import Guest
+from app.models.guest_stats import GuestStats
 from app.models.user import User, UserRole
 from app.api.dependencies.auth import get_current_active_user, require_role
+from app.services.stock_ledger_service import stock_ledger_service
+from app.services.exchange_rate_service import normalized_amount, missing_rate_count
+from app.services.archive_service import archive_service
+from app.services.occupancy_service import occupancy_service
+from app.core.config import settings
 
 router = APIRouter()
 
@@ -30,15 +36,17 @@ def generate_reservations_report(
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
-    Genera un reporte de reservas en un período
+    Genera un reporte de reservas en un período (incluye el archivo si el
+    período lo abarca)
     """
-    query = db.query(Reservation).filter(
-        Reservation.check_in_date >= start_date,
-        Reservation.check_in_date <= end_date
+    source = archive_service.source(db, Reservation, start_date, end_date)
+    query = db.query(source).filter(
+        source.check_in_date >= start_date,
+        source.check_in_date <= end_date
     )
     
     if status:
-        query = query.filter(Reservation.status == status)
+        query = query.filter(source.status == status)
     
     reservations = query.all()
     
@@ -107,48 +115,64 @@ def generate_revenue_report(
     end_date: date,
     currency: Optional[str] = None,
     payment_method: Optional[PaymentMethod] = None,
+    base_currency: str = settings.REPORTING_CURRENCY,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER]))
 ) -> Dict[str, Any]:
     """
     Genera un reporte de ingresos
-    """
-    query = db.query(Payment).filter(
-        Payment.status == PaymentStatus.COMPLETED,
-        func.date(Payment.payment_date) >= start_date,
-        func.date(Payment.payment_date) <= end_date
-    )
     
+    Además de los montos por moneda, cada agregado incluye el total
+    normalizado a `base_currency` con la tasa de cambio de la fecha de cada
+    pago, calculado en la misma consulta. Incluye los pagos archivados si
+    el período los abarca.
+    """
+    payments = archive_service.source(db, Payment, start_date, end_date)
+    payment_day = func.date(payments.payment_date)
+    filters = [
+        payments.status == PaymentStatus.COMPLETED,
+        payment_day >= start_date,
+        payment_day <= end_date
+    ]
     if currency:
-        query = query.filter(Payment.currency == currency)
-    
+        filters.append(payments.currency == currency)
     if payment_method:
-        query = query.filter(Payment.payment_method == payment_method)
+        filters.append(payments.payment_method == payment_method)
     
-    payments = query.all()
+    normalized = func.sum(normalized_amount(payments.amount, payments.currency, payment_day, base_currency))
+    
+    # Totales generales
+    total_payments, total_normalized, unconverted = db.query(
+        func.count(payments.id),
+        normalized,
+        missing_rate_count(payments.currency, payment_day, base_currency)
+    ).filter(*filters).one()
     
     # Agrupar por moneda
-    by_currency = {}
-    for payment in payments:
-        if payment.currency not in by_currency:
-            by_currency[payment.currency] = 0
-        by_currency[payment.currency] += payment.amount
-    
-    # Agrupar por método de pago
-    by_payment_method = {}
-    for method in PaymentMethod:
-        amount = sum(p.amount for p in payments if p.payment_method == method)
-        if amount > 0:
-            by_payment_method[method.value] = round(amount, 2)
+    by_currency = {
+        payment_currency: round(amount or 0, 2)
+        for payment_currency, amount in db.query(
+            payments.currency, func.sum(payments.amount)
+        ).filter(*filters).group_by(payments.currency)
+    }
+    
+    # Agrupar por método de pago (normalizado: un método puede recibir varias monedas)
+    by_payment_method = {
+        method.value: round(amount or 0, 2)
+        for method, amount in db.query(
+            payments.payment_method, normalized
+        ).filter(*filters).group_by(payments.payment_method)
+    }
     
     # Ingresos por día
     daily_revenue = {}
-    for payment in payments:
-        payment_date = payment.payment_date.date()
-        date_str = payment_date.isoformat()
-        if date_str not in daily_revenue:
-            daily_revenue[date_str] = {"VES": 0, "USD": 0, "EUR": 0}
-        daily_revenue[date_str][payment.currency] += payment.amount
+    for day, payment_currency, amount, day_normalized in db.query(
+        payment_day, payments.currency, func.sum(payments.amount), normalized
+    ).filter(*filters).group_by(payment_day, payments.currency):
+        date_str = str(day)[:10]
+        entry = daily_revenue.setdefault(date_str, {"VES": 0, "USD": 0, "EUR": 0, "normalized": 0})
+        entry[payment_currency] = entry.get(payment_currency, 0) + (amount or 0)
+        entry["normalized"] += day_normalized or 0
     
     return {
         "period": {
@@ -156,16 +180,20 @@ def generate_revenue_report(
             "end_date": end_date.isoformat()
         },
         "summary": {
-            "total_payments": len(payments),
-            "by_currency": {k: round(v, 2) for k, v in by_currency.items()},
-            "by_payment_method": by_payment_method
+            "total_payments": total_payments,
+            "by_currency": by_currency,
+            "by_payment_method": by_payment_method,
+            "base_currency": base_currency,
+            "total_normalized": round(total_normalized or 0, 2),
+            "unconverted_payments": unconverted or 0
         },
         "daily_revenue": [
             {
                 "date": date_str,
                 "ves": round(amounts["VES"], 2),
                 "usd": round(amounts["USD"], 2),
-                "eur": round(amounts["EUR"], 2)
+                "eur": round(amounts["EUR"], 2),
+                "normalized": round(amounts["normalized"], 2)
             }
             for date_str, amounts in sorted(daily_revenue.items())
         ]
@@ -180,23 +208,24 @@ def generate_occupancy_report(
     current_user: User = Depends(get_current_active_user)
 ) -> Dict[str, Any]:
     """
-    Genera un reporte de ocupación
+    Genera un reporte de ocupación (incluye el archivo si el período lo abarca)
     """
     total_rooms = db.query(Room).filter(Room.is_active == True).count()
     days_in_period = (end_date - start_date).days + 1
+    source = archive_service.source(db, Reservation, start_date, end_date)
+    
+    # Habitaciones ocupadas por noche, en una sola consulta
+    nightly = occupancy_service.nightly(
+        db, start_date, end_date + timedelta(days=1),
+        [ReservationStatus.CHECKED_IN, ReservationStatus.CHECKED_OUT],
+        source=source
+    )
     
     daily_occupancy = []
     
-    for i in range(days_in_period):
+    for i, occupied in enumerate(nightly):
         current_date = start_date + timedelta(days=i)
         
-        # Contar habitaciones ocupadas
-        occupied = db.query(Reservation).filter(
-            Reservation.status.in_([ReservationStatus.CHECKED_IN, ReservationStatus.CHECKED_OUT]),
-            Reservation.check_in_date <= current_date,
-            Reservation.check_out_date > current_date
-        ).count()
-        
         occupancy_rate = (occupied / total_rooms * 100) if total_rooms > 0 else 0
         
         daily_occupancy.append({
@@ -354,6 +383,28 @@ def generate_inventory_report(
     }
 
 
+@router.get("/inventory/valuation")
+def generate_inventory_valuation_report(
+    as_of: date,
+    category: Optional[InventoryCategory] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """
+    Genera la valoración del inventario al cierre de una fecha
+
+    Parte de la instantánea más cercana (scripts/snapshot_inventory.py) y
+    aplica solo los movimientos posteriores.
+    """
+    if as_of > date.today():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="La fecha de valoración no puede ser futura"
+        )
+    
+    return stock_ledger_service.valuation_as_of(db, as_of, category)
+
+
 @router.get("/guests")
 def generate_guests_report(
     db: Session = Depends(get_db),
@@ -362,27 +413,20 @@ def generate_guests_report(
     """
     Genera un reporte de huéspedes
     """
-    guests = db.query(Guest).all()
-    
-    # Estadísticas
-    total_guests = len(guests)
-    
     # Agrupar por país
-    by_country = {}
-    for guest in guests:
-        country = guest.country or "Unknown"
-        by_country[country] = by_country.get(country, 0) + 1
-    
-    # Top huéspedes por número de reservas
-    top_guests = db.query(
-        Guest,
-        func.count(Reservation.id).label('reservation_count')
-    ).join(
-        Reservation, Reservation.guest_id == Guest.id
-    ).group_by(
-        Guest.id
+    by_country = {
+        country or "Unknown": count
+        for country, count in db.query(Guest.country, func.count(Guest.id)).group_by(Guest.country)
+    }
+    total_guests = sum(by_country.values())
+    
+    # Top huéspedes por número de reservas (proyección guest_stats)
+    top_guests = db.query(GuestStats, Guest).join(
+        Guest, Guest.id == GuestStats.guest_id
     ).order_by(
-        func.count(Reservation.id).desc()
+        GuestStats.reservation_count.desc(),
+        GuestStats.total_nights.desc(),
+        Guest.id
     ).limit(10).all()
     
     return {
@@ -395,8 +439,12 @@ def generate_guests_report(
                 "id": guest.id,
                 "full_name": guest.full_name,
                 "id_number": guest.id_number,
-                "reservation_count": count
+                "reservation_count": stats.reservation_count,
+                "stay_count": stats.stay_count,
+                "total_nights": stats.total_nights,
+                "total_spent": stats.total_spent,
+                "last_stay_date": stats.last_stay_date.isoformat() if stats.last_stay_date else None
             }
-            for guest, count in top_guests
+            for stats, guest in top_guests
         ]
     }
\ No newline at end of file
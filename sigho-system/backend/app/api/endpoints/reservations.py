@@ -9,6 +9,7 @@ from datetime import datetime, date
 import random
 import string
 from app.database.session import get_db
+from app.database.dialect import text_search
 from app.schemas.reservation import (
     ReservationCreate, 
     ReservationUpdate, 
@@ -16,6 +17,7 @@ from app.schemas.reservation import (
     ReservationCheckIn,
     ReservationCheckOut,
     ReservationCancel,
+    ReservationPickerItem,
     ReservationSearchFilters
 )
 from app.models.reservation import Reservation, ReservationStatus
@@ -23,6 +25,8 @@ from app.models.room import Room, RoomStatus
 from app.models.guest import Guest
 from app.models.user import User, UserRole
 from app.api.dependencies.auth import get_current_active_user, require_role
+from app.api.dependencies.query_spec import QuerySpec, get_query_spec
+from app.services.pricing_service import pricing_service
 
 router = APIRouter()
 
@@ -33,35 +37,22 @@ def generate_confirmation_code() -> str:
 
 
 def calculate_reservation_prices(
+    db: Session,
     room: Room,
     check_in: date,
     check_out: date,
     currency: str
 ) -> dict:
-    """Calcula los precios de la reserva"""
-    # Calcular noches
-    total_nights = (check_out - check_in).days
-    if total_nights <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="La fecha de salida debe ser posterior a la fecha de entrada"
-        )
-    
-    # Obtener precio por noche según la moneda
-    if currency == "VES":
-        price_per_night = room.room_type.base_price_ves
-    elif currency == "USD":
-        price_per_night = room.room_type.base_price_usd
-    elif currency == "EUR":
-        price_per_night = room.room_type.base_price_eur or room.room_type.base_price_usd * 0.92
-    else:
+    """Calcula los precios de la reserva desde la grilla de tarifas"""
+    try:
+        quote = pricing_service.quote(db, room.room_type, check_in, check_out, currency)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Moneda no válida"
+            detail=str(e)
         )
     
-    # Calcular subtotal
-    subtotal = price_per_night * total_nights
+    subtotal = quote["subtotal"]
     
     # Calcular impuestos (16% IVA)
     tax_percentage = 16.0
@@ -71,8 +62,8 @@ def calculate_reservation_prices(
     total_amount = subtotal + tax_amount
     
     return {
-        "price_per_night": price_per_night,
-        "total_nights": total_nights,
+        "price_per_night": quote["price_per_night"],
+        "total_nights": quote["total_nights"],
         "subtotal": subtotal,
         "tax_percentage": tax_percentage,
         "tax_amount": tax_amount,
@@ -126,12 +117,15 @@ def get_reservations(
     status: Optional[ReservationStatus] = None,
     check_in_date_from: Optional[date] = None,
     check_in_date_to: Optional[date] = None,
+    spec: QuerySpec = Depends(get_query_spec),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Obtiene la lista de reservas con filtros opcionales
+    Obtiene la lista de reservas con filtros opcionales.
+    Acepta `fields`, `sort` y filtros `campo__operador` (ver query_spec).
     """
+    allowed = set(ReservationResponse.model_fields)
     query = db.query(Reservation)
     
     # Aplicar filtros
@@ -144,10 +138,17 @@ def get_reservations(
     if check_in_date_to:
         query = query.filter(Reservation.check_in_date <= check_in_date_to)
     
+    query = spec.apply(query, Reservation, allowed)
+    
     # Ordenar por fecha de creación descendente
-    query = query.order_by(Reservation.created_at.desc())
+    if not spec.sort:
+        query = query.order_by(Reservation.created_at.desc())
     
-    reservations = query.offset(skip).limit(limit).all()
+    query = query.offset(skip).limit(limit)
+    if spec.is_projected:
+        return spec.project(query, Reservation, allowed)
+    
+    reservations = query.all()
     return reservations
 
 
@@ -186,21 +187,17 @@ def search_reservations(
     """
     # Buscar por código de confirmación
     by_code = db.query(Reservation).filter(
-        Reservation.confirmation_code.ilike(f"%{query}%")
+        text_search([Reservation.confirmation_code], query)
     )
     
     # Buscar por nombre de huésped
     by_guest = db.query(Reservation).join(Guest).filter(
-        or_(
-            Guest.first_name.ilike(f"%{query}%"),
-            Guest.last_name.ilike(f"%{query}%"),
-            Guest.id_number.ilike(f"%{query}%")
-        )
+        text_search([Guest.first_name, Guest.last_name, Guest.id_number], query)
     )
     
     # Buscar por número de habitación
     by_room = db.query(Reservation).join(Room).filter(
-        Room.room_number.ilike(f"%{query}%")
+        text_search([Room.room_number], query)
     )
     
     # Combinar resultados
@@ -209,6 +206,40 @@ def search_reservations(
     return results
 
 
+@router.get("/picker", response_model=List[ReservationPickerItem])
+def get_reservation_picker(
+    query: Optional[str] = None,
+    status: Optional[List[ReservationStatus]] = Query(None),
+    skip: int = 0,
+    limit: int = Query(50, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Lista paginada y compacta de reservas para selectores.
+    Busca por código de confirmación o nombre del huésped.
+    """
+    guest_name = (Guest.first_name + " " + Guest.last_name).label("guest_name")
+    picker = db.query(
+        Reservation.id,
+        Reservation.confirmation_code,
+        guest_name,
+        Reservation.balance,
+        Reservation.currency
+    ).join(Guest, Reservation.guest_id == Guest.id)
+    
+    if status:
+        picker = picker.filter(Reservation.status.in_(status))
+    
+    if query:
+        picker = picker.filter(
+            text_search([Reservation.confirmation_code, Guest.first_name, Guest.last_name], query)
+        )
+    
+    rows = picker.order_by(Reservation.check_in_date.desc()).offset(skip).limit(limit).all()
+    return [row._asdict() for row in rows]
+
+
 @router.get("/{reservation_id}", response_model=ReservationResponse)
 def get_reservation(
     reservation_id: int,
@@ -281,6 +312,7 @@ def create_reservation(
     
     # Calcular precios
     prices = calculate_reservation_prices(
+        db,
         room,
         reservation_in.check_in_date,
         reservation_in.check_out_date,
@@ -361,6 +393,7 @@ def update_reservation(
         # Recalcular precios
         room = db.query(Room).filter(Room.id == reservation.room_id).first()
         prices = calculate_reservation_prices(
+            db,
             room,
             new_check_in,
             new_check_out,
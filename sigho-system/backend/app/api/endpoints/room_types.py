@@ -11,9 +11,13 @@ from app.models.amenity import Amenity
 from app.schemas.room_type import RoomTypeCreate, RoomTypeUpdate, RoomTypeResponse
 from app.core.deps import get_current_active_user
 from app.models.user import User
+from app.services.pricing_service import pricing_service
 
 router = APIRouter()
 
+# Campos que afectan la grilla de precios
+PRICE_FIELDS = {"base_price_ves", "base_price_usd", "base_price_eur", "is_active"}
+
 
 @router.get("/", response_model=List[RoomTypeResponse])
 def get_room_types(
@@ -91,6 +95,10 @@ def create_room_type(
     db.add(room_type)
     db.commit()
     db.refresh(room_type)
+    
+    # Materializar la grilla de precios del nuevo tipo
+    pricing_service.regenerate(db, [room_type.id])
+    db.refresh(room_type)
     return room_type
 
 
@@ -138,6 +146,11 @@ def update_room_type(
     
     db.commit()
     db.refresh(room_type)
+    
+    # Un cambio de precio base o de estado invalida la grilla de este tipo
+    if PRICE_FIELDS & update_data.keys():
+        pricing_service.regenerate(db, [room_type.id])
+        db.refresh(room_type)
     return room_type
 
 
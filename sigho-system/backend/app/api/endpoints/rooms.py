@@ -1,16 +1,18 @@
 """
 Endpoints de Habitaciones
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
 from typing import List, Optional
 from datetime import date
-from app.database.session import get_db
+from app.database.session import get_db, SessionLocal
 from app.schemas.room import (
     RoomCreate, 
     RoomUpdate, 
     RoomResponse,
+    RoomSummary,
     RoomStatusUpdate,
     RoomTypeCreate,
     RoomTypeUpdate,
@@ -23,6 +25,10 @@ from app.models.room_type import RoomType
 from app.models.reservation import Reservation, ReservationStatus
 from app.models.user import User, UserRole
 from app.api.dependencies.auth import get_current_active_user, require_role
+from app.core.room_board import room_board
+from app.services.pricing_service import pricing_service
+from app.services.archive_service import archive_service
+from app.core.security import decode_access_token
 
 router = APIRouter()
 
@@ -196,6 +202,103 @@ def get_rooms(
     return rooms
 
 
+@router.get("/summary", response_model=RoomSummary)
+def get_rooms_summary(
+    floor: Optional[int] = None,
+    room_type_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Obtiene conteos de habitaciones por estado con una sola consulta agregada
+    """
+    query = db.query(Room.status, Room.is_active, func.count(Room.id))
+    
+    if floor is not None:
+        query = query.filter(Room.floor == floor)
+    
+    if room_type_id is not None:
+        query = query.filter(Room.room_type_id == room_type_id)
+    
+    summary = {
+        "total": 0,
+        "active": 0,
+        "by_status": {room_status.value: 0 for room_status in RoomStatus}
+    }
+    
+    for room_status, is_active, count in query.group_by(Room.status, Room.is_active).all():
+        summary["total"] += count
+        summary["by_status"][room_status.value] += count
+        if is_active:
+            summary["active"] += count
+    
+    return summary
+
+
+def _room_board_snapshot(token: str) -> Optional[dict]:
+    """Valida el token y obtiene el estado actual de todas las habitaciones"""
+    payload = decode_access_token(token)
+    if payload is None or payload.get("sub") is None:
+        return None
+    
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.username == payload["sub"]).first()
+        if user is None or not user.is_active:
+            return None
+        
+        rooms = db.query(
+            Room.id, Room.room_number, Room.floor, Room.is_active, Room.status
+        ).order_by(Room.room_number).all()
+        
+        return {
+            "type": "snapshot",
+            "seq": room_board.seq,
+            "rooms": [
+                {
+                    "room_id": room.id,
+                    "room_number": room.room_number,
+                    "floor": room.floor,
+                    "is_active": room.is_active,
+                    "status": room.status.value
+                }
+                for room in rooms
+            ]
+        }
+    finally:
+        db.close()
+
+
+@router.websocket("/ws")
+async def room_status_board(websocket: WebSocket, token: str = Query(...)):
+    """
+    Canal en tiempo real del estado de las habitaciones.
+    Envía una instantánea al conectar y luego un delta por cada transacción
+    que cambie el estado de alguna habitación.
+    """
+    snapshot = await run_in_threadpool(_room_board_snapshot, token)
+    if snapshot is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    await room_board.connect(websocket)
+    try:
+        await websocket.send_json(snapshot)
+        while True:
+            # El cliente puede enviar "snapshot" para resincronizarse
+            message = await websocket.receive_text()
+            if message == "snapshot":
+                snapshot = await run_in_threadpool(_room_board_snapshot, token)
+                if snapshot is None:
+                    await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+                    break
+                await websocket.send_json(snapshot)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        room_board.disconnect(websocket)
+
+
 @router.get("/available", response_model=List[RoomResponse])
 def get_available_rooms(
     check_in: date = Query(...),
@@ -210,7 +313,7 @@ def get_available_rooms(
     all_rooms = db.query(Room).filter(
         Room.is_active == True,
         Room.status.in_([RoomStatus.AVAILABLE, RoomStatus.CLEANING])
-    ).all()
+    ).order_by(Room.id).all()
     
     available_rooms = []
     
@@ -273,6 +376,7 @@ def check_availability(
     room_types = db.query(RoomType).filter(RoomType.is_active == True).all()
     
     availability_results = []
+    available_types = []
     
     for room_type in room_types:
         # Verificar capacidad
@@ -317,20 +421,29 @@ def check_availability(
                 available_count += 1
         
         if available_count > 0:
-            availability_results.append(
-                RoomAvailabilityResponse(
-                    room_type_id=room_type.id,
-                    room_type_name=room_type.name,
-                    available_rooms=available_count,
-                    price_per_night_ves=room_type.base_price_ves,
-                    price_per_night_usd=room_type.base_price_usd,
-                    price_per_night_eur=room_type.base_price_eur,
-                    total_nights=total_nights,
-                    total_price_ves=room_type.base_price_ves * total_nights,
-                    total_price_usd=room_type.base_price_usd * total_nights,
-                    total_price_eur=(room_type.base_price_eur * total_nights) if room_type.base_price_eur else None
-                )
+            available_types.append((room_type, available_count))
+    
+    # Subtotales de la estadía desde la grilla de tarifas (una consulta para todos los tipos)
+    totals = pricing_service.stay_totals(db, [room_type for room_type, _ in available_types], check_in, check_out)
+    
+    for room_type, available_count in available_types:
+        total_ves = totals.get((room_type.id, "VES"), 0.0)
+        total_usd = totals.get((room_type.id, "USD"), 0.0)
+        total_eur = totals.get((room_type.id, "EUR"))
+        availability_results.append(
+            RoomAvailabilityResponse(
+                room_type_id=room_type.id,
+                room_type_name=room_type.name,
+                available_rooms=available_count,
+                price_per_night_ves=round(total_ves / total_nights, 2),
+                price_per_night_usd=round(total_usd / total_nights, 2),
+                price_per_night_eur=round(total_eur / total_nights, 2) if total_eur is not None else None,
+                total_nights=total_nights,
+                total_price_ves=total_ves,
+                total_price_usd=total_usd,
+                total_price_eur=total_eur
             )
+        )
     
     return availability_results
 
@@ -486,6 +599,14 @@ def delete_room(
             detail=f"No se puede eliminar. Hay {active_reservations} reserva(s) activa(s)"
         )
     
+    # Las reservas archivadas siguen referenciando la habitación en reportes y analítica
+    archived_reservations = archive_service.archived_count(db, Reservation, room_id=room_id)
+    if archived_reservations > 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No se puede eliminar. Hay {archived_reservations} reserva(s) en el archivo histórico"
+        )
+    
     db.delete(room)
     db.commit()
     
@@ -0,0 +1,196 @@
+"""
+Middleware de compresión de respuestas (Brotli / Gzip)
+
+Se elige Brotli si el cliente lo acepta y la librería `brotli` está
+instalada; en caso contrario se usa Gzip. Las respuestas menores al umbral
+configurado o con tipos de contenido ya comprimidos se envían sin cambios.
+"""
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Brotli es opcional
+    brotli = None
+
+
+# Tipos de contenido que vale la pena comprimir
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "text/",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def _is_compressible(content_type: str) -> bool:
+    """Verifica si el tipo de contenido se beneficia de la compresión"""
+    return any(content_type.startswith(prefix) for prefix in COMPRESSIBLE_TYPES)
+
+
+class _Compressor:
+    """Envoltorio incremental común para gzip y brotli"""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31 produce formato gzip (cabecera + CRC)
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Comprime un bloque de datos"""
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        """Vacía el compresor y devuelve los bytes finales"""
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """Comprime las respuestas HTTP según el encabezado Accept-Encoding"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        """
+        Args:
+            app: Aplicación ASGI
+            minimum_size: Tamaño mínimo (bytes) para comprimir una respuesta
+            gzip_level: Nivel de compresión gzip (1-9)
+            brotli_quality: Calidad de compresión brotli (0-11)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            self.app, encoding, self.minimum_size, self.gzip_level, self.brotli_quality
+        )
+        await responder(scope, receive, send)
+
+    @staticmethod
+    def _select_encoding(accept_encoding: str) -> Optional[str]:
+        """Elige la codificación preferida entre las aceptadas por el cliente"""
+        accepted = set()
+        for token in accept_encoding.split(","):
+            name, _, params = token.partition(";")
+            params = params.replace(" ", "")
+            # Ignorar codificaciones rechazadas explícitamente (q=0)
+            if params.startswith("q="):
+                try:
+                    if float(params[2:]) == 0:
+                        continue
+                except ValueError:
+                    pass
+            if name.strip():
+                accepted.add(name.strip().lower())
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+
+class _CompressionResponder:
+    """Intercepta los mensajes de respuesta y comprime el cuerpo"""
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int,
+                 gzip_level: int, brotli_quality: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        """Reemplaza a `send` para comprimir el cuerpo de la respuesta"""
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Se retiene hasta conocer el primer bloque del cuerpo
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or not _is_compressible(headers.get("content-type", ""))
+            )
+            return
+
+        if message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            if self.start_message is not None:
+                await self.send(self.start_message)
+                self.start_message = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            # Primer bloque del cuerpo
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(self.start_message)
+                self.start_message = None
+                await self.send(message)
+                return
+
+            self.compressor = _Compressor(self.encoding, self.gzip_level, self.brotli_quality)
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body:
+                compressed = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(self.start_message)
+                self.start_message = None
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            # Respuesta en streaming: el tamaño final es desconocido
+            del headers["Content-Length"]
+            await self.send(self.start_message)
+            self.start_message = None
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -0,0 +1,292 @@
+"""
+Bus de eventos de dominio en proceso
+
+Los cambios relevantes se detectan en el flush de la sesión (estado de
+reservas y habitaciones, pagos, movimientos de inventario) y se publican
+únicamente cuando la transacción se confirma; en un rollback se descartan.
+Así los suscriptores (caches, agregados, canales push) reaccionan a los
+cambios sin que cada endpoint tenga que conocerlos.
+
+Los manejadores se ejecutan en el mismo hilo que hizo el commit, después de
+confirmarse la transacción: no deben usar la sesión que los originó y, si
+necesitan la base de datos, deben abrir su propia sesión.
+"""
+import enum
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from app.models.inventory import Inventory
+from app.models.inventory_movement import InventoryMovement
+from app.models.payment import Payment
+from app.models.reservation import Reservation
+from app.models.room import Room
+
+logger = logging.getLogger("sigho.events")
+
+
+def _value(value: Any) -> Any:
+    """Convierte enums a su valor para que los eventos sean serializables"""
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+# ========== EVENTOS ==========
+@dataclass(frozen=True)
+class DomainEvent:
+    """Evento base"""
+    occurred_at: datetime = field(default_factory=datetime.now, kw_only=True)
+
+
+@dataclass(frozen=True)
+class RoomStatusChanged(DomainEvent):
+    """Cambió el estado de una habitación (o se creó una nueva)"""
+    room_id: int
+    room_number: str
+    floor: int
+    is_active: bool
+    status: str
+    previous_status: Optional[str]
+
+
+@dataclass(frozen=True)
+class ReservationChanged(DomainEvent):
+    """Se creó, modificó (estado, fechas o montos) o eliminó una reserva"""
+    reservation_id: int
+    room_id: int
+    guest_id: int
+    status: str
+    previous_status: Optional[str]
+    changed_fields: Tuple[str, ...]
+    deleted: bool = False  # La reserva se eliminó; los datos son los últimos conocidos
+
+
+@dataclass(frozen=True)
+class PaymentRecorded(DomainEvent):
+    """Se registró o eliminó un pago, o cambió su estado (ej. reembolso)"""
+    payment_id: int
+    reservation_id: int
+    amount: float
+    currency: str
+    payment_method: str
+    status: str
+    previous_status: Optional[str]
+    deleted: bool = False  # El pago se eliminó
+
+
+@dataclass(frozen=True)
+class StockMoved(DomainEvent):
+    """Cambió la existencia de un item de inventario"""
+    inventory_id: int
+    movement_id: Optional[int]
+    movement_type: Optional[str]
+    quantity: int
+    previous_quantity: int
+    new_quantity: int
+
+
+# ========== BUS ==========
+class EventBus:
+    """Registro de suscriptores y despacho de eventos"""
+
+    def __init__(self):
+        self._handlers: Dict[Type[DomainEvent], List[Callable[[DomainEvent], None]]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: Optional[Callable] = None):
+        """
+        Registra un manejador para un tipo de evento (incluye subclases).
+        Puede usarse como decorador: `@event_bus.subscribe(StockMoved)`.
+        """
+        def register(func: Callable) -> Callable:
+            with self._lock:
+                self._handlers.setdefault(event_type, []).append(func)
+            return func
+
+        if handler is not None:
+            return register(handler)
+        return register
+
+    def unsubscribe(self, event_type: Type[DomainEvent], handler: Callable):
+        """Elimina un manejador"""
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+    def publish(self, events: List[DomainEvent]):
+        """Despacha los eventos; un manejador que falla no afecta a los demás"""
+        with self._lock:
+            registered = list(self._handlers.items())
+
+        for domain_event in events:
+            for event_type, handlers in registered:
+                if not isinstance(domain_event, event_type):
+                    continue
+                for handler in handlers:
+                    try:
+                        handler(domain_event)
+                    except Exception:
+                        logger.exception(
+                            "Error en el manejador %s para %s",
+                            getattr(handler, "__qualname__", handler), type(domain_event).__name__
+                        )
+
+
+# Instancia global del bus
+event_bus = EventBus()
+
+
+def emit(session: Session, domain_event: DomainEvent):
+    """Encola un evento explícito para publicarlo al confirmar la transacción"""
+    session.info.setdefault("domain_events", []).append(domain_event)
+
+
+# ========== DETECCIÓN DE CAMBIOS ==========
+RESERVATION_TRACKED_FIELDS = (
+    "status", "room_id", "check_in_date", "check_out_date",
+    "total_amount", "paid_amount", "balance"
+)
+
+
+def _history(instance, attribute: str):
+    """Historial de un atributo en el flush actual"""
+    return inspect(instance).attrs[attribute].history
+
+
+def _previous(instance, attribute: str) -> Any:
+    """Valor anterior de un atributo modificado (None si no cambió)"""
+    history = _history(instance, attribute)
+    return _value(history.deleted[0]) if history.deleted else None
+
+
+def _keep_previous_status(target, value, oldvalue, initiator):
+    """Sin efecto: registrado con active_history para que `_previous` conozca el estado anterior"""
+
+
+# Al asignar un estado que no se había leído (ej. tras un commit), cargar el anterior
+# desde la base en lugar de perderlo; si no, previous_status llegaría como None
+for _status in (Room.status, Reservation.status, Payment.status):
+    event.listen(_status, "set", _keep_previous_status, active_history=True)
+
+
+def _collect_events(session: Session) -> List[DomainEvent]:
+    """Construye los eventos a partir de los objetos nuevos, modificados y eliminados"""
+    events: List[DomainEvent] = []
+    moved_inventory = set()
+
+    for instance in session.new:
+        if isinstance(instance, Room):
+            events.append(RoomStatusChanged(
+                room_id=instance.id, room_number=instance.room_number, floor=instance.floor,
+                is_active=instance.is_active, status=_value(instance.status), previous_status=None
+            ))
+        elif isinstance(instance, Reservation):
+            events.append(ReservationChanged(
+                reservation_id=instance.id, room_id=instance.room_id, guest_id=instance.guest_id,
+                status=_value(instance.status), previous_status=None, changed_fields=()
+            ))
+        elif isinstance(instance, Payment):
+            events.append(PaymentRecorded(
+                payment_id=instance.id, reservation_id=instance.reservation_id,
+                amount=instance.amount, currency=instance.currency,
+                payment_method=_value(instance.payment_method),
+                status=_value(instance.status), previous_status=None
+            ))
+        elif isinstance(instance, InventoryMovement):
+            moved_inventory.add(instance.inventory_id)
+            events.append(StockMoved(
+                inventory_id=instance.inventory_id, movement_id=instance.id,
+                movement_type=_value(instance.movement_type), quantity=instance.quantity,
+                previous_quantity=instance.previous_quantity, new_quantity=instance.new_quantity
+            ))
+
+    for instance in session.dirty:
+        if isinstance(instance, Room):
+            if _history(instance, "status").has_changes():
+                previous = _previous(instance, "status")
+                if previous is not None and previous != _value(instance.status):
+                    events.append(RoomStatusChanged(
+                        room_id=instance.id, room_number=instance.room_number, floor=instance.floor,
+                        is_active=instance.is_active, status=_value(instance.status),
+                        previous_status=previous
+                    ))
+        elif isinstance(instance, Reservation):
+            changed = tuple(
+                name for name in RESERVATION_TRACKED_FIELDS
+                if _history(instance, name).has_changes()
+            )
+            if changed:
+                events.append(ReservationChanged(
+                    reservation_id=instance.id, room_id=instance.room_id, guest_id=instance.guest_id,
+                    status=_value(instance.status),
+                    previous_status=_previous(instance, "status") if "status" in changed else _value(instance.status),
+                    changed_fields=changed
+                ))
+        elif isinstance(instance, Payment):
+            if _history(instance, "status").has_changes():
+                events.append(PaymentRecorded(
+                    payment_id=instance.id, reservation_id=instance.reservation_id,
+                    amount=instance.amount, currency=instance.currency,
+                    payment_method=_value(instance.payment_method),
+                    status=_value(instance.status), previous_status=_previous(instance, "status")
+                ))
+        elif isinstance(instance, Inventory):
+            # Ajustes directos de existencia sin movimiento registrado
+            history = _history(instance, "current_quantity")
+            if history.has_changes() and instance.id not in moved_inventory:
+                previous = history.deleted[0] if history.deleted else 0
+                events.append(StockMoved(
+                    inventory_id=instance.id, movement_id=None, movement_type=None,
+                    quantity=instance.current_quantity - previous,
+                    previous_quantity=previous, new_quantity=instance.current_quantity
+                ))
+
+    # Los objetos eliminados conservan los valores cargados durante el flush
+    for instance in session.deleted:
+        if isinstance(instance, Reservation):
+            events.append(ReservationChanged(
+                reservation_id=instance.id, room_id=instance.room_id, guest_id=instance.guest_id,
+                status=_value(instance.status), previous_status=_value(instance.status),
+                changed_fields=(), deleted=True
+            ))
+        elif isinstance(instance, Payment):
+            events.append(PaymentRecorded(
+                payment_id=instance.id, reservation_id=instance.reservation_id,
+                amount=instance.amount, currency=instance.currency,
+                payment_method=_value(instance.payment_method),
+                status=_value(instance.status), previous_status=_value(instance.status),
+                deleted=True
+            ))
+
+    return events
+
+
+def install_event_hooks(session_factory, bus: EventBus = event_bus):
+    """
+    Registra los eventos de sesión que alimentan el bus
+
+    Args:
+        session_factory: sessionmaker (o clase Session) a instrumentar
+        bus: Bus donde publicar los eventos
+    """
+
+    @event.listens_for(session_factory, "after_flush")
+    def _collect(session: Session, flush_context):
+        events = _collect_events(session)
+        if events:
+            session.info.setdefault("domain_events", []).extend(events)
+
+    @event.listens_for(session_factory, "after_commit")
+    def _publish(session: Session):
+        events = session.info.pop("domain_events", None)
+        if events:
+            bus.publish(events)
+
+    @event.listens_for(session_factory, "after_rollback")
+    def _discard(session: Session):
+        session.info.pop("domain_events", None)
@@ -0,0 +1,239 @@
+"""
+Instrumentación de peticiones y consultas SQL
+
+- Middleware que mide tiempo total, tiempo en base de datos y número de
+  consultas por petición, y los expone en el encabezado `Server-Timing`.
+- Hooks de SQLAlchemy que atribuyen cada consulta a la petición en curso y
+  registran las consultas lentas junto con la ruta que las originó.
+- Histogramas por ruta exportados en formato de texto de Prometheus.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("sigho.slow_query")
+
+
+# Límites de los buckets de los histogramas
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class RequestStats:
+    """Estadísticas acumuladas durante una petición"""
+
+    __slots__ = ("scope", "db_time", "query_count")
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.db_time = 0.0
+        self.query_count = 0
+
+    @property
+    def route(self) -> str:
+        """Plantilla de la ruta atendida (ej. /api/rooms/{room_id})"""
+        return route_label(self.scope)
+
+
+# Estadísticas de la petición en curso. El objeto es mutable, por lo que las
+# consultas ejecutadas en el threadpool de FastAPI también quedan registradas.
+_current_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def route_label(scope: Scope) -> str:
+    """Obtiene la plantilla de la ruta para usarla como etiqueta de métricas"""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path or "unmatched"
+
+
+class Histogram:
+    """Histograma acumulativo compatible con Prometheus"""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # último = +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """Registra una observación"""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> List[str]:
+        """Genera las líneas _bucket, _sum y _count"""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        cumulative += self.counts[-1]
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.total:.6f}")
+        lines.append(f"{name}_count{{{labels}}} {self.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Almacena las métricas por (método, ruta) de forma segura entre hilos"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._duration: Dict[Tuple[str, str], Histogram] = {}
+        self._db_duration: Dict[Tuple[str, str], Histogram] = {}
+        self._queries: Dict[Tuple[str, str], Histogram] = {}
+        self._responses: Dict[Tuple[str, str, int], int] = {}
+        self._slow_queries: Dict[str, int] = {}
+        self._db_lock_retries = 0
+        self._db_lock_errors = 0
+
+    def observe_request(self, method: str, route: str, status_code: int,
+                        duration: float, stats: RequestStats):
+        """Registra una petición terminada"""
+        key = (method, route)
+        with self._lock:
+            if key not in self._duration:
+                self._duration[key] = Histogram(DURATION_BUCKETS)
+                self._db_duration[key] = Histogram(DURATION_BUCKETS)
+                self._queries[key] = Histogram(QUERY_COUNT_BUCKETS)
+            self._duration[key].observe(duration)
+            self._db_duration[key].observe(stats.db_time)
+            self._queries[key].observe(stats.query_count)
+            status_key = (method, route, status_code)
+            self._responses[status_key] = self._responses.get(status_key, 0) + 1
+
+    def observe_slow_query(self, route: str):
+        """Cuenta una consulta lenta para la ruta"""
+        with self._lock:
+            self._slow_queries[route] = self._slow_queries.get(route, 0) + 1
+
+    def observe_db_lock(self, retried: bool):
+        """Cuenta un bloqueo de SQLite reintentado o que terminó en error"""
+        with self._lock:
+            if retried:
+                self._db_lock_retries += 1
+            else:
+                self._db_lock_errors += 1
+
+    def render(self) -> str:
+        """Exporta todas las métricas en formato de texto de Prometheus"""
+        lines = []
+        with self._lock:
+            lines.append("# HELP sigho_http_requests_total Peticiones HTTP atendidas")
+            lines.append("# TYPE sigho_http_requests_total counter")
+            for (method, route, code), count in sorted(self._responses.items()):
+                lines.append(
+                    f'sigho_http_requests_total{{method="{method}",route="{route}",status="{code}"}} {count}'
+                )
+
+            histograms = (
+                ("sigho_http_request_duration_seconds", "Tiempo total de la petición", self._duration),
+                ("sigho_db_duration_seconds", "Tiempo en base de datos por petición", self._db_duration),
+                ("sigho_db_queries_per_request", "Consultas SQL por petición", self._queries),
+            )
+            for name, description, series in histograms:
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} histogram")
+                for (method, route), histogram in sorted(series.items()):
+                    lines.extend(histogram.render(name, f'method="{method}",route="{route}"'))
+
+            lines.append("# HELP sigho_db_slow_queries_total Consultas que superaron el umbral")
+            lines.append("# TYPE sigho_db_slow_queries_total counter")
+            for route, count in sorted(self._slow_queries.items()):
+                lines.append(f'sigho_db_slow_queries_total{{route="{route}"}} {count}')
+
+            lines.append("# HELP sigho_db_lock_retries_total Sentencias reintentadas por base bloqueada")
+            lines.append("# TYPE sigho_db_lock_retries_total counter")
+            lines.append(f"sigho_db_lock_retries_total {self._db_lock_retries}")
+            lines.append("# HELP sigho_db_lock_errors_total Bloqueos que agotaron los reintentos")
+            lines.append("# TYPE sigho_db_lock_errors_total counter")
+            lines.append(f"sigho_db_lock_errors_total {self._db_lock_errors}")
+
+        return "\n".join(lines) + "\n"
+
+
+# Registro global de métricas
+metrics_registry = MetricsRegistry()
+
+
+def instrument_engine(engine: Engine, slow_query_threshold_ms: float):
+    """
+    Registra los hooks de SQLAlchemy que miden cada consulta
+
+    Args:
+        engine: Motor de base de datos
+        slow_query_threshold_ms: Umbral (ms) a partir del cual se registra la consulta
+    """
+    threshold = slow_query_threshold_ms / 1000
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.db_time += elapsed
+            stats.query_count += 1
+
+        if threshold and elapsed >= threshold:
+            route = stats.route if stats is not None else "background"
+            metrics_registry.observe_slow_query(route)
+            logger.warning(
+                "Consulta lenta (%.1f ms) en %s: %s",
+                elapsed * 1000, route, " ".join(statement.split())
+            )
+
+
+class TimingMiddleware:
+    """Mide cada petición y agrega el encabezado Server-Timing"""
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics_registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - start
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append(
+                    "Server-Timing",
+                    f'app;dur={elapsed * 1000:.1f}, '
+                    f'db;dur={stats.db_time * 1000:.1f};desc="{stats.query_count} queries"'
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            self.registry.observe_request(
+                scope["method"], stats.route, status_code, time.perf_counter() - start, stats
+            )
@@ -0,0 +1,236 @@
+"""
+Profiler en proceso para diagnóstico en producción
+
+Permite perfilar las próximas N peticiones a una ruta concreta. Mientras no
+hay una sesión activa no se instala nada: al armar una ruta se envuelve la
+función del endpoint (`route.dependant.call`) y al terminar se restaura la
+original, por lo que el coste con el profiler desactivado es nulo.
+
+Modos:
+- "sampling": un hilo muestrea la pila del hilo que ejecuta el endpoint
+  cada `interval_ms` milisegundos.
+- "cprofile": cProfile determinista dentro del hilo del endpoint.
+
+El resultado se entrega en formato "collapsed stacks" (una línea
+`frame;frame;frame valor` por pila), compatible con flamegraph.pl y speedscope.
+"""
+import asyncio
+import cProfile
+import functools
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional, Set
+
+from fastapi.routing import APIRoute
+
+
+def _frame_label(code) -> str:
+    """Etiqueta legible para un frame: función (archivo:línea)"""
+    filename = code.co_filename.replace("\\", "/").rsplit("/", 2)
+    return f"{code.co_name} ({'/'.join(filename[-2:])}:{code.co_firstlineno})"
+
+
+class ProfilingSession:
+    """Estado de una sesión de perfilado sobre una ruta"""
+
+    def __init__(self, route: APIRoute, method: str, requests: int, mode: str, interval_ms: float):
+        self.route = route
+        self.method = method
+        self.requests = requests
+        self.mode = mode
+        self.interval = interval_ms / 1000
+        self.captured = 0
+        self.started_at = time.time()
+        self.finished = False
+        self.samples: Counter = Counter()
+        self.stats: Optional[pstats.Stats] = None
+        self.active_threads: Set[int] = set()
+        self._original_call: Optional[Callable] = None
+        self._sampler: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # ========== INSTALACIÓN ==========
+    def install(self):
+        """Envuelve el endpoint de la ruta"""
+        original = self.route.dependant.call
+        self._original_call = original
+
+        if asyncio.iscoroutinefunction(original):
+            @functools.wraps(original)
+            async def wrapper(*args, **kwargs):
+                if not self._claim():
+                    return await original(*args, **kwargs)
+                with self._profiling():
+                    return await original(*args, **kwargs)
+        else:
+            @functools.wraps(original)
+            def wrapper(*args, **kwargs):
+                if not self._claim():
+                    return original(*args, **kwargs)
+                with self._profiling():
+                    return original(*args, **kwargs)
+
+        self.route.dependant.call = wrapper
+
+        if self.mode == "sampling":
+            self._sampler = threading.Thread(target=self._sample_loop, name="sigho-profiler", daemon=True)
+            self._sampler.start()
+
+    def uninstall(self):
+        """Restaura el endpoint original"""
+        if self._original_call is not None:
+            self.route.dependant.call = self._original_call
+            self._original_call = None
+        self.finished = True
+
+    def _claim(self) -> bool:
+        """Reserva un cupo de perfilado para la petición actual"""
+        with self._lock:
+            if self.finished or self.captured + len(self.active_threads) >= self.requests:
+                return False
+            self.active_threads.add(threading.get_ident())
+            return True
+
+    def _release(self):
+        """Libera el cupo y desinstala la sesión al alcanzar N peticiones"""
+        with self._lock:
+            self.active_threads.discard(threading.get_ident())
+            self.captured += 1
+            done = self.captured >= self.requests
+        if done:
+            self.uninstall()
+
+    @contextmanager
+    def _profiling(self):
+        """Perfila el cuerpo del endpoint en el hilo actual"""
+        profile = None
+        if self.mode == "cprofile":
+            profile = cProfile.Profile()
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+                with self._lock:
+                    if self.stats is None:
+                        self.stats = pstats.Stats(profile)
+                    else:
+                        self.stats.add(profile)
+            self._release()
+
+    # ========== MUESTREO ==========
+    def _sample_loop(self):
+        """Toma muestras de la pila de los hilos activos hasta terminar la sesión"""
+        while not self.finished:
+            time.sleep(self.interval)
+            threads = tuple(self.active_threads)
+            if not threads:
+                continue
+            frames = sys._current_frames()
+            for ident in threads:
+                frame = frames.get(ident)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                self.samples[";".join(reversed(stack))] += 1
+
+    # ========== RESULTADOS ==========
+    def collapsed(self) -> str:
+        """Genera el perfil en formato collapsed stacks"""
+        if self.mode == "sampling":
+            counts = self.samples
+        else:
+            counts = _collapse_pstats(self.stats) if self.stats else Counter()
+        return "".join(f"{stack} {value}\n" for stack, value in counts.most_common())
+
+    def status(self) -> Dict:
+        """Resumen del estado de la sesión"""
+        return {
+            "route": self.route.path,
+            "method": self.method,
+            "mode": self.mode,
+            "requests": self.requests,
+            "captured": self.captured,
+            "finished": self.finished,
+            "started_at": self.started_at,
+        }
+
+
+def _collapse_pstats(stats: pstats.Stats, max_depth: int = 64) -> Counter:
+    """
+    Reconstruye pilas aproximadas a partir del grafo de llamadas de cProfile.
+    El tiempo propio de cada función se reparte entre sus llamadores en
+    proporción al tiempo acumulado de cada arco. Valores en microsegundos.
+    """
+    entries = stats.stats
+    children: Dict = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, caller_ct) in callers.items():
+            children.setdefault(caller, []).append((func, caller_ct))
+
+    def label(func) -> str:
+        filename, line, name = func
+        parts = filename.replace("\\", "/").rsplit("/", 2)
+        return f"{name} ({'/'.join(parts[-2:])}:{line})"
+
+    result: Counter = Counter()
+
+    def walk(func, weight: float, path: list, visited: set):
+        _, _, tt, ct, _ = entries[func]
+        if ct <= 0 or len(path) >= max_depth:
+            return
+        fraction = min(1.0, weight / ct)
+        path.append(label(func))
+        self_time = tt * fraction
+        if self_time > 0:
+            result[";".join(path)] += int(self_time * 1_000_000)
+        for child, edge_ct in children.get(func, ()):
+            if child not in visited and child in entries:
+                visited.add(child)
+                walk(child, edge_ct * fraction, path, visited)
+                visited.discard(child)
+        path.pop()
+
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    for root in roots:
+        walk(root, entries[root][3], [], {root})
+
+    return Counter({stack: value for stack, value in result.items() if value > 0})
+
+
+class RouteProfiler:
+    """Gestiona la (única) sesión de perfilado del proceso"""
+
+    def __init__(self):
+        self.session: Optional[ProfilingSession] = None
+        self._lock = threading.Lock()
+
+    def start(self, route: APIRoute, method: str, requests: int,
+              mode: str = "sampling", interval_ms: float = 5.0) -> ProfilingSession:
+        """Arma el profiler para las próximas `requests` peticiones de la ruta"""
+        with self._lock:
+            if self.session is not None and not self.session.finished:
+                raise RuntimeError("Ya hay una sesión de perfilado activa")
+            session = ProfilingSession(route, method, requests, mode, interval_ms)
+            session.install()
+            self.session = session
+            return session
+
+    def stop(self) -> Optional[ProfilingSession]:
+        """Cancela la sesión activa conservando lo capturado"""
+        with self._lock:
+            if self.session is not None:
+                self.session.uninstall()
+            return self.session
+
+
+# Instancia global del profiler
+route_profiler = RouteProfiler()
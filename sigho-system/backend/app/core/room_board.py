@@ -0,0 +1,139 @@
+"""
+Tablero de estado de habitaciones en tiempo real (WebSocket)
+
+Se suscribe al evento de dominio `RoomStatusChanged`, que se publica solo
+cuando la transacción se confirma, por lo que cualquier endpoint que cambie
+una habitación (cambio de estado, check-in/check-out/cancelación,
+mantenimiento) genera su delta sin código adicional. Cada mensaje lleva un
+número de secuencia para que el cliente detecte pérdidas y pida una nueva
+instantánea.
+
+El bus de eventos es local a cada proceso: con varios workers, mientras
+haya clientes conectados el tablero sondea la tabla de habitaciones cada
+ROOM_BOARD_POLL_SECONDS y publica los cambios hechos por otros procesos.
+"""
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fastapi import WebSocket
+
+from app.core.config import settings
+from app.core.events import RoomStatusChanged
+from app.database.session import SessionLocal
+from app.models.room import Room
+
+logger = logging.getLogger("sigho.room_board")
+
+
+class RoomBoard:
+    """Conexiones WebSocket y difusión de deltas de estado de habitaciones"""
+
+    def __init__(self):
+        self.clients: Set[WebSocket] = set()
+        self.seq = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        # Último estado publicado por habitación: (número, piso, activa, estado)
+        self._known: Dict[int, Tuple[str, int, bool, str]] = {}
+        self._poller: Optional[asyncio.Task] = None
+
+    async def connect(self, websocket: WebSocket):
+        """Acepta y registra un cliente"""
+        await websocket.accept()
+        self._loop = asyncio.get_running_loop()
+        self.clients.add(websocket)
+        if settings.WORKERS > 1 and (self._poller is None or self._poller.done()):
+            self._poller = asyncio.create_task(self._poll())
+
+    def disconnect(self, websocket: WebSocket):
+        """Elimina un cliente"""
+        self.clients.discard(websocket)
+
+    def publish(self, changes: List[Dict[str, Any]]):
+        """
+        Publica un delta. Puede llamarse desde los hilos del threadpool
+        donde se ejecutan los endpoints síncronos.
+        """
+        with self._lock:
+            self.seq += 1
+            message = {
+                "type": "room_status",
+                "seq": self.seq,
+                "timestamp": datetime.now().isoformat(),
+                "changes": changes
+            }
+        if not self.clients or self._loop is None or self._loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._broadcast(message), self._loop)
+
+    def on_room_status_changed(self, domain_event: RoomStatusChanged):
+        """Manejador del bus de eventos: publica el delta de la habitación"""
+        with self._lock:
+            self._known[domain_event.room_id] = (
+                domain_event.room_number, domain_event.floor,
+                domain_event.is_active, domain_event.status
+            )
+        self.publish([{
+            "room_id": domain_event.room_id,
+            "room_number": domain_event.room_number,
+            "floor": domain_event.floor,
+            "is_active": domain_event.is_active,
+            "status": domain_event.status,
+            "previous_status": domain_event.previous_status
+        }])
+
+    def _load_rooms(self) -> Dict[int, Tuple[str, int, bool, str]]:
+        """Estado actual de todas las habitaciones"""
+        db = SessionLocal()
+        try:
+            rows = db.query(Room.id, Room.room_number, Room.floor, Room.is_active, Room.status).all()
+        finally:
+            db.close()
+        return {row.id: (row.room_number, row.floor, row.is_active, row.status.value) for row in rows}
+
+    def _diff(self, rooms: Dict[int, Tuple[str, int, bool, str]]) -> List[Dict[str, Any]]:
+        """Cambios respecto del último estado publicado (y lo actualiza)"""
+        changes = []
+        with self._lock:
+            for room_id, state in rooms.items():
+                previous = self._known.get(room_id)
+                if previous is not None and previous != state:
+                    room_number, floor, is_active, room_status = state
+                    changes.append({
+                        "room_id": room_id,
+                        "room_number": room_number,
+                        "floor": floor,
+                        "is_active": is_active,
+                        "status": room_status,
+                        "previous_status": previous[3]
+                    })
+            self._known = rooms
+        return changes
+
+    async def _poll(self):
+        """Publica los cambios hechos por otros workers mientras haya clientes"""
+        while self.clients:
+            try:
+                # La primera lectura solo fija el estado de referencia
+                changes = self._diff(await asyncio.to_thread(self._load_rooms))
+            except Exception as e:
+                logger.warning("No se pudo sondear el estado de las habitaciones: %s", e)
+                changes = []
+            if changes:
+                self.publish(changes)
+            await asyncio.sleep(settings.ROOM_BOARD_POLL_SECONDS)
+
+    async def _broadcast(self, message: Dict[str, Any]):
+        """Envía el mensaje a todos los clientes, descartando los desconectados"""
+        for websocket in list(self.clients):
+            try:
+                await websocket.send_json(message)
+            except Exception:
+                self.disconnect(websocket)
+
+
+# Instancia global del tablero
+room_board = RoomBoard()
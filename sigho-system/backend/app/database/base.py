@@ -8,8 +8,13 @@ from app.models.user import User
 from app.models.room_type import RoomType
 from app.models.room import Room
 from app.models.guest import Guest
+from app.models.guest_stats import GuestStats
 from app.models.reservation import Reservation
 from app.models.payment import Payment
 from app.models.maintenance import Maintenance
 from app.models.inventory import Inventory
-from app.models.inventory_movement import InventoryMovement
\ No newline at end of file
+from app.models.inventory_movement import InventoryMovement
+from app.models.inventory_snapshot import InventorySnapshot
+from app.models.pricing import PricingRule, RoomRate
+from app.models.exchange_rate import ExchangeRate
+from app.models.archive import ArchivePartition
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Consultas que dependen del motor de base de datos
+
+La aplicación da los mismos resultados sobre SQLite y PostgreSQL; aquí se
+concentran los puntos donde cada motor tiene su propia forma de hacerlo:
+
+- Búsqueda de texto: ILIKE '%texto%' en ambos, con los comodines del
+  usuario escapados. En PostgreSQL con la extensión pg_trgm los índices
+  GIN de trigramas (migración 0003) resuelven el ILIKE sin recorrer la
+  tabla, y los resultados pueden ordenarse por similitud.
+- Códigos secuenciales (ej. número de factura): la lectura del último
+  número se serializa hasta el fin de la transacción, con un advisory lock
+  en PostgreSQL y tomando el bloqueo de escritura en SQLite.
+"""
+import zlib
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+def backend_name(db: Session) -> str:
+    """Motor de la sesión: "sqlite" o "postgresql" """
+    return db.get_bind().dialect.name
+
+
+@lru_cache(maxsize=None)
+def _has_extension(engine: Engine, name: str) -> bool:
+    """Extensión instalada en la base (se consulta una vez por motor)"""
+    with engine.connect() as connection:
+        return connection.execute(
+            text("SELECT 1 FROM pg_extension WHERE extname = :name"), {"name": name}
+        ).first() is not None
+
+
+def has_trigram_search(db: Session) -> bool:
+    """PostgreSQL con pg_trgm instalado"""
+    bind = db.get_bind()
+    return bind.dialect.name == "postgresql" and _has_extension(getattr(bind, "engine", bind), "pg_trgm")
+
+
+def text_search(columns: Sequence, value: str):
+    """
+    Filtro "alguna columna contiene `value`" sin distinguir mayúsculas
+
+    Los caracteres % y _ del texto buscado se toman literalmente.
+    """
+    return or_(*[column.icontains(value, autoescape=True) for column in columns])
+
+
+def similarity_rank(db: Session, columns: Sequence, value: str) -> Optional[Any]:
+    """
+    Expresión de similitud (pg_trgm) para ordenar resultados de búsqueda
+
+    Retorna None si el motor no la soporta; en ese caso se conserva el
+    orden propio de la consulta.
+    """
+    if not has_trigram_search(db):
+        return None
+    return func.greatest(*[func.similarity(column, value) for column in columns])
+
+
+def lock_sequence(db: Session, table: str):
+    """
+    Serializa la generación de códigos secuenciales de `table`
+
+    Debe llamarse antes de leer el último código; el bloqueo dura hasta el
+    commit o rollback de la sesión, de modo que dos procesos no calculen el
+    mismo número siguiente.
+    """
+    backend = backend_name(db)
+    if backend == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(zlib.crc32(table.encode()))))
+    elif backend == "sqlite":
+        # Una escritura vacía abre la transacción y toma el bloqueo de escritura
+        db.execute(text(f"DELETE FROM {table} WHERE 0"))
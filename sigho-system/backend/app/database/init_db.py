@@ -5,19 +5,35 @@ from sqlalchemy.orm import Session
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole
 from app.models.room_type import RoomType
+from app.models.amenity import Amenity
 from app.models.room import Room, RoomStatus
-from app.database.session import engine
-from app.database.base import Base
+from app.models.guest_stats import GuestStats
+from app.models.reservation import Reservation
+from app.services.guest_stats_service import guest_stats_service
+from app.services.pricing_service import pricing_service
 import random
 
 
+def refresh_derived_data(db: Session) -> None:
+    """
+    Completa los datos derivados que pueden faltar; el servidor lo ejecuta
+    en segundo plano después de arrancar
+    """
+    # Cargar la proyección de estadísticas de huéspedes si aún está vacía
+    if db.query(Reservation.id).first() and not db.query(GuestStats.guest_id).first():
+        print("[INFO] Construyendo estadisticas de huespedes...")
+        guest_stats_service.rebuild(db)
+    
+    # Completar la grilla de precios hasta el horizonte (solo fechas faltantes)
+    pricing_service.ensure_horizon(db)
+
+
 def init_db(db: Session) -> None:
     """
     Inicializa la base de datos con datos de prueba
     """
     
-    # Crear tablas
-    Base.metadata.create_all(bind=engine)
+    # El esquema lo crean y actualizan las migraciones (app/database/migrations.py)
     
     # Verificar si ya existen usuarios
     existing_user = db.query(User).first()
@@ -84,11 +100,7 @@ def init_db(db: Session) -> None:
             "base_price_ves": 50000.0,
             "base_price_usd": 25.0,
             "base_price_eur": 23.0,
-            "has_wifi": True,
-            "has_tv": True,
-            "has_ac": True,
-            "has_minibar": False,
-            "has_balcony": False
+            "amenities": ["WiFi", "TV", "Aire Acondicionado"]
         },
         {
             "name": "Doble",
@@ -97,11 +109,7 @@ def init_db(db: Session) -> None:
             "base_price_ves": 80000.0,
             "base_price_usd": 40.0,
             "base_price_eur": 37.0,
-            "has_wifi": True,
-            "has_tv": True,
-            "has_ac": True,
-            "has_minibar": False,
-            "has_balcony": True
+            "amenities": ["WiFi", "TV", "Aire Acondicionado", "Balcón"]
         },
         {
             "name": "Triple",
@@ -110,11 +118,7 @@ def init_db(db: Session) -> None:
             "base_price_ves": 120000.0,
             "base_price_usd": 60.0,
             "base_price_eur": 55.0,
-            "has_wifi": True,
-            "has_tv": True,
-            "has_ac": True,
-            "has_minibar": True,
-            "has_balcony": True
+            "amenities": ["WiFi", "TV", "Aire Acondicionado", "Minibar", "Balcón"]
         },
         {
             "name": "Suite Junior",
@@ -123,12 +127,7 @@ def init_db(db: Session) -> None:
             "base_price_ves": 150000.0,
             "base_price_usd": 75.0,
             "base_price_eur": 70.0,
-            "has_wifi": True,
-            "has_tv": True,
-            "has_ac": True,
-            "has_minibar": True,
-            "has_balcony": True,
-            "has_kitchen": False
+            "amenities": ["WiFi", "TV", "Aire Acondicionado", "Minibar", "Balcón"]
         },
         {
             "name": "Suite Presidencial",
@@ -137,18 +136,18 @@ def init_db(db: Session) -> None:
             "base_price_ves": 300000.0,
             "base_price_usd": 150.0,
             "base_price_eur": 140.0,
-            "has_wifi": True,
-            "has_tv": True,
-            "has_ac": True,
-            "has_minibar": True,
-            "has_balcony": True,
-            "has_kitchen": True
+            "amenities": ["WiFi", "TV", "Aire Acondicionado", "Minibar", "Balcón", "Cocina"]
         }
     ]
     
+    # Catálogo de amenidades cargado por la migración 0002
+    amenities = {amenity.name: amenity for amenity in db.query(Amenity).all()}
+    
     room_types = []
     for rt_data in room_types_data:
+        amenity_names = rt_data.pop("amenities")
         rt = RoomType(**rt_data)
+        rt.amenities = [amenities[name] for name in amenity_names if name in amenities]
         db.add(rt)
         room_types.append(rt)
     
@@ -206,10 +205,10 @@ def init_db(db: Session) -> None:
         # Pasar al siguiente piso
         room_number = (floor + 1) * 100 + 1
     
-    # 2 suites presidenciales en el piso 5
+    # 2 suites presidenciales en el piso 5 (después de las 14 habitaciones del piso)
     for i in range(2):
         room = Room(
-            room_number=f"50{i+1}",
+            room_number=str(515 + i),
             floor=5,
             room_type_id=room_types[4].id,  # Suite Presidencial
             status=RoomStatus.AVAILABLE
@@ -219,6 +218,9 @@ def init_db(db: Session) -> None:
     db.commit()
     print("[OK] Habitaciones creadas")
     
+    # Grilla de precios de los tipos recién creados
+    pricing_service.ensure_horizon(db)
+    
     print("[SUCCESS] Base de datos inicializada correctamente!")
     print("\n[INFO] Credenciales de acceso:")
     print("   Admin: admin / admin123")
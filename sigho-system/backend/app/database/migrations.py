@@ -0,0 +1,119 @@
+"""
+Migraciones de esquema (Alembic)
+
+El esquema se versiona con las revisiones de backend/alembic/versions. Al
+arrancar solo se compara la revisión guardada en alembic_version con la
+última revisión de los scripts (una consulta), en lugar de reflejar todas
+las tablas con Base.metadata.create_all.
+
+- Base nueva o creada antes de Alembic (sin alembic_version): se migra
+  hasta la última revisión; la revisión base crea solo lo que falte.
+- Base atrasada: se migra si DB_AUTO_MIGRATE está activo; si no, el
+  servidor no arranca hasta ejecutar `alembic upgrade head`.
+- Base en una revisión desconocida (código más antiguo que la base): error.
+
+Alembic solo se importa cuando hay que migrar: cuando la base está al día
+la última revisión se lee directamente de los archivos de versiones.
+"""
+import os
+import re
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+from app.database.session import engine as default_engine
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ALEMBIC_INI = os.path.join(BACKEND_DIR, "alembic.ini")
+VERSIONS_DIR = os.path.join(BACKEND_DIR, "alembic", "versions")
+VERSION_TABLE = "alembic_version"
+
+# revision: str = '0002' / down_revision: Union[str, None] = '0001'
+REVISION_PATTERN = re.compile(r"^(revision|down_revision)\b[^=\n]*=\s*['\"]?(\w+)['\"]?\s*$", re.MULTILINE)
+
+
+class SchemaVersionError(RuntimeError):
+    """La base de datos no está en una revisión compatible con el código"""
+
+
+def alembic_config(connection: Optional[Connection] = None):
+    """Configuración de Alembic independiente del directorio de trabajo"""
+    from alembic.config import Config
+
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    config.attributes["configure_logging"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def script_head() -> Optional[str]:
+    """
+    Última revisión de los scripts sin importar Alembic
+
+    Retorna None si no hay una única cabeza reconocible (por ejemplo, una
+    revisión de fusión); en ese caso se consulta a Alembic.
+    """
+    revisions, parents = set(), set()
+    for name in os.listdir(VERSIONS_DIR):
+        if not name.endswith(".py"):
+            continue
+        with open(os.path.join(VERSIONS_DIR, name), encoding="utf-8") as f:
+            found = dict(REVISION_PATTERN.findall(f.read()))
+        if "revision" not in found:
+            return None
+        revisions.add(found["revision"])
+        parents.add(found.get("down_revision"))
+    heads = revisions - parents
+    return heads.pop() if len(heads) == 1 else None
+
+
+def current_revision(connection: Connection) -> Optional[str]:
+    """Revisión guardada en la base (None si nunca se migró)"""
+    if not inspect(connection).has_table(VERSION_TABLE):
+        return None
+    return connection.execute(text(f"SELECT version_num FROM {VERSION_TABLE}")).scalar()
+
+
+def ensure_schema(engine: Optional[Engine] = None, auto_migrate: Optional[bool] = None) -> str:
+    """
+    Verifica la versión del esquema y migra cuando corresponde
+
+    Returns:
+        Revisión en la que queda la base de datos
+    """
+    engine = engine or default_engine
+    auto_migrate = settings.DB_AUTO_MIGRATE if auto_migrate is None else auto_migrate
+
+    with engine.connect() as connection:
+        current = current_revision(connection)
+    head = script_head()
+    if head is not None and current == head:
+        return head
+
+    from alembic import command
+    from alembic.script import ScriptDirectory
+
+    script = ScriptDirectory.from_config(alembic_config())
+    head = script.get_current_head()
+    if current == head:
+        return head
+
+    if current is not None:
+        if current not in {revision.revision for revision in script.walk_revisions()}:
+            raise SchemaVersionError(
+                f"La base de datos está en la revisión {current}, desconocida para esta versión"
+            )
+        if not auto_migrate:
+            raise SchemaVersionError(
+                f"La base de datos está en la revisión {current} y se requiere {head}: "
+                "ejecute 'alembic upgrade head'"
+            )
+
+    print(f"[INFO] Migrando esquema de la base de datos: {current or 'sin versión'} -> {head}")
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), "head")
+    return head
@@ -0,0 +1,28 @@
+"""
+Conexiones PostgreSQL
+
+Se usa cuando DATABASE_URL es postgresql+psycopg2://... El motor mantiene
+un pool de conexiones por proceso: con varios workers el servidor puede
+llegar a abrir WORKERS * (DB_POOL_SIZE + DB_MAX_OVERFLOW) conexiones, que
+deben caber en max_connections.
+
+Las sesiones usan la zona horaria UTC, igual que CURRENT_TIMESTAMP en
+SQLite, de modo que las fechas sin zona que escribe la aplicación y las
+que genera la base se comparan y agrupan por día igual en ambos motores.
+"""
+from app.core.config import settings
+
+
+def engine_options() -> dict:
+    """Argumentos de create_engine para PostgreSQL"""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,  # Descarta las conexiones cerradas por el servidor
+        "connect_args": {
+            "application_name": "sigho",
+            "options": f"-c timezone=UTC -c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+        }
+    }
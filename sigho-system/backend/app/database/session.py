@@ -1,18 +1,30 @@
 """
-Configuración de la sesión de base de datos SQLite3
+Configuración de la sesión de base de datos
+
+El motor se elige por DATABASE_URL: SQLite (por defecto) o PostgreSQL.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.database import postgres, sqlite
 
-# Crear motor de SQLite3
-# check_same_thread=False es necesario para FastAPI
-engine = create_engine(
-    settings.DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    echo=settings.DEBUG  # Muestra las consultas SQL en consola si DEBUG=True
-)
+if make_url(settings.DATABASE_URL).get_backend_name() == "postgresql":
+    # Pool de conexiones y sesiones en UTC (ver app/database/postgres.py)
+    engine = create_engine(
+        settings.DATABASE_URL,
+        echo=settings.DEBUG,
+        **postgres.engine_options()
+    )
+else:
+    # WAL, espera por bloqueo y reintentos para varios workers (ver app/database/sqlite.py)
+    engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args=sqlite.connect_args(),
+        echo=settings.DEBUG  # Muestra las consultas SQL en consola si DEBUG=True
+    )
+    event.listen(engine, "connect", sqlite.configure_connection)
 
 # Crear sesión local
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
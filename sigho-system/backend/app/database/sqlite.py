@@ -0,0 +1,98 @@
+"""
+Conexiones SQLite para varios procesos
+
+Con varios workers cada proceso tiene su propio pool y todos escriben el
+mismo archivo. Para que no aparezca "database is locked":
+
+- WAL: los lectores no bloquean al escritor ni el escritor a los lectores.
+- busy timeout (SQLITE_BUSY_TIMEOUT_MS): quien no obtiene el bloqueo de
+  escritura espera en lugar de fallar.
+- Reintento con espera exponencial: si aun así SQLite responde bloqueada
+  (se agotó la espera, o la instantánea de lectura quedó vieja y SQLite
+  falla sin esperar), se reintenta. Solo se reintenta la primera sentencia
+  de una transacción, cuando todavía no escribió nada, y el COMMIT; un
+  bloqueo a mitad de una transacción se propaga, porque repetir esa
+  sentencia sola no es seguro.
+
+El módulo sqlite3 abre la transacción justo antes del primer
+INSERT/UPDATE/DELETE y la sesión no hace autoflush, de modo que en los
+endpoints de escritura esa primera sentencia suele ser la del commit.
+"""
+import random
+import sqlite3
+import time
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+# Espera máxima entre reintentos
+MAX_RETRY_DELAY = 1.0
+
+
+def is_lock_error(error: Exception) -> bool:
+    """SQLITE_BUSY ("database is locked") o SQLITE_LOCKED ("database table is locked")"""
+    return "locked" in str(error)
+
+
+def _retry(connection: sqlite3.Connection, operation, rollback: bool):
+    """Ejecuta la operación reintentando los bloqueos con espera exponencial"""
+    attempt = 0
+    while True:
+        try:
+            return operation()
+        except sqlite3.OperationalError as e:
+            if not is_lock_error(e):
+                raise
+            if attempt >= settings.SQLITE_LOCK_RETRIES:
+                metrics_registry.observe_db_lock(retried=False)
+                raise
+            metrics_registry.observe_db_lock(retried=True)
+            if rollback and connection.in_transaction:
+                # La transacción no escribió nada: se descarta su instantánea
+                connection.rollback()
+            delay = min(settings.SQLITE_RETRY_BASE_MS / 1000 * 2 ** attempt, MAX_RETRY_DELAY)
+            time.sleep(delay * random.uniform(0.5, 1.5))
+            attempt += 1
+
+
+class RetryingCursor(sqlite3.Cursor):
+    """Cursor que reintenta la primera sentencia de cada transacción"""
+
+    def execute(self, *args):
+        if self.connection.in_transaction:
+            return super().execute(*args)
+        return _retry(self.connection, lambda: super(RetryingCursor, self).execute(*args), rollback=True)
+
+    def executemany(self, *args):
+        if self.connection.in_transaction:
+            return super().executemany(*args)
+        return _retry(self.connection, lambda: super(RetryingCursor, self).executemany(*args), rollback=True)
+
+
+class RetryingConnection(sqlite3.Connection):
+    """Conexión cuyos cursores y COMMIT reintentan los bloqueos"""
+
+    def cursor(self, factory=RetryingCursor):
+        return super().cursor(factory)
+
+    def commit(self):
+        # Un COMMIT bloqueado conserva la transacción: basta con repetirlo
+        return _retry(self, super().commit, rollback=False)
+
+
+def connect_args() -> dict:
+    """Argumentos de sqlite3.connect para el motor de la aplicación"""
+    return {
+        "check_same_thread": False,  # Necesario para FastAPI
+        "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        "factory": RetryingConnection
+    }
+
+
+def configure_connection(dbapi_connection, connection_record):
+    """PRAGMAs de cada conexión nueva (evento "connect" del motor)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    # En WAL, NORMAL solo sincroniza en los checkpoints y sigue siendo seguro ante caídas del proceso
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
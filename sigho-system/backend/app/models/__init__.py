@@ -5,13 +5,18 @@ from app.models.user import User, UserRole
 from app.models.room_type import RoomType
 from app.models.room import Room, RoomStatus
 from app.models.guest import Guest
+from app.models.guest_stats import GuestStats
 from app.models.reservation import Reservation, ReservationStatus
 from app.models.payment import Payment, PaymentMethod, PaymentStatus
 from app.models.maintenance import Maintenance, MaintenanceType, MaintenancePriority, MaintenanceStatus
 from app.models.inventory import Inventory, InventoryCategory
 from app.models.inventory_movement import InventoryMovement, MovementType
+from app.models.inventory_snapshot import InventorySnapshot
 from app.models.amenity import Amenity, RoomTypeAmenity, AmenityCategory
+from app.models.pricing import PricingRule, PricingRuleType, RoomRate
+from app.models.exchange_rate import ExchangeRate
 from app.models.invoice import Invoice, InvoiceItem, InvoiceStatus, DocumentType
+from app.models.archive import ArchivePartition
 
 __all__ = [
     "User",
@@ -20,6 +25,7 @@ __all__ = [
     "Room",
     "RoomStatus",
     "Guest",
+    "GuestStats",
     "Reservation",
     "ReservationStatus",
     "Payment",
@@ -33,12 +39,18 @@ __all__ = [
     "InventoryCategory",
     "InventoryMovement",
     "MovementType",
+    "InventorySnapshot",
     "Amenity",
     "RoomTypeAmenity",
     "AmenityCategory",
+    "PricingRule",
+    "PricingRuleType",
+    "RoomRate",
+    "ExchangeRate",
     "Invoice",
     "InvoiceItem",
     "InvoiceStatus",
     "DocumentType",
+    "ArchivePartition",
 ]
 
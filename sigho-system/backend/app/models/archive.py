@@ -0,0 +1,39 @@
+"""
+Modelo de Partición de Archivo
+"""
+from sqlalchemy import Column, Integer, String, Date, DateTime
+from sqlalchemy.sql import func
+from app.database.session import Base
+
+
+class ArchivePartition(Base):
+    """
+    Año archivado en la base de archivo
+
+    Resume las reservas cerradas (con sus pagos y facturas) y los
+    movimientos de inventario de un año que se movieron fuera de las tablas
+    activas. `min_date` y `max_date` abarcan todas las fechas de esas filas
+    (estadías, pagos, facturas y movimientos) y permiten decidir si una
+    consulta por rango de fechas debe incluir la base de archivo.
+    """
+    __tablename__ = "archive_partitions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(20), unique=True, nullable=False)  # Año, ej: "2023"
+    
+    # Rango de fechas cubierto
+    min_date = Column(Date, nullable=True)
+    max_date = Column(Date, nullable=True)
+    
+    # Filas archivadas
+    reservation_count = Column(Integer, nullable=False, default=0)
+    payment_count = Column(Integer, nullable=False, default=0)
+    invoice_count = Column(Integer, nullable=False, default=0)
+    movement_count = Column(Integer, nullable=False, default=0)
+    
+    # Auditoría
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ArchivePartition {self.name}: {self.min_date} - {self.max_date}>"
@@ -0,0 +1,35 @@
+"""
+Modelo de Tasa de Cambio
+"""
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database.session import Base
+
+
+class ExchangeRate(Base):
+    """
+    Tasa de cambio diaria de una moneda
+
+    `rate` es el valor de 1 unidad de `currency` expresado en la moneda
+    pivote (settings.EXCHANGE_PIVOT_CURRENCY). Para una fecha se usa la
+    tasa más reciente publicada en o antes de esa fecha.
+    """
+    __tablename__ = "exchange_rates"
+    __table_args__ = (
+        # También sirve la búsqueda "última tasa <= fecha" de cada moneda
+        UniqueConstraint("currency", "rate_date", name="uq_exchange_rate_currency_date"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    currency = Column(String(3), nullable=False)
+    rate_date = Column(Date, nullable=False)
+    rate = Column(Float, nullable=False)
+    source = Column(String(100), nullable=True)  # BCV, banco, manual, etc.
+    
+    # Auditoría
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<ExchangeRate {self.currency} {self.rate_date}: {self.rate}>"
@@ -0,0 +1,41 @@
+"""
+Modelo de Estadísticas de Huésped (proyección)
+"""
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, JSON
+from sqlalchemy.orm import relationship
+from app.database.session import Base
+
+
+class GuestStats(Base):
+    """
+    Estadísticas acumuladas de un huésped
+
+    Es una proyección derivada de reservas y pagos: se recalcula al
+    confirmarse cambios en ellos (ver guest_stats_service) y puede
+    reconstruirse completa con scripts/rebuild_guest_stats.py.
+    """
+    __tablename__ = "guest_stats"
+    
+    guest_id = Column(Integer, ForeignKey("guests.id"), primary_key=True)
+    
+    # Reservas
+    reservation_count = Column(Integer, nullable=False, default=0)  # Todas las reservas
+    stay_count = Column(Integer, nullable=False, default=0)         # Estadías (check-in realizado)
+    cancelled_count = Column(Integer, nullable=False, default=0)    # Canceladas y no presentadas
+    total_nights = Column(Integer, nullable=False, default=0, index=True)
+    
+    # Gasto: pagos completados por moneda, ej. {"USD": 350.0, "VES": 1200.0}
+    total_spent = Column(JSON, nullable=False, default=dict)
+    
+    # Última estadía
+    first_stay_date = Column(Date, nullable=True)
+    last_stay_date = Column(Date, nullable=True, index=True)
+    
+    # Auditoría
+    updated_at = Column(DateTime, nullable=True)
+    
+    # Relaciones
+    guest = relationship("Guest")
+    
+    def __repr__(self):
+        return f"<GuestStats {self.guest_id}: {self.reservation_count} reservas>"
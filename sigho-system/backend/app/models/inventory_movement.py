@@ -1,7 +1,7 @@
 """
 Modelo de Movimiento de Inventario
 """
-from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Enum, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.session import Base
@@ -19,6 +19,10 @@ class MovementType(str, enum.Enum):
 class InventoryMovement(Base):
     """Modelo de Movimiento de Inventario"""
     __tablename__ = "inventory_movements"
+    __table_args__ = (
+        # Consultas de existencia histórica: movimientos de un item en un rango de fechas
+        Index("ix_inventory_movements_item_date", "inventory_id", "movement_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     movement_code = Column(String(20), unique=True, nullable=False, index=True)
@@ -0,0 +1,37 @@
+"""
+Modelo de Instantánea de Existencias
+"""
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database.session import Base
+
+
+class InventorySnapshot(Base):
+    """
+    Existencia de un item al cierre de un día
+
+    `cutoff_at` es el inicio del día siguiente: la instantánea incluye todos
+    los movimientos con `movement_date < cutoff_at`. Una consulta histórica
+    parte de la instantánea más cercana y aplica solo los movimientos
+    posteriores a ese corte.
+    """
+    __tablename__ = "inventory_snapshots"
+    __table_args__ = (
+        UniqueConstraint("inventory_id", "snapshot_date", name="uq_inventory_snapshot_item_date"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    inventory_id = Column(Integer, ForeignKey("inventory.id"), nullable=False, index=True)
+    snapshot_date = Column(Date, nullable=False, index=True)
+    cutoff_at = Column(DateTime, nullable=False)
+    
+    # Existencia y costo al cierre
+    quantity = Column(Integer, nullable=False)
+    unit_cost = Column(Float, nullable=False, default=0.0)
+    currency = Column(String(3), nullable=False)
+    
+    # Auditoría
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<InventorySnapshot {self.inventory_id} @ {self.snapshot_date}: {self.quantity}>"
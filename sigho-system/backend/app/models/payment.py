@@ -36,13 +36,13 @@ class Payment(Base):
     payment_code = Column(String(20), unique=True, nullable=False, index=True)
     
     # Relaciones
-    reservation_id = Column(Integer, ForeignKey("reservations.id"), nullable=False)
+    reservation_id = Column(Integer, ForeignKey("reservations.id"), nullable=False, index=True)
     processed_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Información del pago
     amount = Column(Float, nullable=False)
-    currency = Column(String(3), nullable=False)  # VES, USD, EUR
-    payment_method = Column(Enum(PaymentMethod), nullable=False)
+    currency = Column(String(3), nullable=False, index=True)  # VES, USD, EUR
+    payment_method = Column(Enum(PaymentMethod), nullable=False, index=True)
     status = Column(Enum(PaymentStatus), default=PaymentStatus.PENDING, nullable=False)
     
     # Detalles adicionales
@@ -52,7 +52,7 @@ class Payment(Base):
     notes = Column(Text, nullable=True)
     
     # Auditoría
-    payment_date = Column(DateTime(timezone=True), server_default=func.now())
+    payment_date = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -0,0 +1,90 @@
+"""
+Modelos de Tarifas (reglas de precio y grilla de precios por noche)
+"""
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Enum, ForeignKey, Boolean, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database.session import Base
+import enum
+
+
+class PricingRuleType(str, enum.Enum):
+    """Tipos de regla de precio"""
+    SEASON = "season"                  # Temporada (rango de fechas)
+    DAY_OF_WEEK = "day_of_week"        # Días de la semana (ej. fines de semana)
+    LENGTH_OF_STAY = "length_of_stay"  # Descuento por estadía larga
+    OCCUPANCY = "occupancy"            # Ajuste según ocupación del tipo de habitación
+
+
+class PricingRule(Base):
+    """
+    Regla de precio
+
+    `adjustment_percent` se aplica sobre el precio base (ej. 20 = +20%,
+    -10 = -10%). Por cada tipo de regla se aplica la coincidente de mayor
+    prioridad y los ajustes de distintos tipos se multiplican.
+    """
+    __tablename__ = "pricing_rules"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    rule_type = Column(Enum(PricingRuleType), nullable=False, index=True)
+    
+    # Alcance (sin tipo de habitación aplica a todos; sin fechas aplica siempre)
+    room_type_id = Column(Integer, ForeignKey("room_types.id"), nullable=True, index=True)
+    start_date = Column(Date, nullable=True)
+    end_date = Column(Date, nullable=True)
+    
+    # Condiciones según el tipo de regla
+    days_of_week = Column(String(20), nullable=True)  # "4,5" = viernes y sábado (0 = lunes)
+    min_nights = Column(Integer, nullable=True)       # LENGTH_OF_STAY
+    min_occupancy = Column(Float, nullable=True)      # OCCUPANCY, porcentaje 0-100
+    
+    # Ajuste
+    adjustment_percent = Column(Float, nullable=False)
+    priority = Column(Integer, nullable=False, default=0)
+    
+    # Estado
+    is_active = Column(Boolean, default=True)
+    
+    # Auditoría
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Relaciones
+    room_type = relationship("RoomType")
+    
+    @property
+    def weekdays(self):
+        """Días de la semana como conjunto de enteros"""
+        if not self.days_of_week:
+            return set()
+        return {int(day) for day in self.days_of_week.split(",") if day.strip()}
+    
+    def __repr__(self):
+        return f"<PricingRule {self.name} ({self.rule_type}) {self.adjustment_percent:+}%>"
+
+
+class RoomRate(Base):
+    """
+    Precio por noche materializado de un tipo de habitación
+
+    Resultado de aplicar temporadas, días de la semana y ocupación al
+    precio base. Cotizar una estadía es sumar las filas de sus noches.
+    """
+    __tablename__ = "room_rates"
+    __table_args__ = (
+        UniqueConstraint("room_type_id", "rate_date", "currency", name="uq_room_rate_type_date_currency"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    room_type_id = Column(Integer, ForeignKey("room_types.id"), nullable=False)
+    rate_date = Column(Date, nullable=False, index=True)
+    currency = Column(String(3), nullable=False)
+    price = Column(Float, nullable=False)
+    
+    # Ajuste total aplicado sobre el precio base (porcentaje)
+    adjustment_percent = Column(Float, nullable=False, default=0.0)
+    
+    def __repr__(self):
+        return f"<RoomRate {self.room_type_id} {self.rate_date} {self.currency} {self.price}>"
@@ -0,0 +1,44 @@
+"""
+Schemas de Analítica (Pydantic)
+"""
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+
+# ========== Response ==========
+class AnalyticsStatus(BaseModel):
+    """Schema de respuesta con la disponibilidad del motor analítico"""
+    available: bool
+    engine: str
+    version: Optional[str] = None
+    source: str
+    detail: Optional[str] = None
+
+
+class OccupancyCubeRow(BaseModel):
+    """Métricas de un período y tipo de habitación (room_type_id None = hotel)"""
+    period: date
+    room_type_id: Optional[int] = None
+    room_type_name: Optional[str] = None
+    available_nights: int
+    sold_nights: int
+    unconverted_nights: int
+    revenue: float
+    occupancy_rate: Optional[float] = None
+    adr: Optional[float] = None
+    revpar: Optional[float] = None
+    previous_occupancy_rate: Optional[float] = None
+    previous_adr: Optional[float] = None
+    previous_revpar: Optional[float] = None
+    revpar_change: Optional[float] = None
+
+
+class OccupancyCube(BaseModel):
+    """Schema de respuesta del cubo de ocupación, ADR y RevPAR"""
+    start_date: date
+    end_date: date
+    granularity: str
+    base_currency: str
+    elapsed_ms: float
+    rows: List[OccupancyCubeRow]
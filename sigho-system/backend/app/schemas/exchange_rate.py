@@ -0,0 +1,38 @@
+"""
+Schemas de Tasa de Cambio (Pydantic)
+"""
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import date, datetime
+
+
+class ExchangeRateBase(BaseModel):
+    """Schema base de tasa de cambio"""
+    currency: str = Field(..., min_length=3, max_length=3)
+    rate_date: date
+    rate: float = Field(..., gt=0)  # Valor de 1 unidad en la moneda pivote
+    source: Optional[str] = Field(None, max_length=100)
+
+
+class ExchangeRateCreate(ExchangeRateBase):
+    """Schema para registrar (o reemplazar) la tasa de una fecha"""
+    pass
+
+
+class ExchangeRateResponse(ExchangeRateBase):
+    """Schema de respuesta de tasa de cambio"""
+    id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class CurrencyConversion(BaseModel):
+    """Resultado de una conversión puntual"""
+    amount: float
+    currency: str
+    base_currency: str
+    on_date: date
+    converted_amount: Optional[float] = None  # None si falta alguna tasa
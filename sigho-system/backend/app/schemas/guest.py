@@ -2,7 +2,7 @@
 Schemas de Huésped (Pydantic)
 """
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import Optional, Dict
 from datetime import date, datetime
 
 
@@ -62,4 +62,20 @@ class GuestInDB(GuestResponse):
 
 class GuestSearch(BaseModel):
     """Schema para buscar huéspedes"""
-    query: str = Field(..., min_length=2)  # Buscar por nombre, documento, email, teléfono
\ No newline at end of file
+    query: str = Field(..., min_length=2)  # Buscar por nombre, documento, email, teléfono
+
+
+class GuestStatsResponse(BaseModel):
+    """Schema de estadísticas acumuladas de un huésped"""
+    guest_id: int
+    reservation_count: int
+    stay_count: int
+    cancelled_count: int
+    total_nights: int
+    total_spent: Dict[str, float]  # Pagos completados por moneda
+    first_stay_date: Optional[date] = None
+    last_stay_date: Optional[date] = None
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
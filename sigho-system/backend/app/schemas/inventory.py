@@ -2,7 +2,7 @@
 Schemas de Inventario (Pydantic)
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 from app.models.inventory import InventoryCategory
 from app.models.inventory_movement import MovementType
@@ -105,4 +105,66 @@ class InventoryAdjustment(BaseModel):
     """Schema para ajustar inventario"""
     new_quantity: int = Field(..., ge=0)
     reason: str = Field(..., min_length=10)
-    notes: Optional[str] = None
\ No newline at end of file
+    notes: Optional[str] = None
+
+
+# ========== BATCH ==========
+class InventoryBatchLine(BaseModel):
+    """
+    Línea de una carga masiva de movimientos.
+    El item se identifica por `inventory_id` o `item_code`.
+    En ADJUSTMENT, `quantity` es la existencia contada (valor absoluto).
+    """
+    inventory_id: Optional[int] = None
+    item_code: Optional[str] = None
+    movement_type: MovementType
+    quantity: int = Field(..., ge=0)
+    reason: Optional[str] = Field(None, max_length=200)
+    notes: Optional[str] = None
+    reference_document: Optional[str] = Field(None, max_length=100)
+
+
+class InventoryMovementBatch(BaseModel):
+    """Schema para registrar movimientos en lote"""
+    movements: List[InventoryBatchLine] = Field(..., min_length=1, max_length=2000)
+    reason: str = Field("Carga masiva", min_length=5, max_length=200)
+    atomic: bool = False  # True: si una línea falla no se aplica ninguna
+
+
+class InventoryBatchLineResult(BaseModel):
+    """Resultado de una línea del lote"""
+    line: int
+    status: str  # applied, unchanged, error, rolled_back
+    inventory_id: Optional[int] = None
+    movement_code: Optional[str] = None
+    previous_quantity: Optional[int] = None
+    new_quantity: Optional[int] = None
+    error: Optional[str] = None
+
+
+class InventoryBatchResponse(BaseModel):
+    """Schema de respuesta de la carga masiva"""
+    committed: bool
+    applied: int
+    failed: int
+    results: List[InventoryBatchLineResult]
+
+
+# ========== FORECAST ==========
+class InventoryForecast(BaseModel):
+    """Pronóstico de consumo y punto de reorden de un item"""
+    inventory_id: int
+    item_code: str
+    name: str
+    category: InventoryCategory
+    unit_of_measure: str
+    current_quantity: int
+    minimum_quantity: int
+    daily_consumption: float
+    consumption_per_occupied_room: Optional[float] = None
+    occupancy_correlation: Optional[float] = None
+    model: str  # smoothing, occupancy
+    days_of_cover: Optional[float] = None
+    reorder_point: int
+    suggested_order_quantity: int
+    needs_reorder: bool
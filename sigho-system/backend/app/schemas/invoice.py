@@ -2,7 +2,7 @@
 Schemas de Factura (Pydantic)
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime, date
 from app.models.invoice import InvoiceStatus, DocumentType
 
@@ -111,6 +111,22 @@ class InvoiceListResponse(BaseModel):
         from_attributes = True
 
 
+# ========== SUMMARY ==========
+class CurrencyTotals(BaseModel):
+    """Totales de facturas en una moneda"""
+    count: int = 0
+    total_amount: float = 0.0
+    paid_amount: float = 0.0
+    balance: float = 0.0
+
+
+class InvoiceSummary(BaseModel):
+    """Resumen agregado de facturas para la cabecera del módulo"""
+    total: int
+    by_status: Dict[str, int]
+    by_currency: Dict[str, CurrencyTotals]
+
+
 # ========== GENERATE FROM RESERVATION ==========
 class InvoiceGenerateRequest(BaseModel):
     """Schema para generar factura desde reserva"""
@@ -2,7 +2,7 @@
 Schemas de Pago (Pydantic)
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Dict
 from datetime import datetime
 from app.models.payment import PaymentMethod, PaymentStatus
 
@@ -46,4 +46,21 @@ class PaymentResponse(PaymentBase):
 
 class PaymentInDB(PaymentResponse):
     """Schema de pago en base de datos"""
-    pass
\ No newline at end of file
+    pass
+
+
+# ========== SUMMARY ==========
+class PaymentCurrencyTotals(BaseModel):
+    """Totales de pagos en una moneda"""
+    count: int = 0
+    amount: float = 0.0
+    completed_amount: float = 0.0
+
+
+class PaymentSummary(BaseModel):
+    """Resumen agregado de pagos para la cabecera del módulo"""
+    total: int
+    by_status: Dict[str, int]
+    by_currency: Dict[str, PaymentCurrencyTotals]
+    base_currency: Optional[str] = None
+    completed_normalized: float = 0.0  # Pagos completados convertidos a base_currency
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""
+Schemas de Tarifas (Pydantic)
+"""
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import date, datetime
+from app.models.pricing import PricingRuleType
+
+
+# ========== REGLAS ==========
+class PricingRuleBase(BaseModel):
+    """Schema base de regla de precio"""
+    name: str = Field(..., min_length=3, max_length=100)
+    rule_type: PricingRuleType
+    room_type_id: Optional[int] = None  # None: todos los tipos de habitación
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    days_of_week: Optional[List[int]] = None  # 0 = lunes ... 6 = domingo
+    min_nights: Optional[int] = Field(None, ge=1)
+    min_occupancy: Optional[float] = Field(None, ge=0, le=100)
+    adjustment_percent: float = Field(..., gt=-100, le=500)
+    priority: int = 0
+    is_active: bool = True
+
+
+class PricingRuleCreate(PricingRuleBase):
+    """Schema para crear regla de precio"""
+    pass
+
+
+class PricingRuleUpdate(BaseModel):
+    """Schema para actualizar regla de precio"""
+    name: Optional[str] = Field(None, min_length=3, max_length=100)
+    room_type_id: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    days_of_week: Optional[List[int]] = None
+    min_nights: Optional[int] = Field(None, ge=1)
+    min_occupancy: Optional[float] = Field(None, ge=0, le=100)
+    adjustment_percent: Optional[float] = Field(None, gt=-100, le=500)
+    priority: Optional[int] = None
+    is_active: Optional[bool] = None
+
+
+class PricingRuleResponse(BaseModel):
+    """Schema de respuesta de regla de precio"""
+    id: int
+    name: str
+    rule_type: PricingRuleType
+    room_type_id: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    days_of_week: Optional[List[int]] = None
+    min_nights: Optional[int] = None
+    min_occupancy: Optional[float] = None
+    adjustment_percent: float
+    priority: int
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+# ========== GRILLA Y COTIZACIÓN ==========
+class RoomRateResponse(BaseModel):
+    """Precio materializado de una noche"""
+    room_type_id: int
+    rate_date: date
+    currency: str
+    price: float
+    adjustment_percent: float
+    
+    class Config:
+        from_attributes = True
+
+
+class NightlyPrice(BaseModel):
+    """Precio de una noche de la cotización"""
+    date: date
+    price: float
+
+
+class RateQuote(BaseModel):
+    """Cotización de una estadía (antes de impuestos)"""
+    room_type_id: int
+    currency: str
+    total_nights: int
+    subtotal: float
+    price_per_night: float  # Promedio por noche
+    length_of_stay_percent: float
+    nightly: List[NightlyPrice]
+
+
+class GridRebuildResponse(BaseModel):
+    """Resultado de una regeneración de la grilla"""
+    rows_written: int
@@ -0,0 +1,27 @@
+"""
+Schemas del profiler de diagnóstico (Pydantic)
+"""
+from pydantic import BaseModel, Field
+from typing import Literal
+
+
+# ========== Create ==========
+class ProfilerStart(BaseModel):
+    """Schema para armar el profiler sobre una ruta"""
+    path: str = Field(..., description="Plantilla de la ruta, ej. /api/reports/occupancy")
+    method: str = "GET"
+    requests: int = Field(5, ge=1, le=100)
+    mode: Literal["sampling", "cprofile"] = "sampling"
+    interval_ms: float = Field(5.0, ge=1, le=1000)
+
+
+# ========== Response ==========
+class ProfilerStatus(BaseModel):
+    """Schema de respuesta con el estado de la sesión"""
+    route: str
+    method: str
+    mode: str
+    requests: int
+    captured: int
+    finished: bool
+    started_at: float
@@ -79,6 +79,15 @@ class ReservationCancel(BaseModel):
     cancellation_reason: str = Field(..., min_length=3)
 
 
+class ReservationPickerItem(BaseModel):
+    """Schema compacto para los selectores de reserva en diálogos"""
+    id: int
+    confirmation_code: str
+    guest_name: str
+    balance: float
+    currency: str
+
+
 class ReservationSearchFilters(BaseModel):
     """Filtros para buscar reservas"""
     status: Optional[ReservationStatus] = None
@@ -2,7 +2,7 @@
 Schemas de Habitación y Tipo de Habitación (Pydantic)
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, Dict
 from datetime import datetime
 from app.models.room import RoomStatus
 
@@ -106,6 +106,13 @@ class RoomInDB(RoomResponse):
     pass
 
 
+class RoomSummary(BaseModel):
+    """Resumen agregado de habitaciones para la cabecera del módulo"""
+    total: int
+    active: int
+    by_status: Dict[str, int]
+
+
 # ========== AVAILABILITY ==========
 class RoomAvailabilityQuery(BaseModel):
     """Schema para consultar disponibilidad"""
@@ -0,0 +1,329 @@
+"""
+Servicio de Analítica (DuckDB)
+
+Ejecuta los reportes de varios años (ocupación, ADR y RevPAR por tipo de
+habitación y período) en DuckDB, un motor columnar embebido, en lugar de
+recorrer filas con el ORM. La base SQLite se adjunta en modo solo lectura
+con la extensión `sqlite` de DuckDB, de modo que las consultas leen los
+mismos datos de la aplicación sin copiarlos ni bloquear escrituras. Si
+existe la base de archivo (ARCHIVE_PATH) también se adjunta y las reservas
+archivadas se suman a las activas.
+
+DuckDB es una dependencia opcional: si no está instalado (o la extensión
+`sqlite` no puede cargarse) el servicio queda no disponible y los endpoints
+de analítica responden 503, sin afectar el resto de la API.
+
+Definiciones (por tipo de habitación y período):
+- Noches disponibles: habitaciones activas × días del período.
+- Noches vendidas: noches de reservas confirmadas, en curso o finalizadas.
+- Ingreso: subtotal por noche (sin impuestos) convertido a la moneda base
+  con la tasa vigente en cada noche.
+- Ocupación = vendidas / disponibles; ADR = ingreso / vendidas;
+  RevPAR = ingreso / disponibles.
+"""
+import logging
+import functools
+import os
+import threading
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.models.reservation import ReservationStatus
+
+logger = logging.getLogger("sigho.analytics")
+
+# Reservas que venden noches
+SOLD_STATUSES = (
+    ReservationStatus.CONFIRMED,
+    ReservationStatus.CHECKED_IN,
+    ReservationStatus.CHECKED_OUT
+)
+
+GRANULARITIES = ("month", "quarter", "year")
+
+# Alias de la base SQLite (y de la de archivo) adjuntas dentro de DuckDB
+SOURCE = "hotel"
+ARCHIVE_SOURCE = "hotel_archive"
+
+CUBE_SQL = """
+WITH room_counts AS (
+    SELECT room_type_id, COUNT(*) AS rooms
+    FROM {source}.rooms
+    WHERE CAST(is_active AS BOOLEAN)
+    GROUP BY room_type_id
+),
+months AS (
+    SELECT CAST(month_start AS DATE) AS month_start
+    FROM range(CAST($start AS TIMESTAMP), CAST($end AS TIMESTAMP), INTERVAL 1 MONTH) t(month_start)
+),
+capacity AS (
+    SELECT rc.room_type_id, m.month_start,
+           rc.rooms * datediff('day', m.month_start, m.month_start + INTERVAL 1 MONTH) AS available
+    FROM room_counts rc CROSS JOIN months m
+),
+stays AS (
+    SELECT rm.room_type_id, res.currency,
+           res.subtotal / NULLIF(res.total_nights, 0) AS nightly,
+           greatest(CAST(res.check_in_date AS DATE), $start) AS first_night,
+           least(CAST(res.check_out_date AS DATE), $end) AS stay_end
+    FROM {reservations} res
+    JOIN {source}.rooms rm ON rm.id = res.room_id
+    WHERE res.status IN ({statuses})
+      AND CAST(res.check_out_date AS DATE) > $start
+      AND CAST(res.check_in_date AS DATE) < $end
+),
+nights AS (
+    SELECT room_type_id, currency, nightly,
+           CAST(unnest(range(CAST(first_night AS TIMESTAMP), CAST(stay_end AS TIMESTAMP), INTERVAL 1 DAY)) AS DATE) AS night
+    FROM stays
+),
+rates AS (
+    SELECT currency, CAST(rate_date AS DATE) AS rate_date, rate
+    FROM {source}.exchange_rates
+),
+base_rates AS (
+    SELECT rate_date, rate FROM rates WHERE currency = $base
+),
+converted AS (
+    SELECT n.room_type_id, n.night,
+           CASE
+               WHEN n.currency = $base THEN n.nightly
+               ELSE n.nightly
+                    * (CASE WHEN n.currency = $pivot THEN 1.0 ELSE r.rate END)
+                    / (CASE WHEN $base = $pivot THEN 1.0 ELSE b.rate END)
+           END AS amount
+    FROM nights n
+    ASOF LEFT JOIN rates r ON r.currency = n.currency AND n.night >= r.rate_date
+    ASOF LEFT JOIN base_rates b ON n.night >= b.rate_date
+),
+sold AS (
+    SELECT room_type_id, date_trunc('month', night) AS month_start,
+           COUNT(*) AS sold, SUM(amount) AS revenue,
+           COUNT(*) FILTER (WHERE amount IS NULL) AS unconverted
+    FROM converted
+    GROUP BY ALL
+),
+monthly AS (
+    SELECT COALESCE(c.room_type_id, s.room_type_id) AS room_type_id,
+           CAST(date_trunc('{granularity}', COALESCE(c.month_start, s.month_start)) AS DATE) AS period,
+           COALESCE(c.available, 0) AS available,
+           COALESCE(s.sold, 0) AS sold,
+           COALESCE(s.revenue, 0) AS revenue,
+           COALESCE(s.unconverted, 0) AS unconverted
+    FROM capacity c
+    FULL OUTER JOIN sold s
+      ON s.room_type_id = c.room_type_id AND CAST(s.month_start AS DATE) = c.month_start
+),
+cube AS (
+    SELECT period, room_type_id,
+           SUM(available) AS available_nights,
+           SUM(sold) AS sold_nights,
+           SUM(revenue) AS revenue,
+           SUM(unconverted) AS unconverted_nights
+    FROM monthly
+    GROUP BY GROUPING SETS ((period, room_type_id), (period))
+),
+metrics AS (
+    SELECT *,
+           sold_nights / NULLIF(available_nights, 0) AS occupancy_rate,
+           revenue / NULLIF(sold_nights, 0) AS adr,
+           revenue / NULLIF(available_nights, 0) AS revpar
+    FROM cube
+)
+SELECT cur.period, cur.room_type_id, rt.name AS room_type_name,
+       cur.available_nights, cur.sold_nights, cur.unconverted_nights,
+       round(cur.revenue, 2) AS revenue,
+       round(cur.occupancy_rate * 100, 2) AS occupancy_rate,
+       round(cur.adr, 2) AS adr,
+       round(cur.revpar, 2) AS revpar,
+       round(prev.occupancy_rate * 100, 2) AS previous_occupancy_rate,
+       round(prev.adr, 2) AS previous_adr,
+       round(prev.revpar, 2) AS previous_revpar,
+       round((cur.revpar / NULLIF(prev.revpar, 0) - 1) * 100, 2) AS revpar_change
+FROM metrics cur
+LEFT JOIN metrics prev
+  ON prev.room_type_id IS NOT DISTINCT FROM cur.room_type_id
+ AND prev.period = CAST(cur.period - INTERVAL 1 YEAR AS DATE)
+LEFT JOIN {source}.room_types rt ON rt.id = cur.room_type_id
+WHERE cur.period >= $report_start
+  {room_type_filter}
+ORDER BY cur.period, cur.room_type_id NULLS LAST
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _duckdb():
+    """Módulo duckdb, importado al primer uso para no retrasar el arranque"""
+    try:
+        import duckdb
+    except ImportError:  # DuckDB es opcional
+        return None
+    return duckdb
+
+
+class AnalyticsUnavailable(RuntimeError):
+    """El motor analítico no está disponible"""
+
+
+class AnalyticsService:
+    """Consultas analíticas sobre la base de la aplicación adjunta en DuckDB"""
+
+    def __init__(self):
+        self._connection = None
+        self._archive_attached = False
+        self._lock = threading.Lock()
+        self._error: Optional[str] = None
+
+    @property
+    def engine_version(self) -> Optional[str]:
+        duckdb = _duckdb()
+        return duckdb.__version__ if duckdb else None
+
+    def status(self) -> Dict[str, Any]:
+        """Disponibilidad del motor (intenta conectarse si aún no lo hizo)"""
+        try:
+            self._connect()
+        except AnalyticsUnavailable:
+            pass
+        return {
+            "available": self._connection is not None,
+            "engine": "duckdb",
+            "version": self.engine_version,
+            "source": SOURCE,
+            "detail": self._error
+        }
+
+    def _database_path(self) -> str:
+        """Ruta del archivo SQLite configurado en DATABASE_URL"""
+        url = make_url(settings.DATABASE_URL)
+        if url.get_backend_name() != "sqlite" or not url.database:
+            raise AnalyticsUnavailable("La analítica solo admite bases SQLite en archivo")
+        return os.path.abspath(url.database)
+
+    def _connect(self):
+        """
+        Crea la conexión compartida si aún no existe
+
+        La conexión (en memoria, con la base SQLite adjunta en solo lectura)
+        se crea una sola vez; cada consulta usa su propio cursor para poder
+        ejecutarse desde varios hilos del servidor. La base de archivo se
+        adjunta en cuanto aparece.
+        """
+        duckdb = _duckdb()
+        if duckdb is None:
+            self._error = "DuckDB no está instalado"
+            raise AnalyticsUnavailable(self._error)
+        with self._lock:
+            if self._connection is None:
+                try:
+                    path = self._database_path()
+                    connection = duckdb.connect(":memory:", config={
+                        "threads": settings.ANALYTICS_THREADS,
+                        "memory_limit": settings.ANALYTICS_MEMORY_LIMIT
+                    })
+                    connection.execute("INSTALL sqlite")
+                    connection.execute("LOAD sqlite")
+                    escaped = path.replace("'", "''")
+                    connection.execute(f"ATTACH '{escaped}' AS {SOURCE} (TYPE SQLITE, READ_ONLY)")
+                except AnalyticsUnavailable as e:
+                    self._error = str(e)
+                    raise
+                except duckdb.Error as e:
+                    self._error = f"No se pudo adjuntar la base de datos: {e}"
+                    logger.warning(self._error)
+                    raise AnalyticsUnavailable(self._error)
+                self._connection = connection
+                self._error = None
+            if not self._archive_attached and os.path.exists(settings.ARCHIVE_PATH):
+                escaped = os.path.abspath(settings.ARCHIVE_PATH).replace("'", "''")
+                try:
+                    self._connection.execute(
+                        f"ATTACH '{escaped}' AS {ARCHIVE_SOURCE} (TYPE SQLITE, READ_ONLY)"
+                    )
+                    self._archive_attached = True
+                except duckdb.Error as e:
+                    logger.warning("No se pudo adjuntar la base de archivo: %s", e)
+
+    def _cursor(self):
+        """Cursor propio de una consulta sobre la conexión compartida"""
+        self._connect()
+        return self._connection.cursor()
+
+    def _relation(self, table: str) -> str:
+        """Tabla activa, o unión con la de archivo si está adjunta"""
+        if not self._archive_attached:
+            return f"{SOURCE}.{table}"
+        return (
+            f"(SELECT * FROM {SOURCE}.{table} "
+            f"UNION ALL BY NAME SELECT * FROM {ARCHIVE_SOURCE}.{table})"
+        )
+
+    def query(self, sql: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Ejecuta una consulta y retorna las filas como diccionarios"""
+        cursor = self._cursor()
+        try:
+            cursor.execute(sql, params or {})
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def occupancy_cube(
+        self,
+        start: date,
+        end: date,
+        granularity: str = "month",
+        room_type_id: Optional[int] = None,
+        base_currency: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Ocupación, ADR y RevPAR por período y tipo de habitación en [start, end)
+
+        Además de una fila por tipo de habitación, cada período incluye una
+        fila de total del hotel (room_type_id = None). Los valores previous_*
+        corresponden al mismo período del año anterior.
+
+        Args:
+            start: Inicio (se alinea al primer día del mes)
+            end: Fin exclusivo (se alinea al mes siguiente si no es día 1)
+            granularity: month, quarter o year
+            base_currency: Moneda de los montos (por defecto REPORTING_CURRENCY)
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Granularidad inválida: {granularity}")
+
+        start = start.replace(day=1)
+        if end.day != 1:
+            end = date(end.year + end.month // 12, end.month % 12 + 1, 1)
+        # Se calcula también el año anterior para la comparación interanual
+        history_start = start.replace(year=start.year - 1)
+
+        self._connect()
+        sql = CUBE_SQL.format(
+            source=SOURCE,
+            reservations=self._relation("reservations"),
+            granularity=granularity,
+            statuses=", ".join(f"'{status.name}'" for status in SOLD_STATUSES),
+            room_type_filter=(
+                "AND cur.room_type_id = $room_type_id"
+                if room_type_id else ""
+            )
+        )
+        params = {
+            "start": history_start,
+            "end": end,
+            "report_start": start,
+            "base": base_currency or settings.REPORTING_CURRENCY,
+            "pivot": settings.EXCHANGE_PIVOT_CURRENCY
+        }
+        if room_type_id:
+            params["room_type_id"] = room_type_id
+
+        return self.query(sql, params)
+
+
+# Instancia global del servicio
+analytics_service = AnalyticsService()
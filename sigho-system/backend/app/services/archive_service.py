@@ -0,0 +1,336 @@
+"""
+Servicio de Archivo Histórico
+
+Mueve a una base SQLite de archivo (ARCHIVE_PATH) el historial cerrado:
+- reservas finalizadas, canceladas o no presentadas con salida anterior a
+  ARCHIVE_AFTER_MONTHS meses, junto con sus pagos, facturas y líneas;
+- movimientos de inventario anteriores al corte que ya están cubiertos por
+  una instantánea de existencias posterior.
+
+Las tablas activas conservan solo el historial reciente, de modo que los
+recorridos de dashboards y reportes no crecen con los años. El archivo se
+organiza por año (tabla `archive_partitions` en la base activa, con el
+rango de fechas y los conteos de cada año).
+
+La base de archivo se adjunta (ATTACH) a la conexión cuando una consulta la
+necesita. `source()` retorna el modelo original si el rango de fechas no
+toca ningún año archivado, o un alias del modelo sobre
+`activa UNION ALL archivo` con las mismas columnas, para que los reportes
+consulten ambas de forma transparente:
+
+    R = archive_service.source(db, Reservation, start_date, end_date)
+    db.query(R).filter(R.check_in_date >= start_date, ...)
+
+Las filas archivadas conservan su id. Nunca se archiva la fila de mayor id
+de cada tabla, porque SQLite reutilizaría ese id en la siguiente inserción.
+
+El archivo depende de ATTACH y solo está disponible con SQLite; en
+PostgreSQL las consultas usan directamente las tablas activas.
+"""
+import logging
+import os
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import MetaData, create_engine, func, select, union_all
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.database.session import Base, engine
+from app.models.archive import ArchivePartition
+from app.models.inventory_movement import InventoryMovement
+from app.models.invoice import Invoice, InvoiceItem
+from app.models.payment import Payment
+from app.models.reservation import Reservation, ReservationStatus
+
+logger = logging.getLogger("sigho.archive")
+
+ARCHIVE_SCHEMA = "archive"
+
+CLOSED_STATUSES = (
+    ReservationStatus.CHECKED_OUT,
+    ReservationStatus.CANCELLED,
+    ReservationStatus.NO_SHOW
+)
+
+ARCHIVED_MODELS = (Reservation, Payment, Invoice, InvoiceItem, InventoryMovement)
+
+# Reservas cerradas antes del corte (los estados se guardan por nombre)
+RESERVATION_FILTER = "status IN ({statuses}) AND check_out_date < :cutoff_date AND id NOT IN ({protected})"
+
+# Movimientos anteriores al corte con una instantánea posterior (también
+# anterior al corte): la valoración desde esa instantánea no los necesita
+MOVEMENT_FILTER = (
+    "movement_date < :cutoff AND id != :last_movement AND EXISTS ("
+    "SELECT 1 FROM main.inventory_snapshots s "
+    "WHERE s.inventory_id = inventory_movements.inventory_id "
+    "AND s.cutoff_at > inventory_movements.movement_date AND s.cutoff_at <= :cutoff)"
+)
+
+PARTITION_STATS_SQL = """
+WITH r AS (SELECT * FROM archive.reservations WHERE strftime('%Y', check_out_date) = :year),
+     p AS (SELECT * FROM archive.payments WHERE reservation_id IN (SELECT id FROM r)),
+     i AS (SELECT * FROM archive.invoices WHERE reservation_id IN (SELECT id FROM r)),
+     m AS (SELECT * FROM archive.inventory_movements WHERE strftime('%Y', movement_date) = :year)
+SELECT
+    (SELECT COUNT(*) FROM r), (SELECT COUNT(*) FROM p),
+    (SELECT COUNT(*) FROM i), (SELECT COUNT(*) FROM m),
+    MIN(
+        COALESCE((SELECT MIN(check_in_date) FROM r), '9999-12-31'),
+        COALESCE((SELECT MIN(date(payment_date)) FROM p), '9999-12-31'),
+        COALESCE((SELECT MIN(date(issue_date)) FROM i), '9999-12-31'),
+        COALESCE((SELECT MIN(date(movement_date)) FROM m), '9999-12-31')
+    ),
+    MAX(
+        COALESCE((SELECT MAX(check_out_date) FROM r), '0001-01-01'),
+        COALESCE((SELECT MAX(date(payment_date)) FROM p), '0001-01-01'),
+        COALESCE((SELECT MAX(date(issue_date)) FROM i), '0001-01-01'),
+        COALESCE((SELECT MAX(date(movement_date)) FROM m), '0001-01-01')
+    )
+"""
+
+UPSERT_PARTITION_SQL = """
+INSERT INTO main.archive_partitions
+    (name, reservation_count, payment_count, invoice_count, movement_count, min_date, max_date, created_at)
+VALUES
+    (:year, :reservations, :payments, :invoices, :movements, :min_date, :max_date, CURRENT_TIMESTAMP)
+ON CONFLICT (name) DO UPDATE SET
+    reservation_count = excluded.reservation_count,
+    payment_count = excluded.payment_count,
+    invoice_count = excluded.invoice_count,
+    movement_count = excluded.movement_count,
+    min_date = excluded.min_date,
+    max_date = excluded.max_date,
+    updated_at = CURRENT_TIMESTAMP
+"""
+
+
+class ArchiveError(RuntimeError):
+    """El archivado no está disponible para la base configurada"""
+
+
+def months_ago(months: int, today: Optional[date] = None) -> date:
+    """Primer día del mes que está `months` meses antes de hoy"""
+    today = today or date.today()
+    total = today.year * 12 + today.month - 1 - months
+    return date(total // 12, total % 12 + 1, 1)
+
+
+def column_list(table) -> str:
+    """Columnas explícitas (el orden físico puede diferir entre bases)"""
+    return ", ".join(f'"{column.name}"' for column in table.columns)
+
+
+class ArchiveService:
+    """Archivado y consulta transparente de la base de archivo"""
+
+    def __init__(self):
+        self._metadata = MetaData()
+        self._tables: Dict[str, Any] = {}
+
+    @property
+    def path(self) -> str:
+        return os.path.abspath(settings.ARCHIVE_PATH)
+
+    # ========== CONSULTA ==========
+    def partitions(self, db: Session, start: Optional[date] = None, end: Optional[date] = None) -> List[ArchivePartition]:
+        """Años archivados cuyo rango de fechas se superpone con [start, end]"""
+        query = db.query(ArchivePartition).filter(ArchivePartition.min_date.isnot(None))
+        if start:
+            query = query.filter(ArchivePartition.max_date >= start)
+        if end:
+            query = query.filter(ArchivePartition.min_date <= end)
+        return query.order_by(ArchivePartition.name).all()
+
+    def attach(self, connection):
+        """Adjunta la base de archivo a la conexión si aún no lo está"""
+        attached = {row[1] for row in connection.exec_driver_sql("PRAGMA database_list")}
+        if ARCHIVE_SCHEMA not in attached:
+            path = self.path.replace("'", "''")
+            connection.exec_driver_sql(f"ATTACH DATABASE '{path}' AS {ARCHIVE_SCHEMA}")
+
+    def archive_table(self, table):
+        """Copia de la definición de la tabla dentro del esquema adjunto"""
+        if table.name not in self._tables:
+            self._tables[table.name] = table.to_metadata(self._metadata, schema=ARCHIVE_SCHEMA)
+        return self._tables[table.name]
+
+    def source(self, db: Session, model, start: Optional[date] = None, end: Optional[date] = None):
+        """
+        Modelo o alias (activa + archivo) para consultar el rango [start, end]
+
+        Sin fechas se incluye el archivo si tiene algún año archivado.
+        """
+        if not self.partitions(db, start, end) or not os.path.exists(self.path):
+            return model
+        self.attach(db.connection())
+
+        table = model.__table__
+        rows = union_all(select(table), select(self.archive_table(table)))
+        return aliased(model, rows.subquery(), adapt_on_names=True)
+
+    def archived_count(self, db: Session, model, **filters) -> int:
+        """
+        Filas archivadas de `model` que cumplen los filtros (columna=valor)
+
+        Se usa antes de eliminar registros que el archivo sigue referenciando
+        (ej. huésped o habitación de reservas archivadas).
+        """
+        if not self.partitions(db) or not os.path.exists(self.path):
+            return 0
+        self.attach(db.connection())
+
+        table = self.archive_table(model.__table__)
+        return db.query(func.count()).select_from(table).filter(
+            *[table.c[column] == value for column, value in filters.items()]
+        ).scalar()
+
+    # ========== ARCHIVADO ==========
+    def ensure_database(self):
+        """Crea la base de archivo con el mismo esquema que las tablas activas"""
+        archive_engine = create_engine(f"sqlite:///{self.path}")
+        try:
+            Base.metadata.create_all(
+                bind=archive_engine, tables=[model.__table__ for model in ARCHIVED_MODELS]
+            )
+        finally:
+            archive_engine.dispose()
+
+    def _protected_ids(self, connection) -> Dict[str, Any]:
+        """Mayor id de cada tabla (no se archiva para que SQLite no lo reutilice)"""
+        def scalar(sql):
+            return connection.exec_driver_sql(sql).scalar()
+
+        reservation_ids = {
+            scalar("SELECT MAX(id) FROM main.reservations"),
+            scalar("SELECT reservation_id FROM main.payments ORDER BY id DESC LIMIT 1"),
+            scalar("SELECT reservation_id FROM main.invoices ORDER BY id DESC LIMIT 1"),
+            scalar(
+                "SELECT i.reservation_id FROM main.invoice_items it "
+                "JOIN main.invoices i ON i.id = it.invoice_id ORDER BY it.id DESC LIMIT 1"
+            )
+        }
+        return {
+            "reservations": ", ".join(str(int(i)) for i in reservation_ids if i is not None) or "0",
+            "last_movement": scalar("SELECT MAX(id) FROM main.inventory_movements") or 0
+        }
+
+    def _params(self, cutoff: date, protected: Dict[str, Any], year: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "cutoff_date": cutoff.isoformat(),
+            "cutoff": datetime.combine(cutoff, datetime.min.time()).strftime("%Y-%m-%d %H:%M:%S"),
+            "last_movement": protected["last_movement"],
+            "year": year
+        }
+
+    def _reservation_filter(self, protected: Dict[str, Any]) -> str:
+        statuses = ", ".join(f"'{status.name}'" for status in CLOSED_STATUSES)
+        return RESERVATION_FILTER.format(statuses=statuses, protected=protected["reservations"])
+
+    def candidates(self, connection, cutoff: date) -> Dict[str, Dict[str, int]]:
+        """Reservas y movimientos a archivar por año (sin modificar nada)"""
+        protected = self._protected_ids(connection)
+        params = self._params(cutoff, protected)
+        plan: Dict[str, Dict[str, int]] = {}
+        for year, count in connection.exec_driver_sql(
+            f"SELECT strftime('%Y', check_out_date), COUNT(*) FROM main.reservations "
+            f"WHERE {self._reservation_filter(protected)} GROUP BY 1", params
+        ):
+            plan.setdefault(year, {"reservations": 0, "inventory_movements": 0})["reservations"] = count
+        for year, count in connection.exec_driver_sql(
+            f"SELECT strftime('%Y', movement_date), COUNT(*) FROM main.inventory_movements "
+            f"WHERE {MOVEMENT_FILTER} GROUP BY 1", params
+        ):
+            plan.setdefault(year, {"reservations": 0, "inventory_movements": 0})["inventory_movements"] = count
+        return plan
+
+    def _move(self, connection, table, where: str, params: Dict[str, Any]) -> int:
+        """Copia al archivo las filas de `table` que cumplen `where` y las elimina de la activa"""
+        columns = column_list(table)
+        connection.exec_driver_sql(
+            f"INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.{table.name} ({columns}) "
+            f"SELECT {columns} FROM main.{table.name} WHERE {where}", params
+        )
+        return connection.exec_driver_sql(f"DELETE FROM main.{table.name} WHERE {where}", params).rowcount
+
+    def _archive_year(self, connection, cutoff: date, year: str) -> Dict[str, int]:
+        """Mueve un año y actualiza su registro en archive_partitions"""
+        protected = self._protected_ids(connection)
+        params = self._params(cutoff, protected, year)
+
+        connection.exec_driver_sql("CREATE TEMP TABLE IF NOT EXISTS archive_ids (id INTEGER PRIMARY KEY)")
+        connection.exec_driver_sql("DELETE FROM temp.archive_ids")
+        connection.exec_driver_sql(
+            f"INSERT INTO temp.archive_ids SELECT id FROM main.reservations "
+            f"WHERE {self._reservation_filter(protected)} AND strftime('%Y', check_out_date) = :year",
+            params
+        )
+        ids = "SELECT id FROM temp.archive_ids"
+        invoice_ids = f"SELECT id FROM main.invoices WHERE reservation_id IN ({ids})"
+
+        moved = {
+            # Dependientes primero: sus filtros leen las tablas padre
+            "invoice_items": self._move(connection, InvoiceItem.__table__, f"invoice_id IN ({invoice_ids})", params),
+            "invoices": self._move(connection, Invoice.__table__, f"reservation_id IN ({ids})", params),
+            "payments": self._move(connection, Payment.__table__, f"reservation_id IN ({ids})", params),
+            "reservations": self._move(connection, Reservation.__table__, f"id IN ({ids})", params),
+            "inventory_movements": self._move(
+                connection, InventoryMovement.__table__,
+                f"{MOVEMENT_FILTER} AND strftime('%Y', movement_date) = :year", params
+            )
+        }
+
+        reservations, payments, invoices, movements, min_date, max_date = connection.exec_driver_sql(
+            PARTITION_STATS_SQL, {"year": year}
+        ).one()
+        connection.exec_driver_sql(UPSERT_PARTITION_SQL, {
+            "year": year,
+            "reservations": reservations,
+            "payments": payments,
+            "invoices": invoices,
+            "movements": movements,
+            "min_date": None if min_date == "9999-12-31" else min_date[:10],
+            "max_date": None if max_date == "0001-01-01" else max_date[:10]
+        })
+        return moved
+
+    def archive(self, months: Optional[int] = None, dry_run: bool = False) -> Dict[str, Dict[str, int]]:
+        """
+        Archiva el historial anterior a `months` meses (por defecto ARCHIVE_AFTER_MONTHS)
+
+        Cada año se mueve en una transacción propia que abarca la base activa
+        y la de archivo. Reejecutar es seguro: las filas ya copiadas se
+        reemplazan en el archivo y luego se eliminan de la activa.
+
+        Args:
+            dry_run: Solo contar las filas que se archivarían
+
+        Returns:
+            Filas por año y tabla (archivadas, o candidatas con dry_run)
+        """
+        if engine.dialect.name != "sqlite":
+            raise ArchiveError("El archivo histórico solo admite bases SQLite")
+        cutoff = months_ago(settings.ARCHIVE_AFTER_MONTHS if months is None else months)
+
+        with engine.connect() as connection:
+            if dry_run:
+                return self.candidates(connection, cutoff)
+
+            self.ensure_database()
+            # ATTACH no se permite dentro de una transacción
+            self.attach(connection)
+            connection.commit()
+
+            plan = self.candidates(connection, cutoff)
+            connection.commit()
+
+            results: Dict[str, Dict[str, int]] = {}
+            for year in sorted(plan):
+                with connection.begin():
+                    results[year] = self._archive_year(connection, cutoff, year)
+                logger.info("Archivo %s: %s", year, results[year])
+        return results
+
+
+# Instancia global del servicio
+archive_service = ArchiveService()
@@ -0,0 +1,205 @@
+"""
+Servicio de Respaldos de la base de datos
+
+Copia la base SQLite en caliente con la API de respaldo en línea de SQLite
+(`sqlite3.Connection.backup`), por tramos de páginas: cada paso toma el
+bloqueo de lectura solo mientras copia BACKUP_PAGES_PER_STEP páginas y
+luego cede el turno, de modo que el servidor sigue leyendo y escribiendo
+durante el respaldo.
+
+SQLite reinicia el respaldo si otra conexión escribe en la base entre dos
+pasos. Con mucha escritura un respaldo por tramos podría no terminar nunca,
+por lo que al superar BACKUP_MAX_RESTARTS se copia el resto en un solo paso
+(en modo WAL eso no bloquea a los escritores, solo fija una instantánea de
+lectura mientras dura la copia).
+
+Cada copia se verifica con `PRAGMA integrity_check` (o `quick_check`) antes
+de comprimirla y publicarla; una copia que no pasa la verificación se
+descarta. La rotación conserva los BACKUP_KEEP respaldos más recientes.
+"""
+import gzip
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger("sigho.backup")
+
+BACKUP_PREFIX = "sigho-"
+BACKUP_PATTERN = re.compile(r"^sigho-\d{8}-\d{6}\.db(\.gz)?$")
+
+# Bloques de 1 MB al comprimir
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class BackupError(RuntimeError):
+    """El respaldo no pudo completarse o la copia no es válida"""
+
+
+class _TooManyRestarts(Exception):
+    """Interrumpe el respaldo por tramos para reintentarlo en un solo paso"""
+
+
+class BackupService:
+    """Respaldo en línea, verificación, compresión y rotación"""
+
+    def database_path(self) -> str:
+        """Ruta del archivo SQLite configurado en DATABASE_URL"""
+        url = make_url(settings.DATABASE_URL)
+        if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+            raise BackupError("El respaldo en línea solo admite bases SQLite en archivo")
+        return os.path.abspath(url.database)
+
+    def list_backups(self, directory: Optional[str] = None) -> List[str]:
+        """Respaldos del directorio, del más reciente al más antiguo"""
+        directory = directory or settings.BACKUP_DIR
+        if not os.path.isdir(directory):
+            return []
+        names = [name for name in os.listdir(directory) if BACKUP_PATTERN.match(name)]
+        # El nombre lleva la fecha: el orden alfabético es cronológico
+        return [os.path.join(directory, name) for name in sorted(names, reverse=True)]
+
+    def _copy(self, source_path: str, target_path: str, pages: int, sleep: float, max_restarts: int) -> Dict[str, Any]:
+        """Copia por tramos; si se reinicia demasiadas veces, termina en un solo paso"""
+        stats = {"steps": 0, "restarts": 0, "pages": 0, "single_step": False}
+
+        def progress(status, remaining, total):
+            if stats["steps"] and remaining > stats["remaining"]:
+                # Otra conexión escribió: SQLite reinició la copia
+                stats["restarts"] += 1
+                if stats["restarts"] > max_restarts:
+                    raise _TooManyRestarts()
+            stats["steps"] += 1
+            stats["remaining"] = remaining
+            stats["pages"] = total
+
+        source = sqlite3.connect(source_path, timeout=30)
+        try:
+            target = sqlite3.connect(target_path)
+            try:
+                try:
+                    source.backup(target, pages=pages, progress=progress, sleep=sleep)
+                except _TooManyRestarts:
+                    logger.warning(
+                        "Respaldo reiniciado %s veces; se completa en un solo paso", stats["restarts"]
+                    )
+                    stats["single_step"] = True
+                    source.backup(target, pages=-1)
+                stats["pages"] = target.execute("PRAGMA page_count").fetchone()[0]
+                # La copia hereda el modo WAL del origen: dejarla como un archivo
+                # independiente para que abrirla no cree los -wal/-shm junto al respaldo
+                target.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                target.close()
+        finally:
+            source.close()
+        stats.pop("remaining", None)
+        return stats
+
+    def verify(self, path: str, quick: bool = False) -> None:
+        """Verifica la integridad de una copia sin comprimir"""
+        pragma = "quick_check" if quick else "integrity_check"
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = connection.execute(f"PRAGMA {pragma}").fetchall()
+        finally:
+            connection.close()
+        if [row[0] for row in rows] != ["ok"]:
+            problems = "; ".join(row[0] for row in rows[:5])
+            raise BackupError(f"La copia no pasó {pragma}: {problems}")
+
+    def _compress(self, path: str) -> str:
+        """Comprime la copia con gzip y elimina la versión sin comprimir"""
+        compressed_path = path + ".gz"
+        with open(path, "rb") as source, gzip.open(compressed_path + ".tmp", "wb", compresslevel=6) as target:
+            shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+        os.replace(compressed_path + ".tmp", compressed_path)
+        os.remove(path)
+        return compressed_path
+
+    def rotate(self, directory: Optional[str] = None, keep: Optional[int] = None) -> List[str]:
+        """Elimina los respaldos más antiguos; retorna los eliminados"""
+        keep = settings.BACKUP_KEEP if keep is None else keep
+        removed = self.list_backups(directory)[keep:] if keep > 0 else []
+        for path in removed:
+            os.remove(path)
+        return removed
+
+    def backup(
+        self,
+        directory: Optional[str] = None,
+        compress: bool = True,
+        quick_check: bool = False,
+        keep: Optional[int] = None,
+        pages_per_step: Optional[int] = None,
+        step_sleep_ms: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Ejecuta un respaldo completo: copia, verificación, compresión y rotación
+
+        La copia se escribe con extensión .tmp y solo se publica con su
+        nombre definitivo si pasa la verificación.
+
+        Returns:
+            Ruta, tamaños y tiempos (segundos) de cada etapa
+        """
+        directory = directory or settings.BACKUP_DIR
+        pages = pages_per_step or settings.BACKUP_PAGES_PER_STEP
+        sleep = (settings.BACKUP_STEP_SLEEP_MS if step_sleep_ms is None else step_sleep_ms) / 1000
+        source_path = self.database_path()
+        if not os.path.exists(source_path):
+            raise BackupError(f"No existe la base de datos: {source_path}")
+
+        os.makedirs(directory, exist_ok=True)
+        name = f"{BACKUP_PREFIX}{datetime.now().strftime('%Y%m%d-%H%M%S')}.db"
+        path = os.path.join(directory, name)
+        tmp_path = path + ".tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        timings = {}
+        try:
+            started = time.perf_counter()
+            stats = self._copy(source_path, tmp_path, pages, sleep, settings.BACKUP_MAX_RESTARTS)
+            timings["copy"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            self.verify(tmp_path, quick=quick_check)
+            timings["verify"] = time.perf_counter() - started
+        except BaseException:
+            for leftover in (tmp_path, tmp_path + "-wal", tmp_path + "-shm"):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+            raise
+
+        os.replace(tmp_path, path)
+        database_size = os.path.getsize(path)
+
+        if compress:
+            started = time.perf_counter()
+            path = self._compress(path)
+            timings["compress"] = time.perf_counter() - started
+
+        removed = self.rotate(directory, keep)
+        logger.info("Respaldo %s completado en %.1f s", path, sum(timings.values()))
+
+        return {
+            "path": path,
+            "database_size": database_size,
+            "backup_size": os.path.getsize(path),
+            "removed": removed,
+            "timings": timings,
+            **stats
+        }
+
+
+# Instancia global del servicio
+backup_service = BackupService()
@@ -0,0 +1,95 @@
+"""
+Servicio de Tasas de Cambio
+
+Construye expresiones SQL para convertir montos a una moneda base con la
+tasa vigente en la fecha de cada fila. La conversión es una subconsulta
+correlacionada ("última tasa en o antes de la fecha") que se resuelve con el
+índice único (currency, rate_date), de modo que cualquier agregado de
+ingresos puede sumar montos normalizados en la misma consulta:
+
+    amount = normalized_amount(Payment.amount, Payment.currency, func.date(Payment.payment_date), "USD")
+    db.query(func.sum(amount)).filter(...)
+
+Si falta una tasa la expresión es NULL y SUM la ignora; `missing_rate_count`
+permite informar cuántas filas quedaron sin convertir.
+"""
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.exchange_rate import ExchangeRate
+
+
+def rate_to_pivot(currency, on_date):
+    """
+    Expresión SQL con la tasa (en moneda pivote) de `currency` vigente en `on_date`
+
+    Args:
+        currency: Columna o literal con el código de moneda
+        on_date: Expresión de fecha (ej. func.date(Payment.payment_date))
+    """
+    latest = (
+        select(ExchangeRate.rate)
+        .where(ExchangeRate.currency == currency, ExchangeRate.rate_date <= on_date)
+        .order_by(ExchangeRate.rate_date.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return case((currency == settings.EXCHANGE_PIVOT_CURRENCY, literal(1.0)), else_=latest)
+
+
+def normalized_amount(amount, currency, on_date, base_currency: str):
+    """Expresión SQL de `amount` convertido a `base_currency` con las tasas de `on_date`"""
+    base = literal(base_currency)
+    return case(
+        (currency == base, amount),
+        else_=amount * rate_to_pivot(currency, on_date) / rate_to_pivot(base, on_date)
+    )
+
+
+def missing_rate_count(currency, on_date, base_currency: str):
+    """Expresión SQL que cuenta las filas que no se pudieron convertir"""
+    base = literal(base_currency)
+    return func.sum(case(
+        (currency == base, 0),
+        (rate_to_pivot(currency, on_date).is_(None), 1),
+        (rate_to_pivot(base, on_date).is_(None), 1),
+        else_=0
+    ))
+
+
+class ExchangeRateService:
+    """Consulta y conversión puntual de tasas"""
+
+    def get_rate(self, db: Session, currency: str, on_date: date) -> Optional[float]:
+        """Tasa de `currency` en moneda pivote vigente en `on_date`"""
+        if currency == settings.EXCHANGE_PIVOT_CURRENCY:
+            return 1.0
+        return db.query(ExchangeRate.rate).filter(
+            ExchangeRate.currency == currency,
+            ExchangeRate.rate_date <= on_date
+        ).order_by(ExchangeRate.rate_date.desc()).limit(1).scalar()
+
+    def convert(
+        self,
+        db: Session,
+        amount: float,
+        currency: str,
+        base_currency: str,
+        on_date: date
+    ) -> Optional[float]:
+        """Convierte un monto; None si falta alguna tasa"""
+        if currency == base_currency:
+            return amount
+        rate = self.get_rate(db, currency, on_date)
+        base_rate = self.get_rate(db, base_currency, on_date)
+        if rate is None or not base_rate:
+            return None
+        return amount * rate / base_rate
+
+
+# Instancia global del servicio
+exchange_rate_service = ExchangeRateService()
@@ -0,0 +1,158 @@
+"""
+Servicio de Estadísticas de Huésped
+
+Mantiene la proyección `guest_stats` (reservas, noches, gasto por moneda y
+última estadía de cada huésped) para que los reportes y el detalle del
+huésped no tengan que agrupar reservas y pagos en cada consulta.
+
+La proyección se actualiza desde el bus de eventos: cada `ReservationChanged`
+o `PaymentRecorded` confirmado recalcula la fila del huésped afectado a
+partir de sus reservas y pagos. Recalcular (en lugar de sumar deltas) hace
+la actualización idempotente y evita que la proyección se desvíe.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import case, delete, func, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.events import PaymentRecorded, ReservationChanged
+from app.database.session import SessionLocal
+from app.models.guest_stats import GuestStats
+from app.models.payment import Payment, PaymentStatus
+from app.models.reservation import Reservation, ReservationStatus
+from app.services.archive_service import archive_service
+
+logger = logging.getLogger("sigho.guest_stats")
+
+STAY_STATUSES = (ReservationStatus.CHECKED_IN, ReservationStatus.CHECKED_OUT)
+CANCELLED_STATUSES = (ReservationStatus.CANCELLED, ReservationStatus.NO_SHOW)
+
+# Filas por INSERT en la reconstrucción completa
+REBUILD_CHUNK_SIZE = 1000
+
+
+class GuestStatsService:
+    """Cálculo y mantenimiento de la proyección guest_stats"""
+
+    def compute(self, db: Session, guest_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Calcula las estadísticas desde reservas y pagos (dos consultas agrupadas),
+        incluidos los archivados
+
+        Args:
+            guest_ids: Huéspedes a calcular; None para todos
+        """
+        reservations_source = archive_service.source(db, Reservation)
+        payments_source = archive_service.source(db, Payment)
+        is_stay = reservations_source.status.in_(STAY_STATUSES)
+        reservations = db.query(
+            reservations_source.guest_id,
+            func.count(reservations_source.id),
+            func.sum(case((is_stay, 1), else_=0)),
+            func.sum(case((reservations_source.status.in_(CANCELLED_STATUSES), 1), else_=0)),
+            func.sum(case((is_stay, reservations_source.total_nights), else_=0)),
+            func.min(case((is_stay, reservations_source.check_in_date))),
+            func.max(case((is_stay, reservations_source.check_out_date)))
+        ).group_by(reservations_source.guest_id)
+
+        payments = db.query(
+            reservations_source.guest_id, payments_source.currency, func.sum(payments_source.amount)
+        ).join(
+            reservations_source, payments_source.reservation_id == reservations_source.id
+        ).filter(
+            payments_source.status == PaymentStatus.COMPLETED
+        ).group_by(reservations_source.guest_id, payments_source.currency)
+
+        if guest_ids is not None:
+            reservations = reservations.filter(reservations_source.guest_id.in_(guest_ids))
+            payments = payments.filter(reservations_source.guest_id.in_(guest_ids))
+
+        now = datetime.utcnow()
+        rows: Dict[int, Dict[str, Any]] = {}
+        for guest_id, count, stays, cancelled, nights, first_stay, last_stay in reservations:
+            rows[guest_id] = {
+                "guest_id": guest_id,
+                "reservation_count": count,
+                "stay_count": int(stays or 0),
+                "cancelled_count": int(cancelled or 0),
+                "total_nights": int(nights or 0),
+                "total_spent": {},
+                "first_stay_date": first_stay,
+                "last_stay_date": last_stay,
+                "updated_at": now
+            }
+        for guest_id, currency, amount in payments:
+            if guest_id in rows:
+                rows[guest_id]["total_spent"][currency] = round(float(amount or 0), 2)
+
+        return list(rows.values())
+
+    def refresh(self, db: Session, guest_ids: Iterable[int]):
+        """Recalcula y reemplaza las filas de los huéspedes indicados"""
+        guest_ids = sorted(set(guest_ids))
+        if not guest_ids:
+            return
+        rows = self.compute(db, guest_ids)
+        db.execute(delete(GuestStats).where(GuestStats.guest_id.in_(guest_ids)))
+        if rows:
+            db.execute(insert(GuestStats), rows)
+        db.commit()
+
+    def rebuild(self, db: Session) -> int:
+        """Reconstruye la proyección completa; retorna la cantidad de huéspedes"""
+        rows = self.compute(db)
+        db.execute(delete(GuestStats))
+        for start in range(0, len(rows), REBUILD_CHUNK_SIZE):
+            db.execute(insert(GuestStats), rows[start:start + REBUILD_CHUNK_SIZE])
+        db.commit()
+        return len(rows)
+
+    def get(self, db: Session, guest_id: int) -> Dict[str, Any]:
+        """Estadísticas de un huésped (en cero si aún no tiene reservas)"""
+        stats = db.query(GuestStats).filter(GuestStats.guest_id == guest_id).first()
+        if stats is None:
+            return {
+                "guest_id": guest_id,
+                "reservation_count": 0,
+                "stay_count": 0,
+                "cancelled_count": 0,
+                "total_nights": 0,
+                "total_spent": {},
+                "first_stay_date": None,
+                "last_stay_date": None,
+                "updated_at": None
+            }
+        return stats
+
+    # ========== MANEJADORES DEL BUS ==========
+    def _refresh_guest(self, guest_id: Optional[int] = None, reservation_id: Optional[int] = None):
+        """Recalcula un huésped en una sesión propia (los manejadores no usan la de origen)"""
+        db = SessionLocal()
+        try:
+            if guest_id is None:
+                guest_id = db.query(Reservation.guest_id).filter(Reservation.id == reservation_id).scalar()
+                if guest_id is None:
+                    return
+            try:
+                self.refresh(db, [guest_id])
+            except IntegrityError:
+                # Otra transacción insertó la misma fila entre el DELETE y el INSERT
+                db.rollback()
+                self.refresh(db, [guest_id])
+        finally:
+            db.close()
+
+    def on_reservation_changed(self, domain_event: ReservationChanged):
+        """Actualiza la proyección al crear, modificar o eliminar una reserva"""
+        self._refresh_guest(guest_id=domain_event.guest_id)
+
+    def on_payment_recorded(self, domain_event: PaymentRecorded):
+        """Actualiza la proyección al registrar, reembolsar o eliminar un pago"""
+        self._refresh_guest(reservation_id=domain_event.reservation_id)
+
+
+# Instancia global del servicio
+guest_stats_service = GuestStatsService()
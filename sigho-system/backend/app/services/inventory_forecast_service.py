@@ -0,0 +1,199 @@
+"""
+Servicio de Pronóstico de Consumo de Inventario
+
+Calcula, para todos los items a la vez, el consumo diario a partir de las
+salidas (OUT) registradas y sugiere punto de reorden y cantidad a pedir.
+Los datos se obtienen con dos consultas agrupadas (salidas por item y día,
+y estadías de reservas) y el resto se resuelve en memoria sobre series
+diarias densas:
+
+- Suavizado exponencial simple del consumo diario.
+- Correlación con la ocupación (habitaciones ocupadas por día). Si es
+  suficiente, el consumo se proyecta como tasa por habitación ocupada por
+  la ocupación ya reservada del período de reposición.
+- Punto de reorden = demanda durante el tiempo de entrega + stock de
+  seguridad (z · σ · √L), con σ el error de pronóstico a un día.
+"""
+import math
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.inventory import Inventory, InventoryCategory
+from app.models.inventory_movement import InventoryMovement, MovementType
+from app.models.reservation import ReservationStatus
+from app.services.occupancy_service import occupancy_service
+
+# Reservas que ocupan (u ocuparán) una habitación
+OCCUPYING_STATUSES = (
+    ReservationStatus.CONFIRMED,
+    ReservationStatus.CHECKED_IN,
+    ReservationStatus.CHECKED_OUT
+)
+
+
+def exponential_smoothing(series: Sequence[float], alpha: float):
+    """
+    Suavizado exponencial simple
+
+    Retorna (nivel final, desviación estándar del error a un paso).
+    El nivel inicial es el promedio de la primera semana.
+    """
+    if not series:
+        return 0.0, 0.0
+    warmup = min(7, len(series))
+    level = sum(series[:warmup]) / warmup
+    squared_errors = 0.0
+    for value in series:
+        error = value - level
+        squared_errors += error * error
+        level += alpha * error
+    return level, math.sqrt(squared_errors / len(series))
+
+
+def pearson(xs: Sequence[float], ys: Sequence[float]) -> Optional[float]:
+    """Coeficiente de correlación de Pearson (None si alguna serie es constante)"""
+    n = len(xs)
+    if n < 2:
+        return None
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+    if var_x == 0 or var_y == 0:
+        return None
+    return cov / math.sqrt(var_x * var_y)
+
+
+class InventoryForecastService:
+    """Pronóstico de consumo y sugerencias de reposición"""
+
+    def daily_occupancy(self, db: Session, start: date, end: date) -> List[int]:
+        """Habitaciones ocupadas por noche en [start, end)"""
+        return occupancy_service.nightly(db, start, end, OCCUPYING_STATUSES)
+
+    def daily_consumption(self, db: Session, start: date, end: date, item_ids: List[int]) -> Dict[int, List[float]]:
+        """Salidas por item y día en [start, end), como series densas"""
+        days = (end - start).days
+        series = {item_id: [0.0] * days for item_id in item_ids}
+        day = func.date(InventoryMovement.movement_date)
+        rows = db.query(
+            InventoryMovement.inventory_id, day, func.sum(InventoryMovement.quantity)
+        ).filter(
+            InventoryMovement.movement_type == MovementType.OUT,
+            InventoryMovement.movement_date >= start,
+            InventoryMovement.movement_date < end,
+            InventoryMovement.inventory_id.in_(item_ids)
+        ).group_by(InventoryMovement.inventory_id, day)
+
+        for item_id, movement_day, quantity in rows:
+            if isinstance(movement_day, str):
+                movement_day = date.fromisoformat(movement_day[:10])
+            index = (movement_day - start).days
+            if 0 <= index < days:
+                series[item_id][index] = float(quantity)
+        return series
+
+    def forecast(
+        self,
+        db: Session,
+        category: Optional[InventoryCategory] = None,
+        lead_time_days: Optional[int] = None,
+        review_days: Optional[int] = None,
+        only_reorder: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Pronóstico de todos los items activos
+
+        Args:
+            lead_time_days: Días entre el pedido y la recepción
+            review_days: Días de consumo que debe cubrir el pedido sugerido
+            only_reorder: Retornar solo los items bajo el punto de reorden
+        """
+        lead_time = lead_time_days or settings.INVENTORY_LEAD_TIME_DAYS
+        review = review_days or settings.INVENTORY_REVIEW_DAYS
+        alpha = settings.INVENTORY_SMOOTHING_ALPHA
+        z = settings.INVENTORY_SERVICE_LEVEL_Z
+
+        query = db.query(Inventory).filter(Inventory.is_active == True)
+        if category:
+            query = query.filter(Inventory.category == category)
+        items = query.order_by(Inventory.name).all()
+        if not items:
+            return []
+
+        today = date.today()
+        history_start = today - timedelta(days=settings.INVENTORY_FORECAST_HISTORY_DAYS)
+        consumption = self.daily_consumption(db, history_start, today, [item.id for item in items])
+        past_occupancy = self.daily_occupancy(db, history_start, today)
+        future_occupancy = self.daily_occupancy(db, today, today + timedelta(days=lead_time + review))
+        occupied_nights = sum(past_occupancy)
+        squared_occupancy = sum(o * o for o in past_occupancy)
+
+        results = []
+        for item in items:
+            series = consumption[item.id]
+            level, sigma = exponential_smoothing(series, alpha)
+            correlation = pearson(series, past_occupancy)
+            per_room = None
+            model = "smoothing"
+
+            if (correlation is not None
+                    and correlation >= settings.INVENTORY_OCCUPANCY_MIN_CORRELATION
+                    and occupied_nights > 0):
+                # Regresión por el origen: consumo = tasa × habitaciones ocupadas
+                per_room = sum(c * o for c, o in zip(series, past_occupancy)) / squared_occupancy
+                model = "occupancy"
+                # Las reservas actuales son un mínimo de la ocupación futura
+                # (faltan las que aún no se han hecho): no bajar del suavizado
+                lead_demand = max(per_room * sum(future_occupancy[:lead_time]), level * lead_time)
+                cycle_demand = max(per_room * sum(future_occupancy), level * (lead_time + review))
+                daily = cycle_demand / (lead_time + review)
+            else:
+                lead_demand = level * lead_time
+                cycle_demand = level * (lead_time + review)
+                daily = level
+
+            safety_stock = z * sigma * math.sqrt(lead_time)
+            reorder_point = max(math.ceil(lead_demand + safety_stock), item.minimum_quantity)
+            needs_reorder = item.current_quantity <= reorder_point
+
+            suggested = 0
+            if needs_reorder:
+                order_up_to = math.ceil(cycle_demand + safety_stock)
+                if item.maximum_quantity:
+                    order_up_to = min(order_up_to, item.maximum_quantity)
+                suggested = max(order_up_to - item.current_quantity, 0)
+
+            if only_reorder and not needs_reorder:
+                continue
+
+            results.append({
+                "inventory_id": item.id,
+                "item_code": item.item_code,
+                "name": item.name,
+                "category": item.category,
+                "unit_of_measure": item.unit_of_measure,
+                "current_quantity": item.current_quantity,
+                "minimum_quantity": item.minimum_quantity,
+                "daily_consumption": round(daily, 3),
+                "consumption_per_occupied_room": round(per_room, 4) if per_room is not None else None,
+                "occupancy_correlation": round(correlation, 3) if correlation is not None else None,
+                "model": model,
+                "days_of_cover": round(item.current_quantity / daily, 1) if daily > 0 else None,
+                "reorder_point": reorder_point,
+                "suggested_order_quantity": suggested,
+                "needs_reorder": needs_reorder
+            })
+
+        # Los más urgentes primero (menos días de cobertura)
+        results.sort(key=lambda r: (r["days_of_cover"] is None, r["days_of_cover"] or 0))
+        return results
+
+
+# Instancia global del servicio
+inventory_forecast_service = InventoryForecastService()
@@ -0,0 +1,340 @@
+"""
+Servicio de Existencias de Inventario
+
+Las existencias se modifican con un único UPDATE condicional en lugar de
+leer `current_quantity` y escribir un valor calculado en Python, de modo
+que dos salidas concurrentes no pueden pasar ambas la verificación de
+disponibilidad ni pisarse la actualización. El movimiento se inserta en la
+misma transacción que el UPDATE.
+"""
+import random
+import string
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import bindparam, insert, or_, update
+from sqlalchemy.orm import Session
+
+from app.core.events import StockMoved, emit
+from app.models.inventory import Inventory
+from app.models.inventory_movement import InventoryMovement, MovementType
+
+
+class StockError(Exception):
+    """Error base de existencias"""
+
+
+class ItemNotFoundError(StockError):
+    """El item de inventario no existe"""
+
+
+class InsufficientStockError(StockError):
+    """La existencia no alcanza para la salida solicitada"""
+
+    def __init__(self, available: int):
+        super().__init__(f"Cantidad insuficiente. Disponible: {available}")
+        self.available = available
+
+
+class StockConflictError(StockError):
+    """La existencia cambió repetidamente durante un ajuste"""
+
+
+def generate_movement_code() -> str:
+    """Genera un código de movimiento único"""
+    return 'MOV-' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+
+
+def generate_batch_prefix() -> str:
+    """Prefijo común para los códigos de un lote (MOV-XXXXXX-0001)"""
+    return 'MOV-' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
+
+
+class InventoryService:
+    """Operaciones atómicas sobre las existencias"""
+
+    # Reintentos del ajuste absoluto cuando otra transacción cambia la existencia
+    ADJUST_RETRIES = 5
+
+    def move_stock(
+        self,
+        db: Session,
+        inventory_id: int,
+        movement_type: MovementType,
+        quantity: int,
+        user_id: int,
+        reason: str,
+        notes: Optional[str] = None,
+        reference_document: Optional[str] = None,
+        commit: bool = True
+    ) -> InventoryMovement:
+        """
+        Registra una entrada (IN) o salida (OUT) de forma atómica
+
+        La salida se ejecuta como
+        `UPDATE inventory SET current_quantity = current_quantity - :q
+         WHERE id = :id AND current_quantity >= :q RETURNING current_quantity`
+        y solo se inserta el movimiento si el UPDATE afectó la fila.
+        """
+        values = {}
+        if movement_type == MovementType.IN:
+            values["current_quantity"] = Inventory.current_quantity + quantity
+            values["last_restock_date"] = datetime.utcnow()
+            condition = Inventory.id == inventory_id
+        elif movement_type == MovementType.OUT:
+            values["current_quantity"] = Inventory.current_quantity - quantity
+            condition = (Inventory.id == inventory_id) & (Inventory.current_quantity >= quantity)
+        else:
+            raise StockError("Use el ajuste para movimientos de tipo ADJUSTMENT")
+
+        new_quantity = db.execute(
+            update(Inventory)
+            .where(condition)
+            .values(**values)
+            .returning(Inventory.current_quantity)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+
+        if new_quantity is None:
+            available = db.query(Inventory.current_quantity).filter(Inventory.id == inventory_id).scalar()
+            if available is None:
+                raise ItemNotFoundError("Item de inventario no encontrado")
+            raise InsufficientStockError(available)
+
+        previous_quantity = new_quantity + quantity if movement_type == MovementType.OUT else new_quantity - quantity
+
+        movement = InventoryMovement(
+            movement_code=generate_movement_code(),
+            inventory_id=inventory_id,
+            user_id=user_id,
+            movement_type=movement_type,
+            quantity=quantity,
+            previous_quantity=previous_quantity,
+            new_quantity=new_quantity,
+            reason=reason,
+            notes=notes,
+            reference_document=reference_document
+        )
+        db.add(movement)
+
+        if commit:
+            db.commit()
+            db.refresh(movement)
+        else:
+            db.flush()
+        return movement
+
+    def set_stock(
+        self,
+        db: Session,
+        inventory_id: int,
+        new_quantity: int,
+        user_id: int,
+        reason: str,
+        notes: Optional[str] = None
+    ) -> InventoryMovement:
+        """
+        Fija la existencia a un valor absoluto (conteo físico)
+
+        Se usa compare-and-set: el UPDATE solo aplica si la existencia sigue
+        siendo la leída; si otra transacción la cambió, se vuelve a leer.
+        """
+        for _ in range(self.ADJUST_RETRIES):
+            previous_quantity = db.query(Inventory.current_quantity).filter(
+                Inventory.id == inventory_id
+            ).scalar()
+            if previous_quantity is None:
+                raise ItemNotFoundError("Item de inventario no encontrado")
+
+            difference = new_quantity - previous_quantity
+            if difference == 0:
+                raise StockError("La nueva cantidad es igual a la actual")
+
+            values = {"current_quantity": new_quantity}
+            if difference > 0:
+                values["last_restock_date"] = datetime.utcnow()
+
+            result = db.execute(
+                update(Inventory)
+                .where(Inventory.id == inventory_id, Inventory.current_quantity == previous_quantity)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 1:
+                break
+            db.rollback()
+        else:
+            raise StockConflictError("La existencia cambió durante el ajuste, intente de nuevo")
+
+        movement = InventoryMovement(
+            movement_code=generate_movement_code(),
+            inventory_id=inventory_id,
+            user_id=user_id,
+            movement_type=MovementType.ADJUSTMENT,
+            quantity=abs(difference),
+            previous_quantity=previous_quantity,
+            new_quantity=new_quantity,
+            reason=reason,
+            notes=notes
+        )
+        db.add(movement)
+        db.commit()
+        return movement
+
+    def apply_batch(
+        self,
+        db: Session,
+        lines: List[Any],
+        user_id: int,
+        default_reason: str,
+        atomic: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Aplica un lote de movimientos con operaciones por conjunto
+
+        1. Bloquea los items del lote (UPDATE sin cambios: toma el bloqueo de
+           escritura en SQLite y bloquea las filas en PostgreSQL).
+        2. Lee las existencias de todos los items en una consulta.
+        3. Simula las líneas en orden, validando salidas y conteos.
+        4. Escribe las existencias finales y los movimientos con un
+           executemany cada uno.
+
+        Args:
+            lines: Objetos con inventory_id/item_code, movement_type, quantity,
+                   reason, notes y reference_document
+            atomic: Si es True y alguna línea falla, no se aplica ninguna
+        """
+        ids = {line.inventory_id for line in lines if line.inventory_id}
+        codes = {line.item_code for line in lines if line.item_code and not line.inventory_id}
+
+        conditions = []
+        if ids:
+            conditions.append(Inventory.id.in_(ids))
+        if codes:
+            conditions.append(Inventory.item_code.in_(codes))
+
+        stock: Dict[int, int] = {}
+        id_by_code: Dict[str, int] = {}
+        if conditions:
+            db.execute(
+                update(Inventory)
+                .where(or_(*conditions))
+                .values(current_quantity=Inventory.current_quantity)
+                .execution_options(synchronize_session=False)
+            )
+            for item_id, item_code, quantity in db.query(
+                Inventory.id, Inventory.item_code, Inventory.current_quantity
+            ).filter(or_(*conditions)):
+                stock[item_id] = quantity
+                id_by_code[item_code] = item_id
+
+        original = dict(stock)
+        prefix = generate_batch_prefix()
+        now = datetime.utcnow()
+        results: List[Dict[str, Any]] = []
+        movement_rows: List[Dict[str, Any]] = []
+        restocked = set()
+
+        for number, line in enumerate(lines, start=1):
+            item_id = line.inventory_id or id_by_code.get(line.item_code)
+            if item_id not in stock:
+                results.append({"line": number, "status": "error", "error": "Item de inventario no encontrado"})
+                continue
+
+            previous = stock[item_id]
+            if line.movement_type == MovementType.IN:
+                new = previous + line.quantity
+            elif line.movement_type == MovementType.OUT:
+                if line.quantity > previous:
+                    results.append({
+                        "line": number, "status": "error", "inventory_id": item_id,
+                        "error": f"Cantidad insuficiente. Disponible: {previous}"
+                    })
+                    continue
+                new = previous - line.quantity
+            elif line.movement_type == MovementType.ADJUSTMENT:
+                new = line.quantity
+            else:
+                results.append({
+                    "line": number, "status": "error", "inventory_id": item_id,
+                    "error": f"Tipo de movimiento no soportado en lote: {line.movement_type.value}"
+                })
+                continue
+
+            if new == previous:
+                results.append({
+                    "line": number, "status": "unchanged", "inventory_id": item_id,
+                    "previous_quantity": previous, "new_quantity": new
+                })
+                continue
+
+            if new > previous:
+                restocked.add(item_id)
+            stock[item_id] = new
+            code = f"{prefix}-{len(movement_rows) + 1:04d}"
+            movement_rows.append({
+                "movement_code": code,
+                "inventory_id": item_id,
+                "user_id": user_id,
+                "movement_type": line.movement_type,
+                "quantity": abs(new - previous),
+                "previous_quantity": previous,
+                "new_quantity": new,
+                "reason": line.reason or default_reason,
+                "notes": line.notes,
+                "reference_document": line.reference_document
+            })
+            results.append({
+                "line": number, "status": "applied", "inventory_id": item_id,
+                "movement_code": code, "previous_quantity": previous, "new_quantity": new
+            })
+
+        failed = sum(1 for result in results if result["status"] == "error")
+        if not movement_rows or (atomic and failed):
+            db.rollback()
+            if atomic and failed:
+                for result in results:
+                    if result["status"] == "applied":
+                        result["status"] = "rolled_back"
+            return {"committed": False, "applied": 0, "failed": failed, "results": results}
+
+        changed = [
+            {"item_id": item_id, "quantity": quantity}
+            for item_id, quantity in stock.items() if quantity != original[item_id]
+        ]
+        if changed:  # Un lote que se compensa (+5, -5) no cambia existencias
+            db.execute(
+                update(Inventory.__table__)
+                .where(Inventory.__table__.c.id == bindparam("item_id"))
+                .values(current_quantity=bindparam("quantity")),
+                changed
+            )
+        if restocked:
+            db.execute(
+                update(Inventory.__table__)
+                .where(Inventory.__table__.c.id.in_(restocked))
+                .values(last_restock_date=now)
+            )
+        db.execute(insert(InventoryMovement.__table__), movement_rows)
+
+        # Los INSERT de Core no pasan por el flush del ORM: emitir los eventos explícitamente
+        movement_ids = dict(
+            db.query(InventoryMovement.movement_code, InventoryMovement.id)
+            .filter(InventoryMovement.movement_code.like(f"{prefix}-%"))
+        )
+        for row in movement_rows:
+            emit(db, StockMoved(
+                inventory_id=row["inventory_id"],
+                movement_id=movement_ids.get(row["movement_code"]),
+                movement_type=row["movement_type"].value,
+                quantity=row["quantity"],
+                previous_quantity=row["previous_quantity"],
+                new_quantity=row["new_quantity"]
+            ))
+
+        db.commit()
+        return {"committed": True, "applied": len(movement_rows), "failed": failed, "results": results}
+
+
+# Instancia global del servicio
+inventory_service = InventoryService()
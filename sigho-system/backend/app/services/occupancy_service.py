@@ -0,0 +1,94 @@
+"""
+Servicio de Ocupación
+
+Habitaciones ocupadas por noche en un período, con una sola consulta en
+lugar de una por día:
+
+- PostgreSQL: generate_series produce las noches del período y cada una se
+  cruza (LEFT JOIN) con las estadías que la incluyen; la base devuelve una
+  fila por noche con su conteo.
+- SQLite (sin generate_series): se leen las estadías que se superponen al
+  período y se acumulan en memoria con un arreglo de diferencias (+1 al
+  entrar, -1 al salir).
+
+En ambos casos una reserva ocupa las noches [check_in_date, check_out_date).
+"""
+from datetime import date
+from typing import List, Sequence
+
+from sqlalchemy import Date, and_, func, literal, select
+from sqlalchemy.orm import Session
+
+from app.database.dialect import backend_name
+from app.models.reservation import Reservation, ReservationStatus
+
+
+class OccupancyService:
+    """Ocupación por noche"""
+
+    def nightly(
+        self,
+        db: Session,
+        start: date,
+        end: date,
+        statuses: Sequence[ReservationStatus],
+        *criteria,
+        source=Reservation
+    ) -> List[int]:
+        """
+        Habitaciones ocupadas por noche en [start, end)
+
+        Args:
+            statuses: Estados de reserva que ocupan habitación
+            criteria: Filtros adicionales sobre las reservas
+            source: Reservation o la unión con el archivo (archive_service.source)
+        """
+        days = (end - start).days
+        if days <= 0:
+            return []
+        if backend_name(db) == "postgresql":
+            return self._nightly_series(db, start, days, statuses, criteria, source)
+        return self._nightly_deltas(db, start, end, days, statuses, criteria, source)
+
+    def _nightly_series(self, db: Session, start: date, days: int, statuses, criteria, source) -> List[int]:
+        """Una fila por noche con generate_series (PostgreSQL)"""
+        nights = func.generate_series(0, days - 1).table_valued("n").render_derived(name="nights")
+        night = literal(start, Date) + nights.c.n
+        rows = db.execute(
+            select(nights.c.n, func.count(source.id))
+            .select_from(nights)
+            .outerjoin(source, and_(
+                source.status.in_(statuses),
+                source.check_in_date <= night,
+                source.check_out_date > night,
+                *criteria
+            ))
+            .group_by(nights.c.n)
+        )
+        occupancy = [0] * days
+        for offset, occupied in rows:
+            occupancy[offset] = occupied
+        return occupancy
+
+    def _nightly_deltas(self, db: Session, start: date, end: date, days: int, statuses, criteria, source) -> List[int]:
+        """Estadías del período acumuladas en memoria (SQLite)"""
+        deltas = [0] * (days + 1)
+        stays = db.query(source.check_in_date, source.check_out_date).filter(
+            source.status.in_(statuses),
+            source.check_in_date < end,
+            source.check_out_date > start,
+            *criteria
+        )
+        for check_in, check_out in stays:
+            deltas[max((check_in - start).days, 0)] += 1
+            deltas[min((check_out - start).days, days)] -= 1
+
+        occupancy, running = [], 0
+        for delta in deltas[:days]:
+            running += delta
+            occupancy.append(running)
+        return occupancy
+
+
+# Instancia global del servicio
+occupancy_service = OccupancyService()
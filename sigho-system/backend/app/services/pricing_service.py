@@ -0,0 +1,403 @@
+"""
+Servicio de Tarifas
+
+Las reglas de precio (temporadas, días de la semana y ocupación) se evalúan
+una sola vez por (tipo de habitación, fecha, moneda) y el resultado se
+materializa en la grilla `room_rates`. Cotizar una estadía es sumar las filas
+de sus noches en una consulta; el descuento por duración de estadía, que
+depende de la estadía y no de la fecha, se aplica sobre esa suma.
+
+La grilla se regenera de forma incremental: al cambiar una regla solo se
+recalculan los tipos de habitación y fechas que abarca (antes y después del
+cambio), al cambiar el precio base solo ese tipo, y al cambiar una reserva
+solo las fechas cuya ocupación cambió, si hay reglas de ocupación.
+"""
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.events import ReservationChanged
+from app.database.session import SessionLocal
+from app.models.pricing import PricingRule, PricingRuleType, RoomRate
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.room import Room
+from app.models.room_type import RoomType
+from app.services.occupancy_service import occupancy_service
+
+logger = logging.getLogger("sigho.pricing")
+
+# Reservas que ocupan habitación (mismos estados que la verificación de disponibilidad)
+BLOCKING_STATUSES = (
+    ReservationStatus.PENDING,
+    ReservationStatus.CONFIRMED,
+    ReservationStatus.CHECKED_IN
+)
+
+# Reglas que dependen de la fecha y se materializan en la grilla
+NIGHTLY_RULE_TYPES = (
+    PricingRuleType.SEASON,
+    PricingRuleType.DAY_OF_WEEK,
+    PricingRuleType.OCCUPANCY
+)
+
+# Un alcance de regeneración: (tipo de habitación o None = todos, desde, hasta)
+Scope = Tuple[Optional[int], Optional[date], Optional[date]]
+
+
+def base_prices(room_type: RoomType) -> Dict[str, float]:
+    """Precio base por moneda de un tipo de habitación"""
+    prices = {
+        "VES": room_type.base_price_ves,
+        "USD": room_type.base_price_usd,
+        "EUR": room_type.base_price_eur or room_type.base_price_usd * 0.92
+    }
+    return {currency: prices[currency] for currency in settings.currencies_list if currency in prices}
+
+
+def _applies(rule: PricingRule, room_type_id: int, day: date) -> bool:
+    """La regla aplica al tipo de habitación y a la fecha"""
+    if rule.room_type_id is not None and rule.room_type_id != room_type_id:
+        return False
+    if rule.start_date is not None and day < rule.start_date:
+        return False
+    if rule.end_date is not None and day > rule.end_date:
+        return False
+    return True
+
+
+def _best(rules: Sequence[PricingRule]) -> Optional[PricingRule]:
+    """Entre las reglas coincidentes gana la de mayor prioridad y, a igualdad, la más específica"""
+    if not rules:
+        return None
+    return max(rules, key=lambda r: (r.priority, r.room_type_id is not None, r.min_occupancy or 0, r.min_nights or 0))
+
+
+class PricingService:
+    """Reglas de precio, grilla materializada y cotización"""
+
+    def horizon(self) -> Tuple[date, date]:
+        """Rango [hoy, hoy + horizonte) que se mantiene materializado"""
+        today = date.today()
+        return today, today + timedelta(days=settings.PRICING_HORIZON_DAYS)
+
+    def active_rules(self, db: Session, rule_types: Iterable[PricingRuleType]) -> List[PricingRule]:
+        """Reglas activas de los tipos indicados"""
+        return db.query(PricingRule).filter(
+            PricingRule.is_active == True,
+            PricingRule.rule_type.in_(list(rule_types))
+        ).all()
+
+    def occupancy(self, db: Session, room_type_id: int, start: date, end: date) -> List[float]:
+        """Porcentaje de ocupación por noche del tipo de habitación en [start, end)"""
+        days = (end - start).days
+        total_rooms = db.query(func.count(Room.id)).filter(
+            Room.room_type_id == room_type_id,
+            Room.is_active == True
+        ).scalar() or 0
+        if total_rooms == 0 or days <= 0:
+            return [0.0] * max(days, 0)
+
+        occupied = occupancy_service.nightly(
+            db, start, end, BLOCKING_STATUSES,
+            Reservation.room_id.in_(select(Room.id).where(Room.room_type_id == room_type_id))
+        )
+        return [100.0 * rooms / total_rooms for rooms in occupied]
+
+    def nightly_adjustment(
+        self,
+        rules: Sequence[PricingRule],
+        room_type_id: int,
+        day: date,
+        occupancy: float
+    ) -> float:
+        """Ajuste total (porcentaje) de una noche: temporada × día de la semana × ocupación"""
+        factor = 1.0
+        for rule_type in NIGHTLY_RULE_TYPES:
+            candidates = [
+                rule for rule in rules
+                if rule.rule_type == rule_type and _applies(rule, room_type_id, day)
+            ]
+            if rule_type == PricingRuleType.DAY_OF_WEEK:
+                candidates = [rule for rule in candidates if day.weekday() in rule.weekdays]
+            elif rule_type == PricingRuleType.OCCUPANCY:
+                candidates = [rule for rule in candidates if occupancy >= (rule.min_occupancy or 0)]
+            rule = _best(candidates)
+            if rule:
+                factor *= 1 + rule.adjustment_percent / 100
+        return (factor - 1) * 100
+
+    def compute_rates(
+        self,
+        db: Session,
+        room_type: RoomType,
+        start: date,
+        end: date,
+        rules: Optional[Sequence[PricingRule]] = None
+    ) -> List[Dict[str, Any]]:
+        """Filas de la grilla de un tipo de habitación en [start, end)"""
+        if rules is None:
+            rules = self.active_rules(db, NIGHTLY_RULE_TYPES)
+        prices = base_prices(room_type)
+        needs_occupancy = any(rule.rule_type == PricingRuleType.OCCUPANCY for rule in rules)
+        days = (end - start).days
+        occupancy = self.occupancy(db, room_type.id, start, end) if needs_occupancy else [0.0] * days
+
+        rows = []
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            adjustment = self.nightly_adjustment(rules, room_type.id, day, occupancy[offset])
+            for currency, base in prices.items():
+                rows.append({
+                    "room_type_id": room_type.id,
+                    "rate_date": day,
+                    "currency": currency,
+                    "price": round(base * (1 + adjustment / 100), 2),
+                    "adjustment_percent": round(adjustment, 4)
+                })
+        return rows
+
+    def regenerate(
+        self,
+        db: Session,
+        room_type_ids: Optional[Iterable[int]] = None,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        commit: bool = True
+    ) -> int:
+        """
+        Recalcula la grilla en [start, end) para los tipos indicados
+
+        Por defecto todos los tipos activos y todo el horizonte. El rango se
+        recorta al horizonte. Retorna la cantidad de filas escritas.
+        """
+        horizon_start, horizon_end = self.horizon()
+        start = max(start or horizon_start, horizon_start)
+        end = min(end or horizon_end, horizon_end)
+        if start >= end:
+            return 0
+
+        query = db.query(RoomType).filter(RoomType.is_active == True)
+        if room_type_ids is not None:
+            query = query.filter(RoomType.id.in_(list(room_type_ids)))
+        room_types = query.all()
+
+        rules = self.active_rules(db, NIGHTLY_RULE_TYPES)
+        written = 0
+        for room_type in room_types:
+            rows = self.compute_rates(db, room_type, start, end, rules)
+            db.execute(delete(RoomRate).where(
+                RoomRate.room_type_id == room_type.id,
+                RoomRate.rate_date >= start,
+                RoomRate.rate_date < end
+            ))
+            if rows:
+                db.execute(insert(RoomRate), rows)
+            written += len(rows)
+
+        if commit:
+            db.commit()
+        return written
+
+    def regenerate_scopes(self, db: Session, scopes: Iterable[Scope]) -> int:
+        """
+        Regenera los alcances de reglas modificadas (estado anterior y nuevo)
+
+        Un alcance sin tipo de habitación abarca todos los tipos; uno sin
+        fechas abarca todo el horizonte.
+        """
+        written = 0
+        for room_type_id, start, end in scopes:
+            written += self.regenerate(
+                db,
+                room_type_ids=None if room_type_id is None else [room_type_id],
+                start=start,
+                end=end + timedelta(days=1) if end else None,
+                commit=False
+            )
+        db.commit()
+        return written
+
+    def ensure_horizon(self, db: Session) -> int:
+        """Completa la grilla hasta el horizonte (solo las fechas que faltan)"""
+        horizon_start, horizon_end = self.horizon()
+        last_dates = dict(
+            db.query(RoomRate.room_type_id, func.max(RoomRate.rate_date))
+            .filter(RoomRate.rate_date >= horizon_start)
+            .group_by(RoomRate.room_type_id)
+        )
+        written = 0
+        for (room_type_id,) in db.query(RoomType.id).filter(RoomType.is_active == True):
+            last = last_dates.get(room_type_id)
+            start = last + timedelta(days=1) if last else horizon_start
+            if start < horizon_end:
+                written += self.regenerate(db, [room_type_id], start, horizon_end, commit=False)
+        db.commit()
+        return written
+
+    # ========== COTIZACIÓN ==========
+    def length_of_stay_rule(
+        self,
+        db: Session,
+        room_type_id: int,
+        check_in: date,
+        nights: int
+    ) -> Optional[PricingRule]:
+        """Regla de duración de estadía aplicable (la de mayor prioridad y mínimo de noches)"""
+        rules = [
+            rule for rule in self.active_rules(db, [PricingRuleType.LENGTH_OF_STAY])
+            if _applies(rule, room_type_id, check_in) and nights >= (rule.min_nights or 0)
+        ]
+        return _best(rules)
+
+    def nightly_prices(
+        self,
+        db: Session,
+        room_type: RoomType,
+        check_in: date,
+        check_out: date,
+        currency: str
+    ) -> Dict[date, float]:
+        """
+        Precio de cada noche desde la grilla; las noches fuera del horizonte
+        materializado se evalúan al vuelo sin guardarlas
+        """
+        prices = dict(
+            db.query(RoomRate.rate_date, RoomRate.price).filter(
+                RoomRate.room_type_id == room_type.id,
+                RoomRate.currency == currency,
+                RoomRate.rate_date >= check_in,
+                RoomRate.rate_date < check_out
+            )
+        )
+        if len(prices) < (check_out - check_in).days:
+            missing = [
+                row for row in self.compute_rates(db, room_type, check_in, check_out)
+                if row["currency"] == currency and row["rate_date"] not in prices
+            ]
+            prices.update((row["rate_date"], row["price"]) for row in missing)
+        return prices
+
+    def quote(
+        self,
+        db: Session,
+        room_type: RoomType,
+        check_in: date,
+        check_out: date,
+        currency: str
+    ) -> Dict[str, Any]:
+        """
+        Cotiza una estadía
+
+        Raises:
+            ValueError: Si las fechas o la moneda no son válidas
+        """
+        nights = (check_out - check_in).days
+        if nights <= 0:
+            raise ValueError("La fecha de salida debe ser posterior a la fecha de entrada")
+        if currency not in base_prices(room_type):
+            raise ValueError("Moneda no válida")
+
+        prices = self.nightly_prices(db, room_type, check_in, check_out, currency)
+        subtotal = sum(prices.values())
+
+        los_rule = self.length_of_stay_rule(db, room_type.id, check_in, nights)
+        los_percent = los_rule.adjustment_percent if los_rule else 0.0
+        subtotal = round(subtotal * (1 + los_percent / 100), 2)
+
+        return {
+            "room_type_id": room_type.id,
+            "currency": currency,
+            "total_nights": nights,
+            "subtotal": subtotal,
+            "price_per_night": round(subtotal / nights, 2),
+            "length_of_stay_percent": los_percent,
+            "nightly": [
+                {"date": day, "price": price} for day, price in sorted(prices.items())
+            ]
+        }
+
+    def stay_totals(
+        self,
+        db: Session,
+        room_types: Sequence[RoomType],
+        check_in: date,
+        check_out: date
+    ) -> Dict[Tuple[int, str], float]:
+        """
+        Subtotal de la estadía por (tipo de habitación, moneda) para varios tipos
+
+        Una consulta agrupada sobre la grilla; solo los tipos con noches fuera
+        del horizonte se cotizan por separado.
+        """
+        nights = (check_out - check_in).days
+        ids = [room_type.id for room_type in room_types]
+        totals: Dict[Tuple[int, str], float] = {}
+        counts: Dict[Tuple[int, str], int] = {}
+        if ids:
+            rows = db.query(
+                RoomRate.room_type_id, RoomRate.currency, func.sum(RoomRate.price), func.count(RoomRate.id)
+            ).filter(
+                RoomRate.room_type_id.in_(ids),
+                RoomRate.rate_date >= check_in,
+                RoomRate.rate_date < check_out
+            ).group_by(RoomRate.room_type_id, RoomRate.currency)
+            for room_type_id, currency, total, count in rows:
+                totals[(room_type_id, currency)] = total
+                counts[(room_type_id, currency)] = count
+
+        for room_type in room_types:
+            los_rule = self.length_of_stay_rule(db, room_type.id, check_in, nights)
+            factor = 1 + (los_rule.adjustment_percent if los_rule else 0.0) / 100
+            for currency in base_prices(room_type):
+                key = (room_type.id, currency)
+                if counts.get(key) == nights:
+                    totals[key] = round(totals[key] * factor, 2)
+                else:
+                    totals[key] = self.quote(db, room_type, check_in, check_out, currency)["subtotal"]
+        return totals
+
+    # ========== MANEJADORES DEL BUS ==========
+    def on_reservation_changed(self, domain_event: ReservationChanged):
+        """
+        Recalcula las noches cuya ocupación cambió, solo si hay reglas de ocupación
+        """
+        db = SessionLocal()
+        try:
+            if not self.active_rules(db, [PricingRuleType.OCCUPANCY]):
+                return
+
+            if domain_event.deleted:
+                # Se desconocen las fechas de la reserva eliminada: recalcular el horizonte del tipo
+                room_type_id = db.query(Room.room_type_id).filter(Room.id == domain_event.room_id).scalar()
+                if room_type_id is not None:
+                    self.regenerate(db, [room_type_id])
+                return
+
+            reservation = db.query(Reservation).filter(Reservation.id == domain_event.reservation_id).first()
+            if reservation is None:
+                return
+
+            moved = {"room_id", "check_in_date", "check_out_date"} & set(domain_event.changed_fields)
+            if "room_id" in moved:
+                # Se desconoce la habitación anterior: recalcular todos los tipos
+                self.regenerate(db)
+            elif moved:
+                # Se desconocen las fechas anteriores: recalcular el horizonte del tipo
+                self.regenerate(db, [reservation.room.room_type_id])
+            else:
+                self.regenerate(
+                    db,
+                    [reservation.room.room_type_id],
+                    reservation.check_in_date,
+                    reservation.check_out_date
+                )
+        finally:
+            db.close()
+
+
+# Instancia global del servicio
+pricing_service = PricingService()
@@ -0,0 +1,193 @@
+"""
+Servicio de Existencias Históricas
+
+Los movimientos de inventario son el libro mayor de existencias: cada uno
+registra `previous_quantity` y `new_quantity`, así que la variación de un
+item en un período es `SUM(new_quantity - previous_quantity)`. Para no
+recorrer todo el historial en cada consulta se guardan instantáneas
+periódicas (diarias o de fin de mes) y la existencia a una fecha se calcula
+como la instantánea más cercana anterior más los movimientos posteriores.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.inventory import Inventory, InventoryCategory
+from app.models.inventory_movement import InventoryMovement
+from app.models.inventory_snapshot import InventorySnapshot
+from app.services.archive_service import archive_service
+
+
+def day_cutoff(day: date) -> datetime:
+    """Inicio del día siguiente: límite exclusivo de los movimientos del día"""
+    return datetime.combine(day + timedelta(days=1), time.min)
+
+
+class StockLedgerService:
+    """Existencias a una fecha e instantáneas periódicas"""
+
+    def _latest_snapshots(self, as_of: date):
+        """Subconsulta con la instantánea más reciente de cada item hasta `as_of`"""
+        latest = (
+            select(
+                InventorySnapshot.inventory_id,
+                func.max(InventorySnapshot.snapshot_date).label("snapshot_date")
+            )
+            .where(InventorySnapshot.snapshot_date <= as_of)
+            .group_by(InventorySnapshot.inventory_id)
+            .subquery()
+        )
+        return (
+            select(
+                InventorySnapshot.inventory_id,
+                InventorySnapshot.quantity,
+                InventorySnapshot.unit_cost,
+                InventorySnapshot.cutoff_at
+            )
+            .join(latest, and_(
+                InventorySnapshot.inventory_id == latest.c.inventory_id,
+                InventorySnapshot.snapshot_date == latest.c.snapshot_date
+            ))
+            .subquery()
+        )
+
+    def quantities_as_of(
+        self,
+        db: Session,
+        as_of: date,
+        category: Optional[InventoryCategory] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Existencia de cada item al cierre de `as_of`
+
+        Retorna {inventory_id: {"quantity", "unit_cost"}}; `unit_cost` es el
+        de la instantánea usada o None si el item no tenía instantánea.
+        Son dos consultas agrupadas, independientes del tamaño del historial
+        anterior a la última instantánea.
+        """
+        snapshots = self._latest_snapshots(as_of)
+        end = day_cutoff(as_of)
+
+        base_query = db.query(
+            snapshots.c.inventory_id, snapshots.c.quantity, snapshots.c.unit_cost
+        )
+        if category:
+            base_query = base_query.join(Inventory, Inventory.id == snapshots.c.inventory_id).filter(
+                Inventory.category == category
+            )
+        result = {
+            item_id: {"quantity": quantity, "unit_cost": unit_cost}
+            for item_id, quantity, unit_cost in base_query
+        }
+
+        # Los movimientos archivados son anteriores a una instantánea: el filtro
+        # por cutoff_at los descarta salvo que `as_of` sea anterior a ella
+        movements = archive_service.source(db, InventoryMovement, end=as_of)
+        delta_query = db.query(
+            movements.inventory_id,
+            func.sum(movements.new_quantity - movements.previous_quantity)
+        ).outerjoin(
+            snapshots, snapshots.c.inventory_id == movements.inventory_id
+        ).filter(
+            movements.movement_date < end,
+            or_(snapshots.c.cutoff_at.is_(None), movements.movement_date >= snapshots.c.cutoff_at)
+        )
+        if category:
+            delta_query = delta_query.join(Inventory, Inventory.id == movements.inventory_id).filter(
+                Inventory.category == category
+            )
+        for item_id, delta in delta_query.group_by(movements.inventory_id):
+            entry = result.setdefault(item_id, {"quantity": 0, "unit_cost": None})
+            entry["quantity"] += int(delta or 0)
+
+        return result
+
+    def valuation_as_of(
+        self,
+        db: Session,
+        as_of: date,
+        category: Optional[InventoryCategory] = None
+    ) -> Dict[str, Any]:
+        """Valor del inventario al cierre de `as_of`, por moneda y categoría"""
+        quantities = self.quantities_as_of(db, as_of, category)
+        items = db.query(Inventory).filter(Inventory.id.in_(quantities.keys())).all() if quantities else []
+
+        totals: Dict[str, float] = {}
+        by_category: Dict[str, Dict[str, Any]] = {}
+        rows = []
+        for item in sorted(items, key=lambda i: i.item_code):
+            entry = quantities[item.id]
+            if entry["quantity"] == 0:
+                continue
+            # Sin instantánea se usa el costo actual del item
+            unit_cost = entry["unit_cost"] if entry["unit_cost"] is not None else item.unit_cost
+            value = entry["quantity"] * unit_cost
+
+            totals[item.currency] = totals.get(item.currency, 0) + value
+            group = by_category.setdefault(item.category.value, {"count": 0, "total_value": {}})
+            group["count"] += 1
+            group["total_value"][item.currency] = round(group["total_value"].get(item.currency, 0) + value, 2)
+
+            rows.append({
+                "id": item.id,
+                "item_code": item.item_code,
+                "name": item.name,
+                "category": item.category.value,
+                "quantity": entry["quantity"],
+                "unit_cost": unit_cost,
+                "total_value": round(value, 2),
+                "currency": item.currency
+            })
+
+        return {
+            "as_of": as_of.isoformat(),
+            "summary": {
+                "total_items": len(rows),
+                "total_value": {currency: round(value, 2) for currency, value in totals.items()}
+            },
+            "by_category": by_category,
+            "items": rows
+        }
+
+    def take_snapshot(self, db: Session, snapshot_date: date) -> int:
+        """
+        Guarda la existencia de todos los items al cierre de `snapshot_date`
+
+        Solo se admiten días cerrados (anteriores a hoy): una instantánea del
+        día en curso quedaría desactualizada con los movimientos siguientes.
+        Si ya existía una instantánea para esa fecha se reemplaza. El costo
+        unitario se congela con el valor vigente al tomarla. Retorna la
+        cantidad de filas guardadas.
+        """
+        if snapshot_date >= date.today():
+            raise ValueError("Solo se pueden tomar instantáneas de días cerrados")
+
+        quantities = self.quantities_as_of(db, snapshot_date)
+        items = {
+            item_id: (unit_cost, currency)
+            for item_id, unit_cost, currency in db.query(Inventory.id, Inventory.unit_cost, Inventory.currency)
+        }
+        cutoff = day_cutoff(snapshot_date)
+        rows = [
+            {
+                "inventory_id": item_id,
+                "snapshot_date": snapshot_date,
+                "cutoff_at": cutoff,
+                "quantity": entry["quantity"],
+                "unit_cost": items[item_id][0],
+                "currency": items[item_id][1]
+            }
+            for item_id, entry in quantities.items() if item_id in items
+        ]
+
+        db.execute(delete(InventorySnapshot).where(InventorySnapshot.snapshot_date == snapshot_date))
+        if rows:
+            db.execute(insert(InventorySnapshot), rows)
+        db.commit()
+        return len(rows)
+
+
+# Instancia global del servicio
+stock_ledger_service = StockLedgerService()
@@ -4,12 +4,11 @@ Script para inicializar la base de datos con usuario admin
 from app.database.session import SessionLocal
 from app.models.user import User, UserRole
 from app.core.security import get_password_hash
-from app.database.session import engine
-from app.database.base import Base
+from app.database.migrations import ensure_schema
 
 def init_database():
     print("[INFO] Creando tablas...")
-    Base.metadata.create_all(bind=engine)
+    ensure_schema()
     
     db = SessionLocal()
     try:
@@ -2,13 +2,29 @@
 Sistema Integrado de Gestion Hotelera (SIGHO)
 Backend FastAPI + SQLite3
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import TimingMiddleware, instrument_engine, metrics_registry
 from app.database.session import engine
-from app.database.base import Base
-from app.database.init_db import init_db
+from app.database.init_db import init_db, refresh_derived_data
+from app.database.migrations import ensure_schema
 from app.database.session import SessionLocal
+from app.core.events import (
+    PaymentRecorded,
+    ReservationChanged,
+    RoomStatusChanged,
+    event_bus,
+    install_event_hooks
+)
+from app.core.room_board import room_board
+from app.services.guest_stats_service import guest_stats_service
+from app.services.pricing_service import pricing_service
 
 # Importar routers
 from app.api.endpoints import (
@@ -24,17 +40,100 @@ from app.api.endpoints import (
     inventory,
     reports,
     dashboard,
-    invoices
+    invoices,
+    profiler,
+    pricing,
+    exchange_rates,
+    analytics
 )
 
+
+def refresh_derived_data_task():
+    """Actualiza los datos derivados con su propia sesión (en un hilo aparte)"""
+    db = SessionLocal()
+    try:
+        refresh_derived_data(db)
+    except Exception as e:
+        print(f"Error al actualizar los datos derivados: {e}")
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Arranque y apagado de la aplicacion
+
+    Antes de atender peticiones solo se verifica la versión del esquema y se
+    cargan los datos iniciales en una base vacía; la proyección de
+    estadísticas y la grilla de precios se completan en segundo plano (las
+    cotizaciones calculan al vuelo las noches que aún falten).
+    """
+    print(f"Iniciando {settings.APP_NAME} v{settings.APP_VERSION}")
+    
+    # Verificar la versión del esquema (migra las bases nuevas o atrasadas)
+    ensure_schema()
+    
+    # Con varios workers el lanzador (scripts/serve.py) ya hizo esto una sola vez
+    refresh = None
+    if settings.RUN_STARTUP_TASKS:
+        # Inicializar datos de prueba
+        db = SessionLocal()
+        try:
+            init_db(db)
+        except Exception as e:
+            print(f"Error al inicializar la base de datos: {e}")
+        finally:
+            db.close()
+        
+        refresh = asyncio.create_task(asyncio.to_thread(refresh_derived_data_task))
+    
+    print(f"[OK] Servidor iniciado en http://{settings.HOST}:{settings.PORT}")
+    print(f"[DOCS] Documentacion API: http://{settings.HOST}:{settings.PORT}/docs")
+    
+    yield
+    
+    # No cerrar la base mientras el hilo de actualización siga escribiendo
+    if refresh is not None:
+        await refresh
+
+
 # Crear aplicacion FastAPI
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="API REST para el Sistema Integrado de Gestion Hotelera",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Comprimir respuestas grandes (reportes, listados)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY
 )
 
+# Tiempos por peticion (Server-Timing), conteo de consultas SQL y consultas lentas
+if settings.METRICS_ENABLED:
+    instrument_engine(engine, settings.SLOW_QUERY_THRESHOLD_MS)
+    app.add_middleware(TimingMiddleware)
+
+# Eventos de dominio publicados al confirmar cada transacción
+install_event_hooks(SessionLocal)
+
+# Publicar cambios de estado de habitaciones al tablero en tiempo real
+event_bus.subscribe(RoomStatusChanged, room_board.on_room_status_changed)
+
+# Mantener la proyección de estadísticas de huéspedes
+event_bus.subscribe(ReservationChanged, guest_stats_service.on_reservation_changed)
+event_bus.subscribe(PaymentRecorded, guest_stats_service.on_payment_recorded)
+
+# Recalcular la grilla de precios cuando cambia la ocupación (reglas de ocupación)
+event_bus.subscribe(ReservationChanged, pricing_service.on_reservation_changed)
+
 # Configurar CORS
 app.add_middleware(
     CORSMiddleware,
@@ -45,27 +144,6 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Evento que se ejecuta al iniciar la aplicacion"""
-    print(f"Iniciando {settings.APP_NAME} v{settings.APP_VERSION}")
-    
-    # Crear tablas si no existen
-    Base.metadata.create_all(bind=engine)
-    
-    # Inicializar datos de prueba
-    db = SessionLocal()
-    try:
-        init_db(db)
-    except Exception as e:
-        print(f"Error al inicializar la base de datos: {e}")
-    finally:
-        db.close()
-    
-    print(f"[OK] Servidor iniciado en http://{settings.HOST}:{settings.PORT}")
-    print(f"[DOCS] Documentacion API: http://{settings.HOST}:{settings.PORT}/docs")
-
-
 @app.get("/")
 async def root():
     """Endpoint raiz"""
@@ -87,6 +165,15 @@ async def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Metricas en formato de texto de Prometheus"""
+    return PlainTextResponse(
+        metrics_registry.render(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 # Incluir routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Autenticacion"])
 app.include_router(users.router, prefix="/api/users", tags=["Usuarios"])
@@ -101,10 +188,15 @@ app.include_router(inventory.router, prefix="/api/inventory", tags=["Inventario"
 app.include_router(reports.router, prefix="/api/reports", tags=["Reportes"])
 app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
 app.include_router(invoices.router, prefix="/api/invoices", tags=["Facturacion"])
+app.include_router(pricing.router, prefix="/api/pricing", tags=["Tarifas"])
+app.include_router(exchange_rates.router, prefix="/api/exchange-rates", tags=["Tasas de Cambio"])
+app.include_router(analytics.router, prefix="/api/analytics", tags=["Analitica"])
+app.include_router(profiler.router, prefix="/api/admin/profiler", tags=["Diagnostico"])
 
 
 if __name__ == "__main__":
     import uvicorn
+    # Para varios workers usar scripts/serve.py
     uvicorn.run(
         "main:app",
         host=settings.HOST,
@@ -1,16 +1,16 @@
 """
 Script para poblar la base de datos con datos de prueba
 """
-from app.database.session import SessionLocal, engine
-from app.database.base import Base
+from app.database.session import SessionLocal
+from app.database.migrations import ensure_schema
 from app.models.user import User, UserRole
 from app.models.room_type import RoomType
 from app.models.room import Room, RoomStatus
 import bcrypt
 
 def populate_database():
-    # Crear todas las tablas
-    Base.metadata.create_all(bind=engine)
+    # Crear o actualizar el esquema
+    ensure_schema()
     
     db = SessionLocal()
     try:
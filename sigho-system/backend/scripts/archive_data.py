@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Archivo histórico
+Mueve a la base de archivo (ARCHIVE_PATH) las reservas cerradas con más de
+ARCHIVE_AFTER_MONTHS meses, con sus pagos y facturas, y los movimientos de
+inventario ya cubiertos por una instantánea de existencias. Los reportes
+consultan el archivo automáticamente cuando el rango de fechas lo abarca.
+Pensado para ejecutarse mensualmente, después de un respaldo.
+
+Uso:
+    python scripts/archive_data.py --dry-run      # Solo mostrar qué se archivaría
+    python scripts/archive_data.py
+    python scripts/archive_data.py --months 36
+    python scripts/archive_data.py --list
+"""
+import sys
+import os
+import argparse
+import time
+
+# Agregar el directorio backend al path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.database.session import SessionLocal
+from app.database.migrations import ensure_schema
+from app.services.archive_service import archive_service, months_ago, ArchiveError
+
+
+def list_partitions():
+    """Muestra los años archivados"""
+    db = SessionLocal()
+    try:
+        partitions = archive_service.partitions(db)
+    finally:
+        db.close()
+
+    if not partitions:
+        print("[INFO] No hay datos archivados")
+        return
+    print(f"Base de archivo: {archive_service.path}")
+    for partition in partitions:
+        print(
+            f"  {partition.name}: {partition.min_date} a {partition.max_date}  "
+            f"reservas={partition.reservation_count} pagos={partition.payment_count} "
+            f"facturas={partition.invoice_count} movimientos={partition.movement_count}"
+        )
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Archivo histórico de reservas y movimientos")
+    parser.add_argument("--months", type=int, default=settings.ARCHIVE_AFTER_MONTHS,
+                        help=f"Antigüedad mínima en meses (por defecto: {settings.ARCHIVE_AFTER_MONTHS})")
+    parser.add_argument("--dry-run", action="store_true", help="Solo contar lo que se archivaría")
+    parser.add_argument("--list", action="store_true", help="Listar los años archivados")
+    args = parser.parse_args()
+
+    # La tabla de particiones puede no existir aún
+    ensure_schema()
+
+    if args.list:
+        list_partitions()
+        return
+
+    print(f"[INFO] Corte: {months_ago(args.months).isoformat()}")
+    start = time.perf_counter()
+    try:
+        results = archive_service.archive(args.months, dry_run=args.dry_run)
+    except ArchiveError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    if not results:
+        print("[INFO] No hay datos para archivar")
+        return
+    label = "a archivar" if args.dry_run else "archivadas"
+    for year, counts in sorted(results.items()):
+        detail = ", ".join(f"{table}={count}" for table, count in counts.items())
+        print(f"[OK] {year} ({label}): {detail}")
+    if not args.dry_run:
+        print(f"[OK] Archivo completado en {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Respaldo en línea de la base de datos
+Copia la base SQLite mientras el servidor está en uso (API de respaldo en
+línea de SQLite, por tramos de páginas), verifica la copia con
+PRAGMA integrity_check, la comprime con gzip y conserva solo los
+respaldos más recientes. Puede ejecutarse desde cron o quedar en ejecución
+con --every-hours.
+
+Uso:
+    python scripts/backup_db.py                          # Un respaldo
+    python scripts/backup_db.py --dir /respaldos --keep 30
+    python scripts/backup_db.py --every-hours 6          # Respaldo periódico
+    python scripts/backup_db.py --quick --no-compress    # Verificación rápida, sin comprimir
+    python scripts/backup_db.py --list
+"""
+import sys
+import os
+import argparse
+import time
+from datetime import datetime
+
+# Agregar el directorio backend al path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.backup_service import backup_service, BackupError
+
+
+def format_size(size: int) -> str:
+    """Tamaño legible"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def run_backup(args) -> bool:
+    """Ejecuta un respaldo e imprime el resultado"""
+    try:
+        result = backup_service.backup(
+            directory=args.dir,
+            compress=not args.no_compress,
+            quick_check=args.quick,
+            keep=args.keep,
+            pages_per_step=args.pages,
+            step_sleep_ms=args.sleep_ms
+        )
+    except (BackupError, OSError) as e:
+        print(f"[ERROR] {e}")
+        return False
+
+    timings = result["timings"]
+    copy_rate = result["database_size"] / timings["copy"] / (1024 * 1024) if timings["copy"] else 0
+    print(f"[OK] {result['path']}")
+    print(f"     Base: {format_size(result['database_size'])} ({result['pages']} páginas)"
+          f"  Respaldo: {format_size(result['backup_size'])}")
+    print(f"     Copia: {timings['copy']:.2f} s ({copy_rate:.1f} MB/s, {result['steps']} pasos,"
+          f" {result['restarts']} reinicios{', un solo paso' if result['single_step'] else ''})")
+    print(f"     Verificación: {timings['verify']:.2f} s")
+    if "compress" in timings:
+        print(f"     Compresión: {timings['compress']:.2f} s")
+    for path in result["removed"]:
+        print(f"     Eliminado por rotación: {os.path.basename(path)}")
+    return True
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Respaldo en línea de la base de datos")
+    parser.add_argument("--dir", default=settings.BACKUP_DIR,
+                        help=f"Directorio de respaldos (por defecto: {settings.BACKUP_DIR})")
+    parser.add_argument("--keep", type=int, default=settings.BACKUP_KEEP,
+                        help=f"Respaldos a conservar (por defecto: {settings.BACKUP_KEEP}; 0 = todos)")
+    parser.add_argument("--no-compress", action="store_true", help="No comprimir con gzip")
+    parser.add_argument("--quick", action="store_true",
+                        help="Verificar con PRAGMA quick_check (más rápido en bases grandes)")
+    parser.add_argument("--pages", type=int, default=settings.BACKUP_PAGES_PER_STEP,
+                        help="Páginas copiadas por paso")
+    parser.add_argument("--sleep-ms", type=float, default=settings.BACKUP_STEP_SLEEP_MS,
+                        help="Pausa entre pasos en milisegundos")
+    parser.add_argument("--every-hours", type=float,
+                        help="Repetir el respaldo cada N horas hasta interrumpir con Ctrl+C")
+    parser.add_argument("--list", action="store_true", help="Listar los respaldos existentes")
+    args = parser.parse_args()
+
+    if args.list:
+        backups = backup_service.list_backups(args.dir)
+        for path in backups:
+            print(f"{os.path.basename(path)}  {format_size(os.path.getsize(path))}")
+        if not backups:
+            print("[INFO] No hay respaldos")
+        return
+
+    if not args.every_hours:
+        sys.exit(0 if run_backup(args) else 1)
+
+    interval = args.every_hours * 3600
+    print(f"[INFO] Respaldo cada {args.every_hours} h en {os.path.abspath(args.dir)} (Ctrl+C para detener)")
+    try:
+        while True:
+            started = time.monotonic()
+            print(f"[INFO] {datetime.now():%Y-%m-%d %H:%M:%S} iniciando respaldo")
+            run_backup(args)
+            time.sleep(max(interval - (time.monotonic() - started), 0))
+    except KeyboardInterrupt:
+        print("\n[INFO] Respaldo periódico detenido")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark de serialización y compresión de respuestas
+Compara json (JSONResponse de Starlette) contra orjson (ORJSONResponse) y
+mide los bytes enviados con gzip / brotli para payloads de reportes
+"""
+import json
+import time
+import zlib
+import random
+from datetime import date, timedelta
+
+import orjson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+ITERATIONS = 20
+STATUSES = ["pending", "confirmed", "checked_in", "checked_out", "cancelled"]
+
+
+def reservations_report(rows: int) -> dict:
+    """Payload equivalente a /api/reports/reservations"""
+    start = date(2025, 1, 1)
+    return {
+        "period": {"start_date": "2025-01-01", "end_date": "2025-12-31", "days": 365},
+        "summary": {"total_reservations": rows, "total_revenue_usd": 123456.78},
+        "by_status": {status: rows // len(STATUSES) for status in STATUSES},
+        "reservations": [
+            {
+                "id": i,
+                "confirmation_code": f"R{i:07d}",
+                "guest_id": random.randint(1, 5000),
+                "room_id": random.randint(1, 72),
+                "check_in_date": (start + timedelta(days=i % 365)).isoformat(),
+                "check_out_date": (start + timedelta(days=i % 365 + 3)).isoformat(),
+                "total_nights": 3,
+                "status": random.choice(STATUSES),
+                "total_amount": round(random.uniform(50, 900), 2),
+                "paid_amount": round(random.uniform(0, 900), 2),
+                "balance": round(random.uniform(0, 100), 2),
+                "currency": random.choice(["VES", "USD", "EUR"])
+            }
+            for i in range(rows)
+        ]
+    }
+
+
+def occupancy_report(days: int) -> dict:
+    """Payload equivalente a /api/reports/occupancy"""
+    start = date(2025, 1, 1)
+    return {
+        "period": {"start_date": "2025-01-01", "days": days},
+        "summary": {"total_rooms": 72},
+        "daily_data": [
+            {
+                "date": (start + timedelta(days=i)).isoformat(),
+                "occupied_rooms": random.randint(0, 72),
+                "available_rooms": random.randint(0, 72),
+                "occupancy_rate": round(random.uniform(0, 100), 2)
+            }
+            for i in range(days)
+        ]
+    }
+
+
+def timed(func, *args) -> tuple:
+    """Ejecuta una función ITERATIONS veces y devuelve (resultado, ms promedio)"""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        result = func(*args)
+    return result, (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def starlette_json(content) -> bytes:
+    """Misma codificación que starlette.responses.JSONResponse.render"""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def gzip_compress(data: bytes) -> bytes:
+    """Misma compresión que CompressionMiddleware con nivel 6"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def main():
+    """Función principal del benchmark"""
+    payloads = {
+        "reservas (500 filas)": reservations_report(500),
+        "reservas (10.000 filas)": reservations_report(10_000),
+        "ocupación (365 días)": occupancy_report(365),
+    }
+
+    print("=" * 78)
+    print("BENCHMARK DE RESPUESTAS")
+    print("=" * 78)
+
+    for name, payload in payloads.items():
+        raw, json_ms = timed(starlette_json, payload)
+        _, orjson_ms = timed(orjson.dumps, payload)
+        gz, gzip_ms = timed(gzip_compress, raw)
+
+        print(f"\n{name}")
+        print(f"  Serialización json:    {json_ms:8.2f} ms")
+        print(f"  Serialización orjson:  {orjson_ms:8.2f} ms  ({json_ms / orjson_ms:4.1f}x)")
+        print(f"  Sin comprimir:         {len(raw):10,} bytes")
+        print(f"  gzip (nivel 6):        {len(gz):10,} bytes  "
+              f"({len(gz) / len(raw):5.1%})  {gzip_ms:6.2f} ms")
+
+        if brotli is not None:
+            br, brotli_ms = timed(brotli.compress, raw, brotli.MODE_TEXT, 4)
+            print(f"  brotli (calidad 4):    {len(br):10,} bytes  "
+                  f"({len(br) / len(raw):5.1%})  {brotli_ms:6.2f} ms")
+        else:
+            print("  brotli:                no instalado")
+
+
+if __name__ == "__main__":
+    main()
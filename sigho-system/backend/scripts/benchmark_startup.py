@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Benchmark del arranque del servidor
+Mide en un proceso nuevo el tiempo de importar main (con
+`python -X importtime`) y el de ejecutar el lifespan de la aplicación,
+lista los módulos más costosos y verifica que las dependencias pesadas
+(ReportLab, DuckDB, Alembic, PyArrow) no se carguen al arrancar.
+
+Termina con código 1 si se supera el presupuesto o se carga un módulo
+diferido, para usarlo en CI. El presupuesto fijo es holgado porque el
+tiempo depende de la máquina; para detectar regresiones se guarda una
+línea base en la misma máquina y se compara contra ella con una tolerancia.
+
+Uso:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --budget-ms 1500 --runs 5
+    python scripts/benchmark_startup.py --import-only   # Sin ejecutar el lifespan (no toca la base)
+    python scripts/benchmark_startup.py --save-baseline startup_baseline.json
+    python scripts/benchmark_startup.py --baseline startup_baseline.json --tolerance 0.25
+"""
+import sys
+import os
+import argparse
+import json
+import statistics
+import subprocess
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos que solo deben cargarse al usarse por primera vez
+DEFERRED_MODULES = ("reportlab", "duckdb", "alembic", "pyarrow", "openpyxl")
+
+CHILD_SCRIPT = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+startup = None
+if "--lifespan" in sys.argv:
+    async def run():
+        async with main.app.router.lifespan_context(main.app):
+            return time.perf_counter()
+    startup = asyncio.run(run()) - imported
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": startup * 1000 if startup is not None else None,
+    "modules": sorted(sys.modules)
+}))
+"""
+
+
+def parse_importtime(stderr: str):
+    """Filas (acumulado_us, propio_us, módulo) de la salida de -X importtime"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line.split(":", 1)[1].split("|")
+        rows.append((int(cumulative), int(own), name.strip()))
+    return rows
+
+
+def run_once(lifespan: bool) -> dict:
+    """Importa main (y ejecuta el lifespan) en un intérprete nuevo"""
+    command = [sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT]
+    if lifespan:
+        command.append("--lifespan")
+    result = subprocess.run(command, cwd=BACKEND_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr[-2000:])
+        raise SystemExit("[ERROR] No se pudo importar la aplicación")
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    data["importtime"] = parse_importtime(result.stderr)
+    return data
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Benchmark del arranque del servidor")
+    parser.add_argument("--runs", type=int, default=3, help="Ejecuciones medidas (se informa la mediana)")
+    parser.add_argument("--budget-ms", type=float, default=4000.0,
+                        help="Presupuesto para importar main y ejecutar el arranque")
+    parser.add_argument("--baseline", help="Comparar contra una línea base guardada (en lugar del presupuesto)")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Margen sobre la línea base antes de fallar (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", help="Guardar la medición como línea base en este archivo")
+    parser.add_argument("--top", type=int, default=15, help="Módulos más costosos a mostrar")
+    parser.add_argument("--import-only", action="store_true",
+                        help="Medir solo la importación (no ejecuta migraciones ni datos iniciales)")
+    args = parser.parse_args()
+
+    lifespan = not args.import_only
+    # La primera ejecución compila los .pyc y calienta la caché de disco
+    run_once(lifespan)
+    runs = [run_once(lifespan) for _ in range(args.runs)]
+
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    startup_ms = statistics.median(run["startup_ms"] for run in runs) if lifespan else 0.0
+    last = runs[-1]
+
+    print(f"Módulos más costosos (acumulado, ejecución {len(runs)}):")
+    for cumulative, own, name in sorted(last["importtime"], reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {own / 1000:7.1f} ms propio  {name}")
+
+    print(f"\nImportar main: {import_ms:.0f} ms (mediana de {len(runs)})")
+    if lifespan:
+        print(f"Lifespan:      {startup_ms:.0f} ms")
+    total = import_ms + startup_ms
+
+    budget = args.budget_ms
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as baseline_file:
+                baseline = json.load(baseline_file)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"[ERROR] No se pudo leer la línea base: {e}")
+        if baseline.get("import_only") != args.import_only:
+            raise SystemExit("[ERROR] La línea base se midió con otro modo (--import-only)")
+        budget = baseline["total_ms"] * (1 + args.tolerance)
+        print(f"Total:         {total:.0f} ms (línea base {baseline['total_ms']:.0f} ms "
+              f"+ {args.tolerance:.0%} = {budget:.0f} ms)")
+    else:
+        print(f"Total:         {total:.0f} ms (presupuesto {budget:.0f} ms)")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump({
+                "import_ms": round(import_ms, 1),
+                "startup_ms": round(startup_ms, 1),
+                "total_ms": round(total, 1),
+                "import_only": args.import_only,
+                "runs": len(runs)
+            }, baseline_file, indent=2)
+        print(f"[OK] Línea base guardada en {args.save_baseline}")
+
+    failed = False
+    loaded = sorted({
+        name.split(".")[0] for name in last["modules"]
+        if name.split(".")[0] in DEFERRED_MODULES
+    })
+    if loaded:
+        print(f"[ERROR] Módulos diferidos cargados al arrancar: {', '.join(loaded)}")
+        failed = True
+    if total > budget:
+        print(f"[ERROR] Arranque sobre el presupuesto por {total - budget:.0f} ms")
+        failed = True
+    if not failed:
+        print("[OK] Arranque dentro del presupuesto")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
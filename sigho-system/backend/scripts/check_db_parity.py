@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Paridad SQLite / PostgreSQL
+Ejecuta el mismo recorrido de la API (altas de huéspedes, reservas con
+check-in/check-out, pagos, facturas, inventario, mantenimiento y reglas de
+precio) sobre una base SQLite nueva y sobre una base PostgreSQL vacía, y
+compara las respuestas de los reportes, el dashboard y las búsquedas.
+También genera facturas en paralelo para verificar que los números
+secuenciales no se repitan en ninguno de los dos motores.
+
+Cada motor se prueba en un proceso propio (el motor se elige al importar la
+aplicación). Las fechas y horas, los ids de sesión y los códigos aleatorios
+se excluyen de la comparación; el orden de las búsquedas no se compara,
+porque en PostgreSQL con pg_trgm se ordenan por similitud.
+
+Un PostgreSQL descartable para la prueba:
+    docker run --rm -d --name sigho-pg -p 5432:5432 -e POSTGRES_HOST_AUTH_METHOD=trust postgres:16
+    docker exec sigho-pg createdb -U postgres sigho_parity
+
+Termina con código 1 si alguna respuesta difiere entre motores.
+
+Uso:
+    python scripts/check_db_parity.py --postgres-url postgresql+psycopg2://postgres@localhost:5432/sigho_parity
+    python scripts/check_db_parity.py --postgres-url ... --reset   # Vaciar la base PostgreSQL antes de probar
+"""
+import sys
+import os
+import argparse
+import json
+import re
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Valores que cambian entre ejecuciones (generados al azar o con la hora actual)
+VOLATILE_KEYS = {
+    "access_token", "confirmation_code", "payment_code", "movement_code", "maintenance_code",
+    "elapsed_ms", "generated_at"
+}
+DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
+
+PARALLEL_INVOICES = 12
+
+GUESTS = [
+    ("Ana María", "Pérez", "V12345678", "ana_maria@example.com", "04141112233"),
+    ("José", "Rodríguez", "V23456789", "jose.r@example.com", "04142223344"),
+    ("Carlos", "Pereira", "E8765432", "carlos@example.com", "04243334455"),
+    ("Luisa", "Martínez", "V34567890", None, "04164445566"),
+    ("Pedro", "Gómez", "P100%200", "pedro@example.com", "02125556677"),
+    ("Marta", "Pérez Díaz", "V45678901", "marta@example.com", "04125557788"),
+]
+
+# Búsquedas: comodines literales (% y _) y coincidencias parciales
+SEARCHES = ["rez", "ana_m", "100%", "0414", "PER", "example.com"]
+
+
+def normalize(value, key=None):
+    """Quita de la respuesta lo que no debe compararse"""
+    if key in VOLATILE_KEYS:
+        return "<variable>"
+    if isinstance(value, dict):
+        return {k: normalize(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+    if isinstance(value, float):
+        return round(value, 4)
+    if isinstance(value, str) and DATETIME_PATTERN.match(value):
+        return "<fecha-hora>"
+    return value
+
+
+class Recorder:
+    """Cliente de la API que guarda las respuestas normalizadas"""
+
+    def __init__(self, client):
+        self.client = client
+        self.headers = {}
+        self.results = {}
+
+    def call(self, method: str, url: str, unordered: bool = False, record: bool = True, **kwargs):
+        response = self.client.request(method, url, headers=self.headers, **kwargs)
+        try:
+            body = response.json()
+        except ValueError:
+            body = response.text
+        if record:
+            normalized = normalize(body)
+            if unordered and isinstance(normalized, list):
+                normalized = sorted(normalized, key=lambda item: json.dumps(item, sort_keys=True))
+            self.results[f"{method} {url}"] = {"status": response.status_code, "body": normalized}
+        return body
+
+
+def scenario(api: Recorder):
+    """Recorrido de escritura y lectura, idéntico en ambos motores"""
+    today = date.today()
+
+    def day(offset: int) -> str:
+        return (today + timedelta(days=offset)).isoformat()
+
+    api.headers["Authorization"] = "Bearer " + api.call(
+        "POST", "/api/auth/login", json={"username": "admin", "password": "admin123"}
+    )["access_token"]
+
+    for currency, rate in (("VES", 0.0274), ("EUR", 1.09)):
+        api.call("POST", "/api/exchange-rates/", json={"currency": currency, "rate_date": day(-60), "rate": rate})
+
+    guests = []
+    for first_name, last_name, id_number, email, phone in GUESTS:
+        guests.append(api.call("POST", "/api/guests/", json={
+            "first_name": first_name, "last_name": last_name, "id_type": "CI",
+            "id_number": id_number, "email": email, "phone": phone
+        })["id"])
+
+    rooms = sorted(api.call("GET", "/api/rooms/?limit=100", record=False), key=lambda room: room["room_number"])
+    stays = [
+        # (huésped, habitación, entrada, salida, pago, acciones); el pago confirma la reserva
+        (0, 0, -20, -17, (40.0, "USD", "transfer"), ["check-in", "settle", "check-out"]),
+        (1, 1, -10, -3, (25.0, "VES", "cash_ves"), ["check-in", "settle", "check-out"]),
+        (2, 2, -2, 3, (80.0, "USD", "cash_usd"), ["check-in"]),
+        (3, 3, 5, 9, None, []),
+        (4, 4, 1, 4, None, ["cancel"]),
+        (5, 0, -1, 2, (50.0, "EUR", "cash_eur"), ["check-in"]),
+    ]
+    reservations = []
+    for guest, room, check_in, check_out, payment, actions in stays:
+        reservation = api.call("POST", "/api/reservations/", json={
+            "guest_id": guests[guest], "room_id": rooms[room]["id"],
+            "check_in_date": day(check_in), "check_out_date": day(check_out), "currency": "USD"
+        })
+        reservations.append(reservation["id"])
+        if payment:
+            amount, currency, method = payment
+            api.call("POST", "/api/payments/", json={
+                "reservation_id": reservation["id"], "amount": amount,
+                "currency": currency, "payment_method": method
+            })
+        for action in actions:
+            if action == "settle":
+                balance = api.call("GET", f"/api/reservations/{reservation['id']}", record=False)["balance"]
+                api.call("POST", "/api/payments/", json={
+                    "reservation_id": reservation["id"], "amount": balance,
+                    "currency": "USD", "payment_method": "cash_usd"
+                })
+                continue
+            body = {"cancellation_reason": "Cambio de planes"} if action == "cancel" else {}
+            api.call("POST", f"/api/reservations/{reservation['id']}/{action}", json=body)
+
+    for index in (0, 1):
+        invoice = api.call("POST", "/api/invoices/generate", json={
+            "reservation_id": reservations[index], "guest_document_number": GUESTS[index][2]
+        })
+    api.call("PUT", f"/api/invoices/{invoice['id']}/issue")
+
+    items = []
+    for code, name, category in (("PAR-1", "Jabón de tocador", "bathroom"), ("PAR-2", "Sábanas dobles", "bedding")):
+        items.append(api.call("POST", "/api/inventory/", json={
+            "item_code": code, "name": name, "category": category,
+            "unit_of_measure": "unidad", "current_quantity": 10, "minimum_quantity": 20
+        })["id"])
+    api.call("POST", "/api/inventory/movements/", json={
+        "inventory_id": items[0], "movement_type": "in", "quantity": 40, "reason": "Compra mensual"
+    })
+    api.call("POST", "/api/inventory/movements/", json={
+        "inventory_id": items[0], "movement_type": "out", "quantity": 6, "reason": "Reposición de baños"
+    })
+    api.call("POST", "/api/inventory/movements/batch", json={"movements": [
+        {"item_code": "PAR-2", "movement_type": "out", "quantity": 3},
+        {"inventory_id": items[0], "movement_type": "out", "quantity": 2},
+        {"item_code": "NO-EXISTE", "movement_type": "in", "quantity": 1},
+    ]})
+    api.call("POST", f"/api/inventory/{items[1]}/adjust", json={"new_quantity": 4, "reason": "Conteo físico mensual"})
+
+    maintenance = api.call("POST", "/api/maintenance/", json={
+        "room_id": rooms[5]["id"], "title": "Fuga en el baño", "description": "Gotea la llave del lavamanos",
+        "maintenance_type": "corrective", "scheduled_date": day(0), "estimated_cost": 40
+    })
+    api.call("POST", f"/api/maintenance/{maintenance['id']}/start")
+    api.call("POST", f"/api/maintenance/{maintenance['id']}/complete", json={
+        "actual_cost": 35.5, "resolution_notes": "Se cambió el empaque de la llave"
+    })
+
+    room_type = rooms[0]["room_type_id"]
+    api.call("POST", "/api/pricing/rules", json={
+        "name": "Alta ocupación", "rule_type": "occupancy", "min_occupancy": 10, "adjustment_percent": 15
+    })
+    api.call("POST", "/api/pricing/rules", json={
+        "name": "Fin de semana", "rule_type": "day_of_week", "days_of_week": [4, 5], "adjustment_percent": 10
+    })
+
+    # Lecturas comparadas
+    period = f"start_date={day(-30)}&end_date={day(10)}"
+    for url in (
+        "/api/dashboard/overview", "/api/dashboard/occupancy-rate?days=30",
+        "/api/dashboard/revenue-by-period?days=30&normalize=true", "/api/dashboard/reservations-by-status",
+        "/api/dashboard/top-room-types", "/api/dashboard/upcoming-events?days=14", "/api/dashboard/statistics",
+        f"/api/reports/reservations?{period}", f"/api/reports/revenue?{period}",
+        f"/api/reports/occupancy?{period}", f"/api/reports/maintenance?{period}",
+        "/api/reports/inventory", f"/api/reports/inventory/valuation?as_of={day(0)}", "/api/reports/guests",
+        "/api/payments/summary", "/api/invoices/summary", "/api/inventory/forecast", "/api/rooms/summary",
+        f"/api/pricing/quote?room_type_id={room_type}&check_in={day(1)}&check_out={day(6)}&currency=USD",
+        f"/api/pricing/grid?room_type_id={room_type}&start_date={day(0)}&end_date={day(7)}&currency=USD",
+        f"/api/rooms/available?check_in={day(0)}&check_out={day(3)}",
+        f"/api/guests/{guests[0]}/stats", f"/api/inventory/movements/{items[0]}/history",
+        "/api/reservations/?fields=id,status,check_in_date&sort=-check_in_date,id",
+        "/api/invoices/?fields=id,invoice_number,status&sort=id",
+    ):
+        api.call("GET", url)
+    api.call("GET", "/api/inventory/low-stock", unordered=True)
+
+    for text in SEARCHES:
+        api.call("GET", f"/api/guests/search?query={text}", unordered=True)
+        api.call("GET", f"/api/reservations/search?query={text}", unordered=True)
+        api.call("GET", f"/api/reservations/picker?query={text}", unordered=True)
+        api.call("GET", f"/api/invoices/?fields=id&guest_name__contains={text}", unordered=True)
+
+    # Números de factura generados en paralelo
+    def create_invoice(index: int):
+        response = api.client.post("/api/invoices/", headers=api.headers, json={
+            "guest_id": guests[index % len(guests)], "guest_document_number": "V1",
+            "guest_name": "Factura paralela", "items": [{"description": "Consumo", "unit_price": 10}]
+        })
+        return response.status_code, response.json().get("invoice_number")
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_INVOICES) as pool:
+        created = list(pool.map(create_invoice, range(PARALLEL_INVOICES)))
+    numbers = sorted(number for code, number in created if code == 201)
+    api.results["parallel invoice numbers"] = {
+        "status": sorted(code for code, number in created),
+        "body": {
+            "created": len(numbers),
+            "unique": len(set(numbers)) == len(numbers),
+            "sequence": [int(number.rsplit("-", 1)[1]) for number in numbers]
+        }
+    }
+
+
+def run_backend(url: str, output: str):
+    """Prepara la base, ejecuta el recorrido y guarda las respuestas (proceso hijo)"""
+    os.environ.update({
+        "DATABASE_URL": url, "DEBUG": "false", "RUN_STARTUP_TASKS": "false", "PRICING_HORIZON_DAYS": "60"
+    })
+    os.environ.setdefault("SECRET_KEY", "parity-check-" + "x" * 32)
+    sys.path.append(BACKEND_DIR)
+
+    from fastapi.testclient import TestClient
+    from app.database.init_db import init_db, refresh_derived_data
+    from app.database.migrations import ensure_schema
+    from app.database.session import SessionLocal
+    import main
+
+    ensure_schema()
+    db = SessionLocal()
+    try:
+        init_db(db)
+        refresh_derived_data(db)
+    finally:
+        db.close()
+
+    started = time.perf_counter()
+    with TestClient(main.app) as client:
+        api = Recorder(client)
+        scenario(api)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({"elapsed": time.perf_counter() - started, "results": api.results}, f)
+
+
+def prepare_postgres(url: str, reset: bool):
+    """Verifica que la base PostgreSQL esté vacía (o la vacía con --reset)"""
+    from sqlalchemy import create_engine, inspect, text
+
+    engine = create_engine(url)
+    try:
+        with engine.begin() as connection:
+            tables = inspect(connection).get_table_names()
+            if tables and not reset:
+                raise SystemExit(
+                    f"[ERROR] La base PostgreSQL tiene {len(tables)} tablas: use una base vacía o --reset"
+                )
+            if reset:
+                connection.execute(text("DROP SCHEMA public CASCADE"))
+                connection.execute(text("CREATE SCHEMA public"))
+    finally:
+        engine.dispose()
+
+
+def first_difference(left, right, path="$"):
+    """Ruta y valores de la primera diferencia entre dos respuestas"""
+    if type(left) != type(right):
+        return path, left, right
+    if isinstance(left, dict):
+        for key in sorted(set(left) | set(right)):
+            if key not in left or key not in right:
+                return f"{path}.{key}", left.get(key, "<ausente>"), right.get(key, "<ausente>")
+            found = first_difference(left[key], right[key], f"{path}.{key}")
+            if found:
+                return found
+        return None
+    if isinstance(left, list):
+        if len(left) != len(right):
+            return f"{path}[len]", len(left), len(right)
+        for index, (a, b) in enumerate(zip(left, right)):
+            found = first_difference(a, b, f"{path}[{index}]")
+            if found:
+                return found
+        return None
+    return None if left == right else (path, left, right)
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Paridad de resultados entre SQLite y PostgreSQL")
+    parser.add_argument("--postgres-url", default=os.environ.get("PARITY_POSTGRES_URL"),
+                        help="URL de una base PostgreSQL vacía (o PARITY_POSTGRES_URL)")
+    parser.add_argument("--reset", action="store_true", help="Vaciar el esquema public de la base PostgreSQL")
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_backend(args.run, args.output)
+        return
+    if not args.postgres_url:
+        parser.error("se requiere --postgres-url")
+
+    sys.path.append(BACKEND_DIR)
+    prepare_postgres(args.postgres_url, args.reset)
+
+    directory = tempfile.mkdtemp(prefix="sigho-parity-")
+    backends = {
+        "sqlite": f"sqlite:///{os.path.join(directory, 'parity.db')}",
+        "postgresql": args.postgres_url,
+    }
+    outputs = {}
+    for name, url in backends.items():
+        output = os.path.join(directory, f"{name}.json")
+        print(f"[INFO] Ejecutando el recorrido sobre {name}...")
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run", url, "--output", output],
+            cwd=directory, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            print(result.stdout[-2000:], result.stderr[-4000:])
+            raise SystemExit(f"[ERROR] El recorrido falló sobre {name}")
+        with open(output, encoding="utf-8") as f:
+            outputs[name] = json.load(f)
+        print(f"[OK] {len(outputs[name]['results'])} respuestas en {outputs[name]['elapsed']:.1f} s")
+
+    sqlite_results = outputs["sqlite"]["results"]
+    postgres_results = outputs["postgresql"]["results"]
+    differences = 0
+    for key in sqlite_results:
+        found = first_difference(sqlite_results[key], postgres_results.get(key, "<ausente>"))
+        if found:
+            differences += 1
+            path, left, right = found
+            print(f"[ERROR] {key}\n        {path}: sqlite={left!r} postgresql={right!r}")
+
+    print()
+    for name, output in outputs.items():
+        parallel = output["results"]["parallel invoice numbers"]["body"]
+        print(f"Facturas en paralelo ({name}): {parallel['created']}/{PARALLEL_INVOICES} creadas, "
+              f"números {'únicos' if parallel['unique'] else 'REPETIDOS'}")
+        if not parallel["unique"]:
+            differences += 1
+    if differences:
+        print(f"[ERROR] {differences} comprobaciones fallaron")
+        sys.exit(1)
+    print(f"[OK] {len(sqlite_results)} respuestas idénticas en SQLite y PostgreSQL")
+
+
+if __name__ == "__main__":
+    main()
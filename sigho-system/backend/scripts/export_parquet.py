@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Exportación incremental a Parquet de las tablas de hechos
+Exporta las filas nuevas o modificadas desde la última ejecución de
+reservas, pagos, facturas, líneas de factura, movimientos de inventario y
+mantenimientos, en archivos Parquet particionados por fecha, para análisis
+fuera de línea (DuckDB, pandas, Spark...). Pensado para ejecutarse a diario.
+
+Estructura de salida:
+    <salida>/<tabla>/date=YYYY-MM-DD/part-<marca>-<id>.parquet
+    <salida>/_export_state.json
+
+- La marca de agua de cada fila es COALESCE(updated_at, created_at) (solo
+  created_at en tablas sin updated_at) y la partición es su fecha. Una fila
+  modificada se vuelve a exportar en la partición del día de la
+  modificación: al leer, conservar la versión con mayor `_watermark` por id.
+- Las filas se leen en orden (marca, id) con un cursor de streaming y se
+  escriben como grupos de filas de --batch-size; nunca se carga una tabla
+  completa en memoria.
+- Cada archivo se escribe como .tmp y se renombra al cerrarse; recién
+  entonces se guarda el avance en _export_state.json. Si el proceso se
+  interrumpe, la siguiente ejecución continúa desde el último archivo
+  completo.
+- No se exportan filas con marca más reciente que --lag-seconds, para no
+  perder transacciones confirmadas con una marca anterior a la ya leída.
+
+Requiere pyarrow.
+
+Uso:
+    python scripts/export_parquet.py
+    python scripts/export_parquet.py --output /datos/sigho --tables payments reservations
+    python scripts/export_parquet.py --reset invoices   # Reexporta la tabla desde cero
+"""
+import sys
+import os
+import json
+import argparse
+import enum
+import time
+from datetime import datetime, timedelta
+
+# Agregar el directorio backend al path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, String, cast, func, or_, select
+
+from app.database.session import engine
+from app.database.base import Base
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow es opcional (solo para esta exportación)
+    pa = pq = None
+
+EXPORT_TABLES = (
+    "reservations",
+    "payments",
+    "invoices",
+    "invoice_items",
+    "inventory_movements",
+    "maintenance"
+)
+
+STATE_FILE = "_export_state.json"
+
+# Formato de CURRENT_TIMESTAMP en SQLite (UTC), igual al de las marcas guardadas
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def arrow_type(column):
+    """Tipo Arrow de una columna (esquema estable aunque un lote sea todo NULL)"""
+    column_type = column.type
+    if isinstance(column_type, Boolean):
+        return pa.bool_()
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    if isinstance(column_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column_type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def arrow_value(value):
+    """Normaliza los valores que Arrow no convierte directamente"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def load_state(output: str) -> dict:
+    """Avance de la exportación por tabla"""
+    path = os.path.join(output, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(output: str, state: dict):
+    """Guarda el avance de forma atómica"""
+    path = os.path.join(output, STATE_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class PartitionWriter:
+    """Escribe los lotes de una partición en un archivo .tmp y lo publica al cerrar"""
+
+    def __init__(self, directory: str, name: str, schema):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, name)
+        self.tmp_path = self.path + ".tmp"
+        self.writer = pq.ParquetWriter(self.tmp_path, schema, compression="zstd")
+        self.rows = 0
+
+    def write(self, batch):
+        self.writer.write_table(batch)
+        self.rows += batch.num_rows
+
+    def close(self):
+        self.writer.close()
+        os.replace(self.tmp_path, self.path)
+
+
+def export_table(table_name: str, output: str, state: dict, cutoff: str,
+                 batch_size: int, rows_per_file: int) -> int:
+    """
+    Exporta las filas de una tabla posteriores a su marca guardada
+
+    Retorna la cantidad de filas exportadas.
+    """
+    table = Base.metadata.tables[table_name]
+    columns = list(table.columns)
+    if "updated_at" in table.c:
+        watermark = func.coalesce(table.c.updated_at, table.c.created_at)
+    else:
+        watermark = table.c.created_at
+    # Se compara el texto guardado para que la clave (marca, id) sea exacta
+    watermark = cast(watermark, String)
+
+    progress = state.get(table_name, {"watermark": "", "last_id": 0})
+    stmt = select(*columns, watermark.label("_watermark")).where(
+        or_(
+            watermark > progress["watermark"],
+            (watermark == progress["watermark"]) & (table.c.id > progress["last_id"])
+        ),
+        watermark < cutoff
+    ).order_by(watermark, table.c.id)
+
+    schema = pa.schema(
+        [pa.field(column.name, arrow_type(column)) for column in columns]
+        + [pa.field("_watermark", pa.string())]
+    )
+    names = schema.names
+    mark = len(columns)  # Posición de _watermark en cada fila
+    table_dir = os.path.join(output, table_name)
+
+    exported = 0
+    writer = None
+    partition = None
+    previous = None
+
+    def publish(last_watermark: str, last_id: int):
+        """Cierra el archivo actual y registra el avance"""
+        writer.close()
+        state[table_name] = {"watermark": last_watermark, "last_id": last_id}
+        save_state(output, state)
+
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=batch_size).execute(stmt)
+        for rows in result.partitions():
+            # Las filas vienen ordenadas por marca: las particiones son contiguas
+            start = 0
+            while start < len(rows):
+                day = rows[start][mark][:10]
+                end = start
+                while end < len(rows) and rows[end][mark][:10] == day:
+                    end += 1
+                chunk = rows[start:end]
+
+                if writer is not None and (day != partition or writer.rows >= rows_per_file):
+                    publish(previous[0], previous[1])
+                    writer = None
+                if writer is None:
+                    first = chunk[0]
+                    name = "part-{}-{}.parquet".format(
+                        first[mark].replace("-", "").replace(":", "").replace(" ", ""),
+                        first.id
+                    )
+                    writer = PartitionWriter(os.path.join(table_dir, f"date={day}"), name, schema)
+                    partition = day
+
+                data = {name: [arrow_value(row[i]) for row in chunk] for i, name in enumerate(names)}
+                writer.write(pa.Table.from_pydict(data, schema=schema))
+                exported += len(chunk)
+                previous = (chunk[-1][mark], chunk[-1].id)
+                start = end
+
+    if writer is not None:
+        publish(previous[0], previous[1])
+
+    return exported
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Exportación incremental a Parquet")
+    parser.add_argument("--output", default=os.path.join("exports", "parquet"),
+                        help="Directorio de salida (por defecto: exports/parquet)")
+    parser.add_argument("--tables", nargs="+", choices=EXPORT_TABLES, default=list(EXPORT_TABLES),
+                        help="Tablas a exportar (por defecto: todas)")
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="Filas por grupo de filas Parquet")
+    parser.add_argument("--rows-per-file", type=int, default=500000,
+                        help="Filas máximas por archivo dentro de una partición")
+    parser.add_argument("--lag-seconds", type=int, default=60,
+                        help="No exportar filas modificadas en los últimos N segundos")
+    parser.add_argument("--reset", nargs="+", choices=EXPORT_TABLES, default=[],
+                        help="Olvida el avance de estas tablas y las reexporta completas")
+    args = parser.parse_args()
+
+    if pa is None:
+        print("[ERROR] La exportación requiere pyarrow (pip install pyarrow)")
+        sys.exit(1)
+
+    os.makedirs(args.output, exist_ok=True)
+    state = load_state(args.output)
+    for table_name in args.reset:
+        state.pop(table_name, None)
+    save_state(args.output, state)
+
+    cutoff = (datetime.utcnow() - timedelta(seconds=args.lag_seconds)).strftime(TIMESTAMP_FORMAT)
+
+    for table_name in args.tables:
+        start = time.perf_counter()
+        rows = export_table(
+            table_name, args.output, state, cutoff, args.batch_size, args.rows_per_file
+        )
+        elapsed = time.perf_counter() - start
+        print(f"[OK] {table_name}: {rows} filas en {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
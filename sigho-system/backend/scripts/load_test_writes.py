@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga de escritura con varios workers
+Inicia el servidor con scripts/serve.py sobre una base SQLite temporal y
+envía escrituras concurrentes (movimientos de inventario sobre pocos items,
+altas y modificaciones de huéspedes) durante un tiempo fijo. Informa el
+rendimiento, la latencia, las respuestas por código, los errores
+"database is locked" del registro del servidor, y verifica que las
+existencias finales coincidan con los movimientos aceptados.
+
+Termina con código 1 si hubo errores de bloqueo, respuestas 5xx o
+existencias inconsistentes.
+
+Uso:
+    python scripts/load_test_writes.py --workers 4
+    python scripts/load_test_writes.py --workers 4 --concurrency 64 --duration 30
+"""
+import sys
+import os
+import argparse
+import random
+import socket
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from collections import Counter
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HOT_ITEMS = 4  # Pocos items: todas las salidas compiten por las mismas filas
+
+
+def free_port() -> int:
+    """Puerto TCP libre en localhost"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, port: int, directory: str, log_path: str) -> subprocess.Popen:
+    """Inicia scripts/serve.py con una base temporal"""
+    env = dict(os.environ)
+    env.update({
+        "DATABASE_URL": f"sqlite:///{os.path.join(directory, 'load.db')}",
+        "ARCHIVE_PATH": os.path.join(directory, "archive.db"),
+        "DEBUG": "false",
+        "PRICING_HORIZON_DAYS": "30",
+    })
+    env.setdefault("SECRET_KEY", "load-test-" + "x" * 32)
+    log = open(log_path, "w", encoding="utf-8")
+    return subprocess.Popen(
+        [sys.executable, os.path.join(BACKEND_DIR, "scripts", "serve.py"),
+         "--workers", str(workers), "--host", "127.0.0.1", "--port", str(port)],
+        cwd=directory, env=env, stdout=log, stderr=subprocess.STDOUT
+    )
+
+
+def wait_ready(base_url: str, timeout: float = 120.0):
+    """Espera a que /health responda"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=2).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise SystemExit("[ERROR] El servidor no respondió a tiempo")
+
+
+def setup(base_url: str) -> dict:
+    """Token de administrador e items de inventario de prueba"""
+    response = httpx.post(f"{base_url}/api/auth/login", json={"username": "admin", "password": "admin123"})
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    items = []
+    for i in range(HOT_ITEMS):
+        response = httpx.post(f"{base_url}/api/inventory/", headers=headers, json={
+            "item_code": f"LOAD-{i}", "name": f"Item de carga {i}", "category": "cleaning",
+            "unit_of_measure": "unidad", "current_quantity": 0
+        })
+        response.raise_for_status()
+        items.append(response.json()["id"])
+    return {"headers": headers, "items": items}
+
+
+def run_load(base_url: str, context: dict, concurrency: int, duration: float) -> dict:
+    """Envía escrituras desde varios hilos durante `duration` segundos"""
+    results = {"latencies": [], "codes": Counter(), "ops": Counter(), "stock_in": Counter()}
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+    counter = iter(range(10 ** 9))
+
+    def worker(worker_id: int):
+        client = httpx.Client(base_url=base_url, headers=context["headers"], timeout=60)
+        guests = []
+        while time.monotonic() < deadline:
+            choice = random.random()
+            started = time.perf_counter()
+            if choice < 0.5:
+                op = "inventory_movement"
+                item_id = random.choice(context["items"])
+                response = client.post("/api/inventory/movements/", json={
+                    "inventory_id": item_id, "movement_type": "in", "quantity": 1,
+                    "reason": "Prueba de carga"
+                })
+            elif choice < 0.8 or not guests:
+                op = "guest_create"
+                number = next(counter)
+                response = client.post("/api/guests/", json={
+                    "first_name": "Carga", "last_name": f"Prueba {worker_id}",
+                    "id_type": "CI", "id_number": f"L{worker_id:03d}{number:08d}",
+                    "phone": "04141234567"
+                })
+                if response.status_code == 201:
+                    guests.append(response.json()["id"])
+            else:
+                op = "guest_update"
+                response = client.put(f"/api/guests/{random.choice(guests)}", json={
+                    "notes": f"Actualizado {time.time()}"
+                })
+            elapsed = time.perf_counter() - started
+            with lock:
+                results["latencies"].append(elapsed)
+                results["codes"][response.status_code] += 1
+                results["ops"][op] += 1
+                if op == "inventory_movement" and response.status_code == 201:
+                    results["stock_in"][item_id] += 1
+        client.close()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results["elapsed"] = time.perf_counter() - started
+    return results
+
+
+def check_stock(base_url: str, context: dict, stock_in: Counter) -> list:
+    """Items cuyas existencias no coinciden con las entradas aceptadas"""
+    mismatches = []
+    for item_id in context["items"]:
+        item = httpx.get(f"{base_url}/api/inventory/{item_id}", headers=context["headers"]).json()
+        if item["current_quantity"] != stock_in[item_id]:
+            mismatches.append((item_id, item["current_quantity"], stock_in[item_id]))
+    return mismatches
+
+
+def count_lock_errors(log_path: str) -> int:
+    """Errores "database is locked" registrados por los workers"""
+    with open(log_path, encoding="utf-8", errors="replace") as f:
+        return sum(
+            1 for line in f
+            if "database is locked" in line and line.startswith("sqlalchemy.exc.OperationalError")
+        )
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Prueba de carga de escritura con varios workers")
+    parser.add_argument("--workers", type=int, default=4, help="Workers del servidor")
+    parser.add_argument("--concurrency", type=int, default=32, help="Clientes concurrentes")
+    parser.add_argument("--duration", type=float, default=20.0, help="Duración en segundos")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="sigho-load-")
+    log_path = os.path.join(directory, "server.log")
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+
+    print(f"[INFO] Servidor con {args.workers} workers, base temporal en {directory}")
+    server = start_server(args.workers, port, directory, log_path)
+    try:
+        wait_ready(base_url)
+        context = setup(base_url)
+        print(f"[INFO] {args.concurrency} clientes durante {args.duration:.0f} s...")
+        results = run_load(base_url, context, args.concurrency, args.duration)
+        mismatches = check_stock(base_url, context, results["stock_in"])
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    latencies = sorted(results["latencies"])
+    total = len(latencies)
+    ok = sum(count for code, count in results["codes"].items() if code < 400)
+    server_errors = sum(count for code, count in results["codes"].items() if code >= 500)
+    lock_errors = count_lock_errors(log_path)
+
+    print(f"\nEscrituras: {total} en {results['elapsed']:.1f} s "
+          f"({ok / results['elapsed']:.0f} escrituras exitosas/s)")
+    for op, count in sorted(results["ops"].items()):
+        print(f"  {op}: {count}")
+    print("Latencia: p50 {:.0f} ms  p95 {:.0f} ms  p99 {:.0f} ms  max {:.0f} ms".format(
+        statistics.median(latencies) * 1000,
+        latencies[int(total * 0.95) - 1] * 1000,
+        latencies[int(total * 0.99) - 1] * 1000,
+        latencies[-1] * 1000
+    ))
+    print("Respuestas: " + ", ".join(f"{code}={count}" for code, count in sorted(results["codes"].items())))
+    print(f"Errores 'database is locked': {lock_errors}")
+    print(f"Existencias consistentes: {'sí' if not mismatches else mismatches}")
+    print(f"Registro del servidor: {log_path}")
+
+    failed = lock_errors or server_errors or mismatches
+    print("[ERROR] La prueba falló" if failed else "[OK] Sin errores de bloqueo")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
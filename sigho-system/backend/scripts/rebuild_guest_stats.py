@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Reconstrucción de la proyección de estadísticas de huéspedes
+Recalcula guest_stats completa desde reservas y pagos. Usar para la carga
+inicial, después de importar datos directamente en la base o si se
+sospecha que la proyección quedó desactualizada.
+
+Uso:
+    python scripts/rebuild_guest_stats.py
+"""
+import sys
+import os
+import time
+
+# Agregar el directorio backend al path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database.session import SessionLocal
+from app.database.migrations import ensure_schema
+from app.services.guest_stats_service import guest_stats_service
+
+
+def main():
+    """Función principal"""
+    # La tabla puede no existir aún en bases creadas antes de la proyección
+    ensure_schema()
+
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        guests = guest_stats_service.rebuild(db)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+
+    print(f"[OK] Estadísticas reconstruidas para {guests} huéspedes en {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
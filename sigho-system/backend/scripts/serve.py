@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Servidor con varios workers
+Prepara la base de datos una sola vez en este proceso (migraciones, datos
+iniciales, estadísticas de huéspedes y grilla de precios) y luego inicia
+los workers, que al arrancar solo verifican la versión del esquema.
+
+Cada worker es un proceso independiente: sus caches, métricas (/metrics)
+y conexiones al tablero de habitaciones son propias. El tablero detecta
+los cambios hechos por los demás workers sondeando la tabla de
+habitaciones cada ROOM_BOARD_POLL_SECONDS. Las escrituras concurrentes a
+SQLite se coordinan con WAL, espera por bloqueo y reintentos (ver
+app/database/sqlite.py).
+
+Uso:
+    python scripts/serve.py --workers 4
+    python scripts/serve.py --workers 4 --host 0.0.0.0 --port 8000
+    python scripts/serve.py --workers 4 --gunicorn     # gunicorn con workers uvicorn (Linux/macOS)
+"""
+import sys
+import os
+import argparse
+
+# Agregar el directorio backend al path
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+import uvicorn
+
+from app.core.config import settings
+from app.database.init_db import init_db, refresh_derived_data
+from app.database.migrations import ensure_schema
+from app.database.session import SessionLocal, engine
+
+try:
+    import gunicorn
+except ImportError:  # gunicorn es opcional (no funciona en Windows)
+    gunicorn = None
+
+
+def prepare_database():
+    """Migraciones y datos iniciales, antes de iniciar los workers"""
+    ensure_schema()
+    db = SessionLocal()
+    try:
+        init_db(db)
+        refresh_derived_data(db)
+    finally:
+        db.close()
+    # Los workers abren sus propias conexiones
+    engine.dispose()
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Servidor SIGHO con varios workers")
+    parser.add_argument("--workers", type=int, default=max(settings.WORKERS, 1),
+                        help=f"Procesos del servidor (por defecto: {settings.WORKERS})")
+    parser.add_argument("--host", default=settings.HOST, help=f"Dirección (por defecto: {settings.HOST})")
+    parser.add_argument("--port", type=int, default=settings.PORT, help=f"Puerto (por defecto: {settings.PORT})")
+    parser.add_argument("--gunicorn", action="store_true", help="Usar gunicorn como administrador de procesos")
+    args = parser.parse_args()
+
+    if args.gunicorn and gunicorn is None:
+        print("[ERROR] gunicorn no está instalado (pip install gunicorn)")
+        sys.exit(1)
+
+    prepare_database()
+
+    # Los workers heredan el entorno: saben cuántos son y no repiten la preparación
+    os.environ["WORKERS"] = str(args.workers)
+    os.environ["RUN_STARTUP_TASKS"] = "false"
+
+    print(f"[INFO] Iniciando {args.workers} workers en http://{args.host}:{args.port}")
+    if args.gunicorn:
+        os.execvp(sys.executable, [
+            sys.executable, "-m", "gunicorn", "main:app",
+            "--pythonpath", BACKEND_DIR,
+            "--worker-class", "uvicorn.workers.UvicornWorker",
+            "--workers", str(args.workers),
+            "--bind", f"{args.host}:{args.port}"
+        ])
+
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        app_dir=BACKEND_DIR
+    )
+
+
+if __name__ == "__main__":
+    main()
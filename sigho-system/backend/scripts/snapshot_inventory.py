@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Instantáneas de existencias de inventario
+Guarda la existencia de cada item al cierre de un día para que la
+valoración histórica (/api/reports/inventory/valuation) parta de la
+instantánea más cercana. Pensado para ejecutarse a diario (cron o tarea
+programada) poco después de medianoche.
+
+Uso:
+    python scripts/snapshot_inventory.py                    # Cierre de ayer
+    python scripts/snapshot_inventory.py --date 2024-05-31
+    python scripts/snapshot_inventory.py --from 2023-01-01 --monthly   # Relleno de fines de mes
+"""
+import sys
+import os
+import argparse
+from datetime import date, timedelta
+
+# Agregar el directorio backend al path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database.session import SessionLocal
+from app.database.migrations import ensure_schema
+from app.services.stock_ledger_service import stock_ledger_service
+
+
+def month_ends(start: date, end: date):
+    """Últimos días de mes entre start y end (inclusive)"""
+    current = date(start.year, start.month, 1)
+    while True:
+        next_month = date(current.year + current.month // 12, current.month % 12 + 1, 1)
+        month_end = next_month - timedelta(days=1)
+        if month_end > end:
+            break
+        if month_end >= start:
+            yield month_end
+        current = next_month
+
+
+def days_between(start: date, end: date):
+    """Días entre start y end (inclusive)"""
+    current = start
+    while current <= end:
+        yield current
+        current += timedelta(days=1)
+
+
+def main():
+    """Función principal"""
+    yesterday = date.today() - timedelta(days=1)
+
+    parser = argparse.ArgumentParser(description="Instantáneas de existencias de inventario")
+    parser.add_argument("--date", type=date.fromisoformat, default=yesterday,
+                        help="Día a cerrar, o fin del rango con --from (por defecto: ayer)")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat,
+                        help="Inicio de un rango a rellenar")
+    parser.add_argument("--monthly", action="store_true",
+                        help="Con --from, solo los fines de mes del rango")
+    args = parser.parse_args()
+
+    end = min(args.date, yesterday)
+    if args.start:
+        dates = list(month_ends(args.start, end) if args.monthly else days_between(args.start, end))
+    else:
+        dates = [end]
+
+    # La tabla de instantáneas y el índice de movimientos pueden no existir aún
+    ensure_schema()
+
+    db = SessionLocal()
+    try:
+        # En orden cronológico: cada instantánea parte de la anterior
+        for snapshot_date in dates:
+            rows = stock_ledger_service.take_snapshot(db, snapshot_date)
+            print(f"[OK] {snapshot_date.isoformat()}: {rows} items")
+    finally:
+        db.close()
+
+    if not dates:
+        print("[INFO] No hay fechas para procesar")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Prueba de estrés de concurrencia sobre existencias de inventario
+Varios hilos registran salidas sobre un mismo item en una base SQLite
+temporal y se verifica que no se pierdan actualizaciones ni quede stock
+negativo. Con --naive se ejecuta la lectura-modificación-escritura
+anterior para comparar.
+
+Uso:
+    python scripts/stress_inventory.py --threads 16 --ops 50 --stock 500
+"""
+import sys
+import os
+import argparse
+import tempfile
+import threading
+import time
+
+# Agregar el directorio backend al path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database.base import Base, Inventory, InventoryMovement
+from app.models.inventory import InventoryCategory
+from app.models.inventory_movement import MovementType
+from app.services.inventory_service import (
+    inventory_service,
+    generate_movement_code,
+    InsufficientStockError
+)
+
+
+def make_session_factory(path: str):
+    """Motor SQLite independiente de la base de la aplicación"""
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False, "timeout": 30}
+    )
+
+    @event.listens_for(engine, "connect")
+    def _wal(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+def naive_out(db, item_id: int, quantity: int):
+    """Implementación anterior: lee, verifica y escribe el valor calculado"""
+    item = db.query(Inventory).filter(Inventory.id == item_id).first()
+    previous = item.current_quantity
+    if previous < quantity:
+        raise InsufficientStockError(previous)
+    time.sleep(0)  # Cede el GIL entre la lectura y la escritura
+    item.current_quantity = previous - quantity
+    db.add(InventoryMovement(
+        movement_code=generate_movement_code(), inventory_id=item_id, user_id=1,
+        movement_type=MovementType.OUT, quantity=quantity,
+        previous_quantity=previous, new_quantity=previous - quantity, reason="stress"
+    ))
+    db.commit()
+
+
+def run(threads: int, ops: int, stock: int, naive: bool) -> bool:
+    """Ejecuta la prueba y retorna True si las existencias son consistentes"""
+    path = os.path.join(tempfile.mkdtemp(prefix="sigho-stress-"), "stress.db")
+    SessionFactory = make_session_factory(path)
+
+    db = SessionFactory()
+    item = Inventory(
+        item_code="ITM-STRESS", name="Jabón de tocador", category=InventoryCategory.BATHROOM,
+        unit_of_measure="unidad", current_quantity=stock
+    )
+    db.add(item)
+    db.commit()
+    item_id = item.id
+    db.close()
+
+    counters = {"ok": 0, "insufficient": 0, "locked": 0}
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        session = SessionFactory()
+        barrier.wait()
+        for _ in range(ops):
+            try:
+                if naive:
+                    naive_out(session, item_id, 1)
+                else:
+                    inventory_service.move_stock(
+                        session, item_id, MovementType.OUT, 1, user_id=1, reason="stress"
+                    )
+                result = "ok"
+            except InsufficientStockError:
+                session.rollback()
+                result = "insufficient"
+            except OperationalError:
+                session.rollback()
+                result = "locked"
+            with lock:
+                counters[result] += 1
+        session.close()
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    db = SessionFactory()
+    final = db.query(Inventory.current_quantity).filter(Inventory.id == item_id).scalar()
+    movements = db.query(InventoryMovement).filter(InventoryMovement.inventory_id == item_id).count()
+    db.close()
+
+    expected = stock - counters["ok"]
+    consistent = final == expected and movements == counters["ok"] and final >= 0
+
+    print("=" * 60)
+    print(f"MODO: {'lectura-modificación-escritura' if naive else 'UPDATE condicional'}")
+    print("=" * 60)
+    print(f"Hilos x operaciones:   {threads} x {ops} = {threads * ops}")
+    print(f"Existencia inicial:    {stock}")
+    print(f"Salidas exitosas:      {counters['ok']}")
+    print(f"Rechazadas por stock:  {counters['insufficient']}")
+    print(f"Bloqueos de SQLite:    {counters['locked']}")
+    print(f"Movimientos:           {movements}")
+    print(f"Existencia final:      {final} (esperada {expected})")
+    print(f"Tiempo:                {elapsed:.2f} s")
+    print(f"Resultado:             {'CONSISTENTE' if consistent else 'INCONSISTENTE'}")
+    return consistent
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Estrés de concurrencia de inventario")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=50)
+    parser.add_argument("--stock", type=int, default=500)
+    parser.add_argument("--naive", action="store_true", help="Usar la implementación anterior")
+    args = parser.parse_args()
+
+    consistent = run(args.threads, args.ops, args.stock, args.naive)
+    sys.exit(0 if consistent else 1)
+
+
+if __name__ == "__main__":
+    main()
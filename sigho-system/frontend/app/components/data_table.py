@@ -3,16 +3,19 @@ Componente de Tabla de Datos
 """
 import customtkinter as ctk
 from tkinter import ttk
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from config.theme import FONTS
 
 
 class DataTable(ctk.CTkFrame):
     """Tabla de datos reutilizable con funcionalidad de selección"""
-    
-    def __init__(self, parent, columns: List[Dict[str, Any]], 
+
+    def __init__(self, parent, columns: List[Dict[str, Any]],
                  on_double_click: Optional[Callable] = None,
-                 on_select: Optional[Callable] = None):
+                 on_select: Optional[Callable] = None,
+                 virtual: bool = False,
+                 visible_rows: int = 25,
+                 key: Optional[str] = None):
         """
         Args:
             parent: Widget padre
@@ -20,26 +23,45 @@ class DataTable(ctk.CTkFrame):
                     [{"key": "id", "label": "ID", "width": 50}, ...]
             on_double_click: Callback cuando se hace doble clic en una fila
             on_select: Callback cuando se selecciona una fila
+            virtual: Si es True solo se materializan en el Treeview las filas
+                    visibles (para conjuntos de resultados grandes)
+            visible_rows: Número inicial de filas visibles en modo virtual
+            key: Campo que identifica cada fila (por defecto la primera columna)
         """
         super().__init__(parent)
-        
+
         self.columns = columns
         self.on_double_click = on_double_click
         self.on_select = on_select
+        self.virtual = virtual
+        self.visible_rows = max(1, visible_rows)
+        self.key = key or columns[0]["key"]
         self.data = []
-        
+
+        # Índices internos: iid del Treeview -> posición en self.data
+        self._iid_index: Dict[str, int] = {}
+        self._iids: List[str] = []
+        # Valores ya formateados por fila (caché perezosa)
+        self._formatted: List[Optional[Tuple]] = []
+        # Estado del modo virtual
+        self._offset = 0
+        self._slots: List[str] = []
+        self._slot_values: List[Optional[Tuple]] = []
+        self._selected_index: Optional[int] = None
+        self._syncing_selection = False
+
         self.setup_ui()
-    
+
     def setup_ui(self):
         """Configura la interfaz"""
         # Configurar grid
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
-        
+
         # Crear Treeview
         style = ttk.Style()
         style.theme_use("default")
-        
+
         # Configurar estilo
         style.configure(
             "Custom.Treeview",
@@ -57,119 +79,348 @@ class DataTable(ctk.CTkFrame):
         )
         style.map("Custom.Treeview",
                  background=[("selected", "#1f6aa5")])
-        
+
         # Frame para la tabla y scrollbar
         tree_frame = ctk.CTkFrame(self)
         tree_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         tree_frame.grid_rowconfigure(0, weight=1)
         tree_frame.grid_columnconfigure(0, weight=1)
-        
+
         # Scrollbar vertical
-        scrollbar_y = ttk.Scrollbar(tree_frame, orient="vertical")
-        scrollbar_y.grid(row=0, column=1, sticky="ns")
-        
+        self.scrollbar_y = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.scrollbar_y.grid(row=0, column=1, sticky="ns")
+
         # Scrollbar horizontal
         scrollbar_x = ttk.Scrollbar(tree_frame, orient="horizontal")
         scrollbar_x.grid(row=1, column=0, sticky="ew")
-        
+
         # Crear treeview
         column_ids = [col["key"] for col in self.columns]
-        
+
         self.tree = ttk.Treeview(
             tree_frame,
             columns=column_ids,
             show="headings",
             style="Custom.Treeview",
-            yscrollcommand=scrollbar_y.set,
             xscrollcommand=scrollbar_x.set,
             selectmode="browse"
         )
         self.tree.grid(row=0, column=0, sticky="nsew")
-        
+
         # Configurar scrollbars
-        scrollbar_y.config(command=self.tree.yview)
         scrollbar_x.config(command=self.tree.xview)
-        
+        if self.virtual:
+            # En modo virtual el scrollbar recorre self.data, no el Treeview
+            self.tree.configure(height=self.visible_rows)
+            self.scrollbar_y.config(command=self._handle_scroll)
+            self.tree.bind("<Configure>", self._handle_resize)
+            self.tree.bind("<MouseWheel>", self._handle_mousewheel)
+            self.tree.bind("<Button-4>", lambda e: self._scroll_to(self._offset - 3))
+            self.tree.bind("<Button-5>", lambda e: self._scroll_to(self._offset + 3))
+            self.tree.bind("<Up>", self._handle_key_up)
+            self.tree.bind("<Down>", self._handle_key_down)
+            self.tree.bind("<Prior>", lambda e: self._scroll_to(self._offset - len(self._slots)) or "break")
+            self.tree.bind("<Next>", lambda e: self._scroll_to(self._offset + len(self._slots)) or "break")
+        else:
+            self.tree.configure(yscrollcommand=self.scrollbar_y.set)
+            self.scrollbar_y.config(command=self.tree.yview)
+
         # Configurar columnas
         for col in self.columns:
             self.tree.heading(col["key"], text=col["label"])
             width = col.get("width", 100)
             self.tree.column(col["key"], width=width, anchor=col.get("anchor", "w"))
-        
+
         # Bind eventos
         if self.on_double_click:
             self.tree.bind("<Double-1>", self._handle_double_click)
-        
-        if self.on_select:
-            self.tree.bind("<<TreeviewSelect>>", self._handle_select)
-    
+
+        self.tree.bind("<<TreeviewSelect>>", self._handle_select)
+
     def _handle_double_click(self, event):
         """Maneja el doble clic"""
-        selection = self.tree.selection()
-        if selection and self.on_double_click:
-            item_id = selection[0]
-            values = self.tree.item(item_id, "values")
-            
-            # Encontrar el item en los datos
-            for item in self.data:
-                if str(item.get(self.columns[0]["key"])) == values[0]:
-                    self.on_double_click(item)
-                    break
-    
+        item = self.get_selected_item()
+        if item is not None and self.on_double_click:
+            self.on_double_click(item)
+
     def _handle_select(self, event):
         """Maneja la selección"""
+        if self._syncing_selection:
+            return
+
         selection = self.tree.selection()
-        if selection and self.on_select:
-            item_id = selection[0]
-            values = self.tree.item(item_id, "values")
-            
-            # Encontrar el item en los datos
-            for item in self.data:
-                if str(item.get(self.columns[0]["key"])) == values[0]:
-                    self.on_select(item)
-                    break
-    
+        if not selection:
+            return
+
+        self._selected_index = self._selection_index(selection[0])
+
+        item = self.get_selected_item()
+        if item is not None and self.on_select:
+            self.on_select(item)
+
+    def _selection_index(self, iid: str) -> Optional[int]:
+        """Traduce un iid del Treeview a la posición de la fila en self.data"""
+        if self.virtual:
+            if not iid.startswith("slot-"):
+                return None
+            index = self._offset + int(iid[5:])
+            return index if index < len(self.data) else None
+        return self._iid_index.get(iid)
+
+    def _format_row(self, item: Dict[str, Any]) -> Tuple:
+        """Aplica los formatters de columna a una fila"""
+        values = []
+        for col in self.columns:
+            value = item.get(col["key"], "")
+
+            # Formatear valor si hay formatter
+            if "formatter" in col:
+                value = col["formatter"](value)
+
+            values.append(value)
+        return tuple(values)
+
+    def _row_values(self, index: int) -> Tuple:
+        """Obtiene (y guarda en caché) los valores formateados de una fila"""
+        values = self._formatted[index]
+        if values is None:
+            values = self._format_row(self.data[index])
+            self._formatted[index] = values
+        return values
+
+    def _row_iids(self, data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Calcula el iid de cada fila a partir de su clave.
+        Si las claves no son únicas (o están vacías) se usa la posición de la fila.
+        """
+        iids = [str(item.get(self.key)) for item in data]
+        unique = set(iids)
+        if len(unique) != len(iids) or "" in unique:
+            iids = [f"#{i}" for i in range(len(data))]
+        return iids
+
+    def _reuse_formatted(self, data: List[Dict[str, Any]], iids: List[str]) -> List[Optional[Tuple]]:
+        """Reutiliza los valores formateados de las filas que no cambiaron"""
+        previous = {
+            iid: (self.data[index], self._formatted[index])
+            for iid, index in self._iid_index.items()
+        }
+        formatted: List[Optional[Tuple]] = []
+        for iid, item in zip(iids, data):
+            old = previous.get(iid)
+            formatted.append(old[1] if old is not None and old[0] == item else None)
+        return formatted
+
     def load_data(self, data: List[Dict[str, Any]]):
-        """Carga datos en la tabla"""
+        """
+        Carga datos en la tabla.
+        Solo se actualizan en el Treeview las filas que cambiaron respecto
+        a la carga anterior; la selección se conserva si la fila sigue presente.
+        """
+        iids = self._row_iids(data)
+        formatted = self._reuse_formatted(data, iids)
+        previous_values = {
+            iid: self._formatted[index] for iid, index in self._iid_index.items()
+        }
+
+        selected_iid = None
+        if self._selected_index is not None and self._selected_index < len(self._iids):
+            selected_iid = self._iids[self._selected_index]
+
         # Guardar datos
         self.data = data
-        
-        # Limpiar tabla
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Insertar nuevos datos
-        for item in data:
-            values = []
-            for col in self.columns:
-                value = item.get(col["key"], "")
-                
-                # Formatear valor si hay formatter
-                if "formatter" in col:
-                    value = col["formatter"](value)
-                
-                values.append(value)
-            
-            self.tree.insert("", "end", values=values)
-    
+        self._formatted = formatted
+        self._iids = iids
+        self._iid_index = {iid: index for index, iid in enumerate(iids)}
+        self._selected_index = self._iid_index.get(selected_iid) if selected_iid else None
+
+        if self.virtual:
+            self._scroll_to(self._offset, force=True)
+        else:
+            self._apply_diff(previous_values)
+
+    def _apply_diff(self, previous_values: Dict[str, Optional[Tuple]]):
+        """Sincroniza el Treeview con self.data insertando, actualizando o eliminando filas"""
+        existing = set(self.tree.get_children())
+
+        # Eliminar filas que ya no existen
+        removed = existing.difference(self._iid_index)
+        if removed:
+            self.tree.delete(*removed)
+
+        # Insertar o actualizar
+        for index, iid in enumerate(self._iids):
+            values = self._row_values(index)
+            if iid in existing:
+                if previous_values.get(iid) != values:
+                    self.tree.item(iid, values=values)
+            else:
+                self.tree.insert("", "end", iid=iid, values=values)
+
+        # Reordenar solo si el orden cambió
+        if list(self.tree.get_children()) != self._iids:
+            for index, iid in enumerate(self._iids):
+                self.tree.move(iid, "", index)
+
+        self._sync_selection()
+
+    # ========== MODO VIRTUAL ==========
+    def _scroll_to(self, offset: int, force: bool = False):
+        """Desplaza la ventana visible a la fila indicada"""
+        max_offset = max(0, len(self.data) - self.visible_rows)
+        offset = min(max(0, offset), max_offset)
+        if offset == self._offset and not force:
+            return
+        self._offset = offset
+        self._render_window()
+
+    def _render_window(self):
+        """Materializa únicamente las filas visibles reutilizando los mismos items"""
+        count = min(self.visible_rows, len(self.data) - self._offset)
+
+        # Ajustar el número de items del Treeview
+        while len(self._slots) < count:
+            self._slots.append(self.tree.insert("", "end", iid=f"slot-{len(self._slots)}"))
+            self._slot_values.append(None)
+        if len(self._slots) > count:
+            self.tree.delete(*self._slots[count:])
+            del self._slots[count:]
+            del self._slot_values[count:]
+
+        for slot_index, slot in enumerate(self._slots):
+            values = self._row_values(self._offset + slot_index)
+            if self._slot_values[slot_index] != values:
+                self.tree.item(slot, values=values)
+                self._slot_values[slot_index] = values
+
+        self._sync_selection()
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        """Actualiza la posición del scrollbar vertical"""
+        total = len(self.data)
+        if total == 0:
+            self.scrollbar_y.set(0.0, 1.0)
+            return
+        self.scrollbar_y.set(self._offset / total, (self._offset + len(self._slots)) / total)
+
+    def _sync_selection(self):
+        """Refleja self._selected_index en la selección del Treeview sin disparar callbacks"""
+        self._syncing_selection = True
+        try:
+            target = None
+            if self._selected_index is not None:
+                if self.virtual:
+                    slot_index = self._selected_index - self._offset
+                    if 0 <= slot_index < len(self._slots):
+                        target = self._slots[slot_index]
+                else:
+                    target = self._iids[self._selected_index]
+
+            if target:
+                if self.tree.selection() != (target,):
+                    self.tree.selection_set(target)
+            elif self.tree.selection():
+                self.tree.selection_remove(*self.tree.selection())
+        finally:
+            # <<TreeviewSelect>> se procesa después; liberar el flag en idle
+            self.after_idle(self._release_selection_sync)
+
+    def _release_selection_sync(self):
+        """Vuelve a habilitar los callbacks de selección"""
+        self._syncing_selection = False
+
+    def _handle_scroll(self, action: str, *args):
+        """Callback del scrollbar vertical en modo virtual"""
+        if action == "moveto":
+            self._scroll_to(int(float(args[0]) * len(self.data)))
+        elif action == "scroll":
+            amount = int(args[0])
+            if args[1] == "pages":
+                amount *= len(self._slots)
+            self._scroll_to(self._offset + amount)
+
+    def _handle_mousewheel(self, event):
+        """Desplazamiento con la rueda del ratón"""
+        self._scroll_to(self._offset - int(event.delta / 120) * 3)
+        return "break"
+
+    def _handle_key_up(self, event):
+        """Mueve la selección hacia arriba desplazando la ventana si es necesario"""
+        if self._selected_index is None or self._selected_index == 0:
+            return "break"
+        self._select_index(self._selected_index - 1)
+        return "break"
+
+    def _handle_key_down(self, event):
+        """Mueve la selección hacia abajo desplazando la ventana si es necesario"""
+        if self._selected_index is None:
+            self._select_index(self._offset)
+        elif self._selected_index < len(self.data) - 1:
+            self._select_index(self._selected_index + 1)
+        return "break"
+
+    def _select_index(self, index: int):
+        """Selecciona una fila por posición asegurando que sea visible"""
+        self._selected_index = index
+        if index < self._offset:
+            self._scroll_to(index)
+        elif index >= self._offset + len(self._slots):
+            self._scroll_to(index - len(self._slots) + 1)
+        else:
+            self._sync_selection()
+
+        item = self.get_selected_item()
+        if item is not None and self.on_select:
+            self.on_select(item)
+
+    def _handle_resize(self, event):
+        """Recalcula cuántas filas caben en el Treeview al cambiar su tamaño"""
+        if not self._slots:
+            return
+        bbox = self.tree.bbox(self._slots[0])
+        if not bbox:
+            return
+        row_height = bbox[3]
+        rows = max(1, (event.height - bbox[1]) // row_height)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self._scroll_to(self._offset, force=True)
+
+    # ========== API PÚBLICA ==========
     def get_selected_item(self) -> Optional[Dict[str, Any]]:
         """Obtiene el item seleccionado"""
         selection = self.tree.selection()
         if not selection:
             return None
-        
-        item_id = selection[0]
-        values = self.tree.item(item_id, "values")
-        
-        # Encontrar el item en los datos
-        for item in self.data:
-            if str(item.get(self.columns[0]["key"])) == values[0]:
-                return item
-        
-        return None
-    
+
+        index = self._selection_index(selection[0])
+        return self.data[index] if index is not None else None
+
+    def update_columns(self, columns: List[Dict[str, Any]]):
+        """Reemplaza la configuración de columnas de la tabla"""
+        self.clear()
+        self.columns = columns
+        self.key = columns[0]["key"]
+
+        column_ids = [col["key"] for col in columns]
+        self.tree.configure(columns=column_ids)
+        for col in columns:
+            self.tree.heading(col["key"], text=col["label"])
+            width = col.get("width", 100)
+            self.tree.column(col["key"], width=width, anchor=col.get("anchor", "w"))
+
     def clear(self):
         """Limpia la tabla"""
         self.data = []
+        self._formatted = []
+        self._iid_index = {}
+        self._iids = []
+        self._slots = []
+        self._slot_values = []
+        self._offset = 0
+        self._selected_index = None
         for item in self.tree.get_children():
-            self.tree.delete(item)
\ No newline at end of file
+            self.tree.delete(item)
+        if self.virtual:
+            self._update_scrollbar()
@@ -18,6 +18,8 @@ class FormDialog(ctk.CTkToplevel):
             title: Título del diálogo
             fields: Lista de campos del formulario
                    [{"name": "username", "label": "Usuario", "type": "entry", "required": True}, ...]
+                   Los combobox aceptan "search": función(texto) -> lista de valores,
+                   que se llama al escribir para recargar las opciones.
             on_submit: Función callback al enviar (recibe dict con valores)
             initial_values: Valores iniciales para el formulario
             width: Ancho del diálogo
@@ -162,6 +164,8 @@ class FormDialog(ctk.CTkToplevel):
                 widget.set(str(initial_value))
             elif field.get("values"):
                 widget.set(field["values"][0])
+            if field.get("search"):
+                self._bind_search(widget, field["search"])
         
         elif field_type == "checkbox":
             widget = ctk.CTkCheckBox(
@@ -188,6 +192,28 @@ class FormDialog(ctk.CTkToplevel):
                 "required": required
             }
     
+    def _bind_search(self, widget: ctk.CTkComboBox, search: Callable):
+        """Recarga las opciones del combobox al escribir (con retardo)"""
+        pending = {"job": None}
+        
+        def run_search():
+            pending["job"] = None
+            text = widget.get().strip()
+            try:
+                values = search(text)
+            except Exception:
+                return
+            widget.configure(values=values)
+        
+        def on_key(event):
+            if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+                return
+            if pending["job"] is not None:
+                self.after_cancel(pending["job"])
+            pending["job"] = self.after(300, run_search)
+        
+        widget.bind("<KeyRelease>", on_key)
+    
     def get_field_value(self, field_name: str) -> Any:
         """Obtiene el valor de un campo"""
         field_info = self.field_widgets.get(field_name)
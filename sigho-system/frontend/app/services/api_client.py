@@ -60,6 +60,14 @@ class APIClient:
         response = self.session.get(url, params=params, timeout=API_TIMEOUT)
         return self._handle_response(response)
     
+    def get_with_total(self, endpoint: str, params: Optional[Dict] = None) -> tuple:
+        """Petición GET de listado que retorna (datos, total del encabezado X-Total-Count)"""
+        url = f"{self.base_url}{endpoint}"
+        response = self.session.get(url, params=params, timeout=API_TIMEOUT)
+        data = self._handle_response(response)
+        total = response.headers.get("X-Total-Count")
+        return data, int(total) if total is not None else len(data)
+    
     def get_raw(self, endpoint: str, params: Optional[Dict] = None) -> requests.Response:
         """Petición GET que retorna la respuesta sin procesar (para archivos binarios)"""
         url = f"{self.base_url}{endpoint}"
@@ -19,6 +19,10 @@ class GuestService:
         """Obtiene un huésped por ID"""
         return api_client.get(f"/api/guests/{guest_id}")
     
+    def get_stats(self, guest_id: int) -> Dict[str, Any]:
+        """Obtiene las estadísticas acumuladas de un huésped"""
+        return api_client.get(f"/api/guests/{guest_id}/stats")
+    
     def get_by_document(self, id_number: str) -> Dict[str, Any]:
         """Obtiene un huésped por número de documento"""
         return api_client.get(f"/api/guests/by-document/{id_number}")
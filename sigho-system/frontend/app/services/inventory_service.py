@@ -30,6 +30,14 @@ class InventoryService:
         """Obtiene items con stock bajo"""
         return api_client.get("/api/inventory/low-stock")
     
+    def get_forecast(self, category: Optional[str] = None,
+                     only_reorder: bool = False) -> List[Dict[str, Any]]:
+        """Obtiene el pronóstico de consumo y las sugerencias de reposición"""
+        params = {"only_reorder": only_reorder}
+        if category:
+            params["category"] = category
+        return api_client.get("/api/inventory/forecast", params=params)
+    
     def get_by_category(self, category: str) -> List[Dict[str, Any]]:
         """Obtiene items por categoría"""
         return api_client.get(f"/api/inventory/by-category/{category}")
@@ -75,6 +83,16 @@ class InventoryService:
     def create_movement(self, movement_data: Dict[str, Any]) -> Dict[str, Any]:
         """Crea un movimiento de inventario (entrada o salida)"""
         return api_client.post("/api/inventory/movements/", json_data=movement_data)
+    
+    def import_movements(self, movements: List[Dict[str, Any]],
+                         reason: str = "Carga masiva",
+                         atomic: bool = False) -> Dict[str, Any]:
+        """
+        Registra movimientos en lote (una sola petición)
+        Retorna el resultado de cada línea y los totales aplicados/fallidos
+        """
+        data = {"movements": movements, "reason": reason, "atomic": atomic}
+        return api_client.post("/api/inventory/movements/batch", json_data=data)
 
 
 # Instancia global
@@ -16,8 +16,16 @@ class InvoiceService:
                 guest_id: Optional[int] = None,
                 currency: Optional[str] = None,
                 from_date: Optional[str] = None,
-                to_date: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Obtiene todas las facturas"""
+                to_date: Optional[str] = None,
+                fields: Optional[List[str]] = None,
+                sort: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Obtiene todas las facturas
+        
+        Args:
+            fields: Columnas a devolver (el servidor siempre incluye el id)
+            sort: Orden del servidor, ej. "-created_at"
+        """
         params = {"skip": skip, "limit": limit}
         if status:
             params["status"] = status
@@ -29,9 +37,20 @@ class InvoiceService:
             params["from_date"] = from_date
         if to_date:
             params["to_date"] = to_date
+        if fields:
+            params["fields"] = ",".join(fields)
+        if sort:
+            params["sort"] = sort
         
         return api_client.get("/api/invoices/", params=params)
     
+    def get_summary(self, currency: Optional[str] = None) -> Dict[str, Any]:
+        """Obtiene conteos por estado y totales por moneda (agregados en el servidor)"""
+        params = {}
+        if currency:
+            params["currency"] = currency
+        return api_client.get("/api/invoices/summary", params=params)
+    
     def get_by_id(self, invoice_id: int) -> Dict[str, Any]:
         """Obtiene una factura por ID"""
         return api_client.get(f"/api/invoices/{invoice_id}")
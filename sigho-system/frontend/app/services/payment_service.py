@@ -8,14 +8,57 @@ class PaymentService:
     
     def get_all(self, skip: int = 0, limit: int = 100,
                 reservation_id: Optional[int] = None,
-                status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Obtiene todos los pagos"""
+                status: Optional[str] = None,
+                fields: Optional[List[str]] = None,
+                sort: Optional[str] = None,
+                **filters) -> List[Dict[str, Any]]:
+        """Obtiene todos los pagos (ver get_page para los filtros disponibles)"""
+        payments, _ = self.get_page(skip, limit, reservation_id, status, fields, sort, **filters)
+        return payments
+    
+    def get_page(self, skip: int = 0, limit: int = 100,
+                 reservation_id: Optional[int] = None,
+                 status: Optional[str] = None,
+                 fields: Optional[List[str]] = None,
+                 sort: Optional[str] = None,
+                 currency: Optional[str] = None,
+                 payment_method: Optional[str] = None,
+                 from_date: Optional[str] = None,
+                 to_date: Optional[str] = None,
+                 min_amount: Optional[float] = None,
+                 max_amount: Optional[float] = None) -> tuple:
+        """
+        Obtiene una página de pagos filtrados en el servidor
+        
+        Returns:
+            (pagos, total de pagos que cumplen los filtros)
+        """
         params = {"skip": skip, "limit": limit}
         if reservation_id:
             params["reservation_id"] = reservation_id
         if status:
             params["status"] = status
-        return api_client.get("/api/payments/", params=params)
+        if currency:
+            params["currency"] = currency
+        if payment_method:
+            params["payment_method"] = payment_method
+        if from_date:
+            params["from_date"] = from_date
+        if to_date:
+            params["to_date"] = to_date
+        if min_amount is not None:
+            params["min_amount"] = min_amount
+        if max_amount is not None:
+            params["max_amount"] = max_amount
+        if fields:
+            params["fields"] = ",".join(fields)
+        if sort:
+            params["sort"] = sort
+        return api_client.get_with_total("/api/payments/", params=params)
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """Obtiene conteos por estado y montos por moneda (agregados en el servidor)"""
+        return api_client.get("/api/payments/summary")
     
     def get_by_reservation(self, reservation_id: int) -> List[Dict[str, Any]]:
         """Obtiene pagos de una reserva"""
@@ -68,6 +68,14 @@ class ReportService:
             params["low_stock_only"] = low_stock_only
         return api_client.get("/api/reports/inventory", params=params)
     
+    def get_inventory_valuation(self, as_of: str,
+                                category: Optional[str] = None) -> Dict[str, Any]:
+        """Obtiene la valoración del inventario al cierre de una fecha"""
+        params = {"as_of": as_of}
+        if category:
+            params["category"] = category
+        return api_client.get("/api/reports/inventory/valuation", params=params)
+    
     def get_guests(self, country: Optional[str] = None,
                   frequent_only: bool = False) -> Dict[str, Any]:
         """Obtiene reporte de huéspedes"""
@@ -93,6 +101,18 @@ class ReportService:
         if payment_method:
             params["payment_method"] = payment_method
         return api_client.get("/api/reports/payments", params=params)
+    
+    def get_occupancy_cube(self, start_date: str, end_date: str,
+                          granularity: str = "month",
+                          room_type_id: Optional[int] = None,
+                          base_currency: Optional[str] = None) -> Dict[str, Any]:
+        """Obtiene ocupación, ADR y RevPAR por período y tipo de habitación"""
+        params = {"start_date": start_date, "end_date": end_date, "granularity": granularity}
+        if room_type_id:
+            params["room_type_id"] = room_type_id
+        if base_currency:
+            params["base_currency"] = base_currency
+        return api_client.get("/api/analytics/occupancy", params=params)
 
 
 # Instancia global
@@ -12,8 +12,16 @@ class ReservationService:
     def get_all(self, skip: int = 0, limit: int = 100, 
                 status: Optional[str] = None,
                 check_in_date_from: Optional[str] = None,
-                check_in_date_to: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Obtiene todas las reservas"""
+                check_in_date_to: Optional[str] = None,
+                fields: Optional[List[str]] = None,
+                sort: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Obtiene todas las reservas
+        
+        Args:
+            fields: Columnas a devolver (el servidor siempre incluye el id)
+            sort: Orden del servidor, ej. "-check_in_date"
+        """
         params = {"skip": skip, "limit": limit}
         if status:
             params["status"] = status
@@ -21,9 +29,29 @@ class ReservationService:
             params["check_in_date_from"] = check_in_date_from
         if check_in_date_to:
             params["check_in_date_to"] = check_in_date_to
+        if fields:
+            params["fields"] = ",".join(fields)
+        if sort:
+            params["sort"] = sort
         
         return api_client.get("/api/reservations/", params=params)
     
+    def get_picker(self, query: Optional[str] = None,
+                   status: Optional[List[str]] = None,
+                   limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Obtiene reservas en formato compacto para selectores
+        
+        Returns:
+            Lista de {id, confirmation_code, guest_name, balance, currency}
+        """
+        params = {"limit": limit}
+        if query:
+            params["query"] = query
+        if status:
+            params["status"] = status
+        return api_client.get("/api/reservations/picker", params=params)
+    
     def get_today(self) -> List[Dict[str, Any]]:
         """Obtiene reservas de hoy"""
         return api_client.get("/api/reservations/today")
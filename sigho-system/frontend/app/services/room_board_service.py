@@ -0,0 +1,121 @@
+"""
+Cliente del tablero de estado de habitaciones en tiempo real (WebSocket)
+
+Mantiene una conexión con /api/rooms/ws en un hilo propio y reparte los
+mensajes a las vistas suscritas mediante colas. Las vistas vacían su cola
+desde el hilo de Tk con `after`, ya que Tk no es seguro entre hilos.
+"""
+import json
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config.settings import API_BASE_URL
+from app.services.api_client import api_client
+
+try:
+    import websocket  # websocket-client
+except ImportError:  # Sin la librería las vistas se actualizan solo manualmente
+    websocket = None
+
+
+class RoomBoardClient:
+    """Conexión compartida al canal de estado de habitaciones"""
+
+    RECONNECT_DELAYS = (1, 2, 5, 10, 30)
+
+    def __init__(self, base_url: str = API_BASE_URL):
+        self.url = base_url.replace("http://", "ws://").replace("https://", "wss://") + "/api/rooms/ws"
+        self.subscribers: List[queue.Queue] = []
+        self.last_seq: Optional[int] = None
+        self._app = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Indica si se pueden recibir actualizaciones en tiempo real"""
+        return websocket is not None
+
+    def subscribe(self) -> Optional[queue.Queue]:
+        """Registra una vista; retorna su cola de mensajes o None si no hay soporte"""
+        if not self.available:
+            return None
+
+        subscriber = queue.Queue()
+        with self._lock:
+            self.subscribers.append(subscriber)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="room-board", daemon=True)
+                self._thread.start()
+            elif self._app is not None:
+                # Nueva vista: pedir instantánea para que parta del estado actual
+                self._send("snapshot")
+        return subscriber
+
+    def unsubscribe(self, subscriber: Optional[queue.Queue]):
+        """Elimina una vista; cierra la conexión si no quedan suscriptores"""
+        if subscriber is None:
+            return
+        with self._lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+            if not self.subscribers and self._app is not None:
+                self._app.close()
+
+    def _send(self, text: str):
+        """Envía un mensaje al servidor ignorando errores de conexión"""
+        try:
+            self._app.send(text)
+        except Exception:
+            pass
+
+    def _run(self):
+        """Bucle de conexión con reintentos"""
+        attempt = 0
+        while self.subscribers:
+            if not api_client.token:
+                time.sleep(1)
+                continue
+
+            self.last_seq = None
+            self._app = websocket.WebSocketApp(
+                f"{self.url}?token={api_client.token}",
+                on_message=self._on_message
+            )
+            started = time.monotonic()
+            self._app.run_forever(ping_interval=30, ping_timeout=10)
+            self._app = None
+
+            if not self.subscribers:
+                break
+            if time.monotonic() - started > 60:
+                attempt = 0
+            time.sleep(self.RECONNECT_DELAYS[min(attempt, len(self.RECONNECT_DELAYS) - 1)])
+            attempt += 1
+
+    def _on_message(self, app, text: str):
+        """Valida la secuencia y reparte el mensaje a los suscriptores"""
+        try:
+            message: Dict = json.loads(text)
+        except ValueError:
+            return
+
+        seq = message.get("seq")
+        if message.get("type") == "room_status" and self.last_seq is not None:
+            if seq <= self.last_seq:
+                return  # Ya incluido en la última instantánea
+            if seq != self.last_seq + 1:
+                # Se perdió algún delta: resincronizar
+                self._send("snapshot")
+        self.last_seq = seq
+
+        with self._lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            subscriber.put(message)
+
+
+# Instancia global del cliente
+room_board_client = RoomBoardClient()
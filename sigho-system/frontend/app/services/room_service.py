@@ -52,6 +52,10 @@ class RoomService:
         
         return api_client.get("/api/rooms/", params=params)
     
+    def get_summary(self) -> Dict[str, Any]:
+        """Obtiene conteos por estado (agregados en el servidor)"""
+        return api_client.get("/api/rooms/summary")
+    
     def get_available(self, check_in: str, check_out: str) -> List[Dict[str, Any]]:
         """Obtiene habitaciones disponibles"""
         params = {"check_in": check_in, "check_out": check_out}
@@ -11,13 +11,23 @@ from app.services.invoice_service import invoice_service
 from app.services.reservation_service import reservation_service
 
 
+# Estados de reserva que se pueden facturar
+BILLABLE_RESERVATION_STATUSES = ["confirmed", "checked_in", "checked_out"]
+
+# Columnas que necesita la tabla de facturas (el detalle se pide por ID)
+INVOICE_GRID_FIELDS = [
+    "invoice_number", "guest_name", "currency", "total_amount",
+    "paid_amount", "balance", "status", "issue_date"
+]
+
+
 class BillingView(ctk.CTkFrame):
     """Vista completa de gestión de facturación"""
     
     def __init__(self, parent):
         super().__init__(parent)
         self.selected_invoice = None
-        self.reservations = []
+        self.reservation_options: Dict[str, Dict[str, Any]] = {}
         self.setup_ui()
         self.load_invoices()
     
@@ -193,16 +203,7 @@ class BillingView(ctk.CTkFrame):
     def load_invoices(self):
         """Carga las facturas"""
         try:
-            invoices = invoice_service.get_all(limit=500)
-            
-            # Cargar reservas para generar facturas
-            try:
-                self.reservations = reservation_service.get_all(limit=500)
-            except:
-                self.reservations = []
-            
-            # Contar por estado
-            counts = {"draft": 0, "issued": 0, "paid": 0, "void": 0, "cancelled": 0}
+            invoices = invoice_service.get_all(limit=500, fields=INVOICE_GRID_FIELDS)
             
             for invoice in invoices:
                 # Formatear monto total
@@ -229,21 +230,23 @@ class BillingView(ctk.CTkFrame):
                     invoice['issue_date_display'] = str(issue_date)[:19]
                 else:
                     invoice['issue_date_display'] = "Pendiente"
-                
-                # Contar
-                if status in counts:
-                    counts[status] += 1
             
             self.table.load_data(invoices)
-            self.total_invoices_label.configure(text=f"Total: {len(invoices)}")
-            self.draft_label.configure(text=f"Borradores: {counts['draft']}")
-            self.issued_label.configure(text=f"Emitidas: {counts['issued']}")
-            self.paid_label.configure(text=f"Pagadas: {counts['paid']}")
-            self.void_label.configure(text=f"Anuladas: {counts['void']}")
+            self.load_summary()
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al cargar facturas:\n{str(e)}")
     
+    def load_summary(self):
+        """Actualiza la cabecera con los conteos calculados en el servidor"""
+        summary = invoice_service.get_summary()
+        counts = summary.get('by_status', {})
+        self.total_invoices_label.configure(text=f"Total: {summary.get('total', 0)}")
+        self.draft_label.configure(text=f"Borradores: {counts.get('draft', 0)}")
+        self.issued_label.configure(text=f"Emitidas: {counts.get('issued', 0)}")
+        self.paid_label.configure(text=f"Pagadas: {counts.get('paid', 0)}")
+        self.void_label.configure(text=f"Anuladas: {counts.get('void', 0)}")
+    
     def _format_amount(self, amount: float, currency: str) -> str:
         """Formatea un monto según la moneda"""
         symbols = {"VES": "Bs.", "USD": "$", "EUR": "€"}
@@ -256,7 +259,7 @@ class BillingView(ctk.CTkFrame):
             if status == "Todos":
                 self.load_invoices()
             else:
-                invoices = invoice_service.get_all(status=status, limit=500)
+                invoices = invoice_service.get_all(status=status, limit=500, fields=INVOICE_GRID_FIELDS)
                 self._format_and_load(invoices)
         except Exception as e:
             messagebox.showerror("Error", f"Error al filtrar:\n{str(e)}")
@@ -267,7 +270,7 @@ class BillingView(ctk.CTkFrame):
             if currency == "Todas":
                 self.load_invoices()
             else:
-                invoices = invoice_service.get_all(currency=currency, limit=500)
+                invoices = invoice_service.get_all(currency=currency, limit=500, fields=INVOICE_GRID_FIELDS)
                 self._format_and_load(invoices)
         except Exception as e:
             messagebox.showerror("Error", f"Error al filtrar:\n{str(e)}")
@@ -342,27 +345,36 @@ Notas: {invoice.get('notes', 'Ninguna') or 'Ninguna'}
         except Exception as e:
             messagebox.showerror("Error", f"Error al obtener detalles:\n{str(e)}")
     
+    def _search_reservations(self, text: str = "") -> list:
+        """Consulta el selector de reservas y devuelve las opciones del combobox"""
+        reservations = reservation_service.get_picker(
+            query=text or None, status=BILLABLE_RESERVATION_STATUSES
+        )
+        labels = []
+        for r in reservations:
+            label = (f"{r['confirmation_code']} - {r['guest_name']} - "
+                     f"Saldo {self._format_amount(r['balance'], r['currency'])}")
+            self.reservation_options[label] = r
+            labels.append(label)
+        return labels
+    
     def generate_invoice(self):
         """Genera una factura desde una reserva"""
-        if not self.reservations:
-            messagebox.showwarning("Advertencia", "No hay reservas disponibles")
+        # Las reservas se consultan solo al abrir el diálogo
+        self.reservation_options = {}
+        try:
+            reservation_options = self._search_reservations()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al cargar reservas:\n{str(e)}")
             return
         
-        # Preparar lista de reservas
-        reservation_options = []
-        for r in self.reservations:
-            code = r.get('confirmation_code', '')
-            guest_name = r.get('guest_name', '')
-            if not guest_name:
-                guest = r.get('guest', {})
-                guest_name = f"{guest.get('first_name', '')} {guest.get('last_name', '')}".strip()
-            total = r.get('total_amount', 0)
-            currency = r.get('currency', 'USD')
-            reservation_options.append(f"{code} - {guest_name} - ${total:,.2f} {currency}")
+        if not reservation_options:
+            messagebox.showwarning("Advertencia", "No hay reservas disponibles")
+            return
         
         fields = [
             {"name": "reservation", "label": "Reserva", "type": "combobox",
-             "values": reservation_options, "required": True},
+             "values": reservation_options, "search": self._search_reservations, "required": True},
             {"name": "guest_document_type", "label": "Tipo Documento", "type": "combobox",
              "values": ["V", "E", "J", "G", "P"], "default": "V"},
             {"name": "guest_document_number", "label": "Número Documento", "type": "entry"},
@@ -375,9 +387,11 @@ Notas: {invoice.get('notes', 'Ninguna') or 'Ninguna'}
             try:
                 # Extraer el ID de la reserva
                 res_text = values['reservation']
-                res_code = res_text.split(' - ')[0]
-                reservation = next((r for r in self.reservations 
-                                  if r.get('confirmation_code', '') == res_code), None)
+                reservation = self.reservation_options.get(res_text)
+                if reservation is None:
+                    res_code = res_text.split(' - ')[0].strip()
+                    reservation = next((r for r in self.reservation_options.values()
+                                        if r['confirmation_code'] == res_code), None)
                 
                 if not reservation:
                     raise Exception("Reserva no encontrada")
@@ -1,10 +1,12 @@
 """
 Vista de Dashboard (Panel Principal)
 """
+import queue
 import customtkinter as ctk
 from tkinter import messagebox
 from config.theme import FONTS, SIZES
 from app.services.api_client import api_client
+from app.services.room_board_service import room_board_client
 
 
 class DashboardView(ctk.CTkScrollableFrame):
@@ -14,8 +16,15 @@ class DashboardView(ctk.CTkScrollableFrame):
         super().__init__(parent)
         
         self.dashboard_data = None
+        self.room_states = None  # {room_id: (estado, activa)} según el tablero
         self.setup_ui()
         self.load_data()
+        
+        # Actualizaciones en tiempo real de las tarjetas de habitaciones
+        self.board_queue = room_board_client.subscribe()
+        self._board_job = None
+        if self.board_queue is not None:
+            self._board_job = self.after(250, self._poll_room_board)
     
     def setup_ui(self):
         """Configura la interfaz"""
@@ -139,10 +148,11 @@ class DashboardView(ctk.CTkScrollableFrame):
         self.active_reservations_card["value"].configure(text=str(reservations.get("active", 0)))
         self.pending_reservations_card["value"].configure(text=str(reservations.get("pending", 0)))
         
-        # Ingresos
+        # Ingresos (todas las monedas normalizadas a la moneda base)
         revenue = self.dashboard_data.get("revenue", {})
-        self.today_revenue_card["value"].configure(text=f"${revenue.get('today', 0):,.2f}")
-        self.monthly_revenue_card["value"].configure(text=f"${revenue.get('monthly', 0):,.2f}")
+        currency = revenue.get("currency", "USD")
+        self.today_revenue_card["value"].configure(text=f"{currency} {revenue.get('today', 0):,.2f}")
+        self.monthly_revenue_card["value"].configure(text=f"{currency} {revenue.get('monthly', 0):,.2f}")
         
         # Mantenimiento
         maintenance = self.dashboard_data.get("maintenance", {})
@@ -150,4 +160,52 @@ class DashboardView(ctk.CTkScrollableFrame):
         
         # Inventario
         inventory = self.dashboard_data.get("inventory", {})
-        self.low_stock_card["value"].configure(text=str(inventory.get("low_stock_items", 0)))
\ No newline at end of file
+        self.low_stock_card["value"].configure(text=str(inventory.get("low_stock_items", 0)))
+    
+    # ========== TIEMPO REAL ==========
+    def _poll_room_board(self):
+        """Aplica los mensajes del tablero recibidos desde el último sondeo"""
+        changed = False
+        try:
+            while True:
+                message = self.board_queue.get_nowait()
+                if message.get("type") == "snapshot":
+                    self.room_states = {
+                        room["room_id"]: (room["status"], room["is_active"])
+                        for room in message.get("rooms", [])
+                    }
+                    changed = True
+                elif message.get("type") == "room_status" and self.room_states is not None:
+                    for change in message.get("changes", []):
+                        self.room_states[change["room_id"]] = (change["status"], change["is_active"])
+                    changed = True
+        except queue.Empty:
+            pass
+        
+        if changed and self.dashboard_data:
+            self.dashboard_data["rooms"] = self._room_counts()
+            self.update_cards()
+        
+        self._board_job = self.after(250, self._poll_room_board)
+    
+    def _room_counts(self) -> dict:
+        """Recalcula las tarjetas de habitaciones con los mismos criterios que /overview"""
+        states = self.room_states.values()
+        total = sum(1 for _, active in states if active)
+        occupied = sum(1 for status, _ in states if status == "occupied")
+        return {
+            "total": total,
+            "available": sum(1 for status, active in states if active and status == "available"),
+            "occupied": occupied,
+            "cleaning": sum(1 for status, _ in states if status == "cleaning"),
+            "maintenance": sum(1 for status, _ in states if status in ("maintenance", "out_of_service")),
+            "occupancy_rate": round(occupied / total * 100, 2) if total > 0 else 0
+        }
+    
+    def destroy(self):
+        """Cancela la suscripción al tablero al cerrar la vista"""
+        if self._board_job is not None:
+            self.after_cancel(self._board_job)
+            self._board_job = None
+        room_board_client.unsubscribe(self.board_queue)
+        super().destroy()
@@ -182,6 +182,21 @@ Notas:
 {guest.get('notes', 'Ninguna')}
         """
         
+        try:
+            stats = guest_service.get_stats(guest['id'])
+            spent = ", ".join(
+                f"{currency} {amount:,.2f}" for currency, amount in stats['total_spent'].items()
+            ) or "Sin pagos"
+            details += f"""
+Historial:
+Reservas: {stats['reservation_count']} (estadías: {stats['stay_count']}, canceladas: {stats['cancelled_count']})
+Noches: {stats['total_nights']}
+Gasto total: {spent}
+Última estadía: {stats.get('last_stay_date') or 'N/A'}
+"""
+        except Exception:
+            pass  # Las estadísticas son complementarias al detalle
+        
         messagebox.showinfo("Detalles del Huésped", details)
     
     def create_guest(self):
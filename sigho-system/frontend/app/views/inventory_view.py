@@ -1,14 +1,19 @@
 """
 Vista Completa de Gestión de Inventario
 """
+import csv
 import customtkinter as ctk
-from tkinter import messagebox
-from typing import Optional, Dict, Any
+from tkinter import messagebox, filedialog
+from typing import Optional, Dict, Any, List
 from config.theme import FONTS, SIZES
 from app.components.data_table import DataTable
 from app.components.form_dialog import FormDialog
 from app.services.inventory_service import inventory_service
 
+# Columnas del CSV de importación (item_code o inventory_id identifica el item)
+IMPORT_COLUMNS = ("item_code", "movement_type", "quantity", "reason", "notes", "reference_document")
+IMPORT_BATCH_SIZE = 2000  # Máximo de líneas por petición aceptado por el backend
+
 
 class InventoryView(ctk.CTkFrame):
     """Vista completa de gestión de inventario"""
@@ -65,6 +70,14 @@ class InventoryView(ctk.CTkFrame):
             height=SIZES["button_height"]
         ).pack(side="left", padx=2)
         
+        ctk.CTkButton(
+            btn_frame,
+            text="Importar CSV",
+            command=self.import_movements,
+            width=120,
+            height=SIZES["button_height"]
+        ).pack(side="left", padx=2)
+        
         ctk.CTkButton(
             btn_frame,
             text="Stock Bajo",
@@ -374,6 +387,89 @@ Descripción:
             height=500
         )
     
+    def read_movements_csv(self, path: str) -> List[Dict[str, Any]]:
+        """
+        Lee un CSV de movimientos
+        Columnas: item_code (o inventory_id), movement_type (in/out/adjustment),
+        quantity, reason, notes, reference_document
+        """
+        movements = []
+        with open(path, newline="", encoding="utf-8-sig") as csv_file:
+            reader = csv.DictReader(csv_file)
+            for number, row in enumerate(reader, start=2):
+                row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+                if not any(row.values()):
+                    continue
+                try:
+                    quantity = int(row.get("quantity") or "")
+                except ValueError:
+                    raise ValueError(f"Fila {number}: cantidad inválida '{row.get('quantity')}'")
+                
+                movement = {
+                    "movement_type": (row.get("movement_type") or "").lower(),
+                    "quantity": quantity
+                }
+                if row.get("inventory_id"):
+                    movement["inventory_id"] = int(row["inventory_id"])
+                for column in IMPORT_COLUMNS:
+                    if column not in movement and row.get(column):
+                        movement[column] = row[column]
+                movements.append(movement)
+        return movements
+    
+    def import_movements(self):
+        """Importa movimientos desde un archivo CSV usando la carga masiva"""
+        path = filedialog.askopenfilename(
+            title="Importar movimientos",
+            filetypes=[("CSV", "*.csv"), ("Todos los archivos", "*.*")]
+        )
+        if not path:
+            return
+        
+        try:
+            movements = self.read_movements_csv(path)
+        except (OSError, ValueError, csv.Error) as e:
+            messagebox.showerror("Error", f"No se pudo leer el archivo:\n{str(e)}")
+            return
+        
+        if not movements:
+            messagebox.showwarning("Advertencia", "El archivo no contiene movimientos")
+            return
+        
+        atomic = messagebox.askyesno(
+            "Importar movimientos",
+            f"Se importarán {len(movements)} movimientos.\n\n"
+            f"¿Cancelar toda la importación si alguna línea tiene errores?"
+        )
+        
+        applied, errors = 0, []
+        try:
+            for start in range(0, len(movements), IMPORT_BATCH_SIZE):
+                chunk = movements[start:start + IMPORT_BATCH_SIZE]
+                response = inventory_service.import_movements(
+                    chunk, reason="Importación CSV", atomic=atomic
+                )
+                applied += response["applied"]
+                for result in response["results"]:
+                    if result["status"] == "error":
+                        errors.append(f"Movimiento {start + result['line']}: {result['error']}")
+                if atomic and not response["committed"] and errors:
+                    break
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al importar movimientos:\n{str(e)}")
+            self.load_items()
+            return
+        
+        summary = f"Movimientos aplicados: {applied}\nLíneas con error: {len(errors)}"
+        if errors:
+            detail = "\n".join(errors[:15])
+            if len(errors) > 15:
+                detail += f"\n... y {len(errors) - 15} más"
+            messagebox.showwarning("Importación con errores", f"{summary}\n\n{detail}")
+        else:
+            messagebox.showinfo("Éxito", summary)
+        self.load_items()
+    
     def adjust_quantity(self):
         """Ajusta la cantidad de un item"""
         if not self.selected_item:
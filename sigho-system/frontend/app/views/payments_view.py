@@ -11,13 +11,17 @@ from app.services.payment_service import payment_service
 from app.services.reservation_service import reservation_service
 
 
+# Estados de reserva que admiten pagos
+PAYABLE_RESERVATION_STATUSES = ["pending", "confirmed", "checked_in"]
+
+
 class PaymentsView(ctk.CTkFrame):
     """Vista completa de gestión de pagos"""
     
     def __init__(self, parent):
         super().__init__(parent)
         self.selected_payment = None
-        self.reservations = []
+        self.reservation_options: Dict[str, Dict[str, Any]] = {}
         self.setup_ui()
         self.load_payments()
     
@@ -88,7 +92,7 @@ class PaymentsView(ctk.CTkFrame):
         
         self.method_filter = ctk.CTkComboBox(
             filter_frame,
-            values=["Todos", "cash", "card", "transfer", "mobile"],
+            values=["Todos", "cash_ves", "cash_usd", "cash_eur", "transfer", "mobile_payment", "credit_card", "debit_card", "other"],
             command=self.filter_by_method,
             width=130
         )
@@ -156,15 +160,7 @@ class PaymentsView(ctk.CTkFrame):
         try:
             payments = payment_service.get_all(limit=500)
             
-            # Cargar reservas para los diálogos
-            try:
-                self.reservations = reservation_service.get_all(limit=500)
-            except:
-                pass
-            
-            # Agregar información formateada y calcular totales
-            totals = {"VES": 0.0, "USD": 0.0, "EUR": 0.0}
-            
+            # Agregar información formateada
             for payment in payments:
                 # Código de reserva
                 payment['reservation_code'] = payment.get('reservation_code', f"RES-{payment.get('reservation_id', 'N/A')}")
@@ -202,20 +198,25 @@ class PaymentsView(ctk.CTkFrame):
                 payment_date = payment.get('payment_date', '')
                 if payment_date and len(payment_date) > 10:
                     payment['payment_date'] = payment_date[:19]
-                
-                # Acumular totales
-                if currency in totals and status == 'completed':
-                    totals[currency] += amount
             
             self.table.load_data(payments)
-            self.total_payments_label.configure(text=f"Total pagos: {len(payments)}")
-            self.ves_total_label.configure(text=f"VES: Bs. {totals['VES']:,.2f}")
-            self.usd_total_label.configure(text=f"USD: ${totals['USD']:,.2f}")
-            self.eur_total_label.configure(text=f"EUR: €{totals['EUR']:,.2f}")
+            self.load_summary()
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al cargar pagos:\n{str(e)}")
     
+    def load_summary(self):
+        """Actualiza la cabecera con los totales calculados en el servidor"""
+        summary = payment_service.get_summary()
+        totals = {
+            currency: values.get('completed_amount', 0.0)
+            for currency, values in summary.get('by_currency', {}).items()
+        }
+        self.total_payments_label.configure(text=f"Total pagos: {summary.get('total', 0)}")
+        self.ves_total_label.configure(text=f"VES: Bs. {totals.get('VES', 0.0):,.2f}")
+        self.usd_total_label.configure(text=f"USD: ${totals.get('USD', 0.0):,.2f}")
+        self.eur_total_label.configure(text=f"EUR: €{totals.get('EUR', 0.0):,.2f}")
+    
     def _format_amount(self, amount: float, currency: str) -> str:
         """Formatea un monto según la moneda"""
         symbols = {"VES": "Bs.", "USD": "$", "EUR": "€"}
@@ -228,8 +229,8 @@ class PaymentsView(ctk.CTkFrame):
             if currency == "Todas":
                 self.load_payments()
             else:
-                payments = payment_service.get_all(currency=currency, limit=500)
-                self._format_and_load(payments)
+                payments, total = payment_service.get_page(currency=currency, limit=500)
+                self._format_and_load(payments, total)
         except Exception as e:
             messagebox.showerror("Error", f"Error al filtrar:\n{str(e)}")
     
@@ -239,12 +240,12 @@ class PaymentsView(ctk.CTkFrame):
             if method == "Todos":
                 self.load_payments()
             else:
-                payments = payment_service.get_all(payment_method=method, limit=500)
-                self._format_and_load(payments)
+                payments, total = payment_service.get_page(payment_method=method, limit=500)
+                self._format_and_load(payments, total)
         except Exception as e:
             messagebox.showerror("Error", f"Error al filtrar:\n{str(e)}")
     
-    def _format_and_load(self, payments):
+    def _format_and_load(self, payments, total: Optional[int] = None):
         """Formatea y carga los datos"""
         for payment in payments:
             payment['reservation_code'] = payment.get('reservation_code', f"RES-{payment.get('reservation_id', 'N/A')}")
@@ -260,7 +261,10 @@ class PaymentsView(ctk.CTkFrame):
                 payment['payment_date'] = payment_date[:19]
         
         self.table.load_data(payments)
-        self.total_payments_label.configure(text=f"Resultados: {len(payments)}")
+        if total is not None and total > len(payments):
+            self.total_payments_label.configure(text=f"Resultados: {len(payments)} de {total}")
+        else:
+            self.total_payments_label.configure(text=f"Resultados: {len(payments)}")
     
     def on_payment_select(self, payment: Dict[str, Any]):
         """Callback cuando se selecciona un pago"""
@@ -297,15 +301,52 @@ Notas:
         
         messagebox.showinfo("Detalles del Pago", details)
     
+    def _search_reservations(self, text: str = "") -> list:
+        """Consulta el selector de reservas y devuelve las opciones del combobox"""
+        reservations = reservation_service.get_picker(
+            query=text or None, status=PAYABLE_RESERVATION_STATUSES
+        )
+        labels = []
+        for r in reservations:
+            label = (f"{r['confirmation_code']} - {r['guest_name']} - "
+                     f"Saldo {self._format_amount(r['balance'], r['currency'])}")
+            self.reservation_options[label] = r
+            labels.append(label)
+        return labels
+    
+    def _open_reservation_options(self) -> Optional[list]:
+        """Carga las opciones del selector al abrir un diálogo"""
+        self.reservation_options = {}
+        try:
+            options = self._search_reservations()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error al cargar reservas:\n{str(e)}")
+            return None
+        if not options:
+            messagebox.showwarning("Advertencia", "No hay reservas disponibles")
+            return None
+        return options
+    
+    def _selected_reservation(self, text: str) -> Dict[str, Any]:
+        """Obtiene la reserva elegida en el combobox"""
+        reservation = self.reservation_options.get(text)
+        if reservation is None:
+            code = text.split(' - ')[0].strip()
+            reservation = next((r for r in self.reservation_options.values()
+                                if r['confirmation_code'] == code), None)
+        if reservation is None:
+            raise Exception("Reserva no encontrada")
+        return reservation
+    
     def create_payment(self):
         """Registra un nuevo pago"""
-        # Preparar lista de reservas
-        reservation_options = [f"{r.get('confirmation_code', '')} - {r.get('guest_name', '')}" 
-                              for r in self.reservations] if self.reservations else ["RES-001"]
+        reservation_options = self._open_reservation_options()
+        if reservation_options is None:
+            return
         
         fields = [
             {"name": "reservation", "label": "Reserva", "type": "combobox",
-             "values": reservation_options, "required": True},
+             "values": reservation_options, "search": self._search_reservations, "required": True},
             {"name": "amount", "label": "Monto", "type": "entry", "validate": "number", "required": True},
             {"name": "currency", "label": "Moneda", "type": "combobox",
              "values": ["VES", "USD", "EUR"], "required": True, "default": "VES"},
@@ -318,14 +359,7 @@ Notas:
         def on_submit(values):
             try:
                 # Extraer el ID de la reserva
-                if self.reservations:
-                    res_text = values['reservation']
-                    res_id = next((r['id'] for r in self.reservations 
-                                 if r.get('confirmation_code', '') in res_text), None)
-                    if res_id:
-                        values['reservation_id'] = res_id
-                else:
-                    values['reservation_id'] = 1  # Default
+                values['reservation_id'] = self._selected_reservation(values['reservation'])['id']
                 
                 values.pop('reservation', None)  # Remover el campo temporal
                 values['amount'] = float(values['amount'])
@@ -347,49 +381,42 @@ Notas:
     
     def check_reservation_balance(self):
         """Verifica el balance de una reserva"""
-        if not self.reservations:
-            messagebox.showwarning("Advertencia", "No hay reservas disponibles")
+        reservation_options = self._open_reservation_options()
+        if reservation_options is None:
             return
         
-        # Diálogo para seleccionar reserva
-        reservation_options = [f"{r.get('confirmation_code', '')} - {r.get('guest_name', '')}" 
-                              for r in self.reservations]
-        
         fields = [
             {"name": "reservation", "label": "Seleccione Reserva", "type": "combobox",
-             "values": reservation_options, "required": True}
+             "values": reservation_options, "search": self._search_reservations, "required": True}
         ]
         
         def on_submit(values):
             try:
-                res_text = values['reservation']
-                reservation = next((r for r in self.reservations 
-                                  if r.get('confirmation_code', '') in res_text), None)
+                selected = self._selected_reservation(values['reservation'])
+                reservation = reservation_service.get_by_id(selected['id'])
+                
+                total = reservation.get('total_amount', 0)
+                paid = reservation.get('paid_amount', 0)
+                balance = reservation.get('balance', total - paid)
+                currency = reservation.get('currency', 'VES')
                 
-                if reservation:
-                    total = reservation.get('total_price', 0)
-                    paid = reservation.get('paid_amount', 0)
-                    balance = total - paid
-                    
-                    status = "Pagado" if balance <= 0 else "Pendiente"
-                    
-                    details = f"""
+                status = "Pagado" if balance <= 0 else "Pendiente"
+                
+                details = f"""
 Balance de Reserva
 
-Código: {reservation.get('confirmation_code', 'N/A')}
-Huésped: {reservation.get('guest_name', 'N/A')}
+Código: {selected['confirmation_code']}
+Huésped: {selected['guest_name']}
 
-Monto Total: ${total:,.2f}
-Monto Pagado: ${paid:,.2f}
-Balance Pendiente: ${balance:,.2f}
+Monto Total: {self._format_amount(total, currency)}
+Monto Pagado: {self._format_amount(paid, currency)}
+Balance Pendiente: {self._format_amount(balance, currency)}
 
 Estado: {status}
-                    """
-                    
-                    messagebox.showinfo("Balance de Reserva", details)
-                    return True
+                """
                 
-                raise Exception("Reserva no encontrada")
+                messagebox.showinfo("Balance de Reserva", details)
+                return True
             except Exception as e:
                 raise Exception(f"Error al consultar balance: {str(e)}")
         
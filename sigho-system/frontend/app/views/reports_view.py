@@ -103,7 +103,8 @@ class ReportsView(ctk.CTkFrame):
         
         self.results_table = DataTable(
             results_frame,
-            columns=columns
+            columns=columns,
+            virtual=True
         )
         self.results_table.grid(row=1, column=0, sticky="nsew", padx=10, pady=(0, 10))
     
@@ -169,25 +170,29 @@ class ReportsView(ctk.CTkFrame):
                 start_date, end_date = dialog.result
                 data = report_service.get_revenue(start_date, end_date)
                 
-                # Formatear datos
+                # Formatear datos (ingresos por día y total normalizado)
                 table_data = []
+                base_currency = "USD"
                 if isinstance(data, dict):
-                    for key, value in data.items():
+                    base_currency = data.get("summary", {}).get("base_currency", base_currency)
+                    for day in data.get("daily_revenue", []):
                         table_data.append({
-                            "col1": key,
-                            "col2": f"${value.get('VES', 0):,.2f}",
-                            "col3": f"${value.get('USD', 0):,.2f}",
-                            "col4": f"€{value.get('EUR', 0):,.2f}"
+                            "col1": day["date"],
+                            "col2": f"Bs. {day.get('ves', 0):,.2f}",
+                            "col3": f"${day.get('usd', 0):,.2f}",
+                            "col4": f"€{day.get('eur', 0):,.2f}",
+                            "col5": f"{day.get('normalized', 0):,.2f}"
                         })
                 
                 if not table_data:
-                    table_data = [{"col1": "Sin datos", "col2": "-", "col3": "-", "col4": "-"}]
+                    table_data = [{"col1": "Sin datos", "col2": "-", "col3": "-", "col4": "-", "col5": "-"}]
                 
                 columns = [
-                    {"key": "col1", "label": "Período", "width": 150},
+                    {"key": "col1", "label": "Fecha", "width": 150},
                     {"key": "col2", "label": "VES", "width": 150},
                     {"key": "col3", "label": "USD", "width": 150},
-                    {"key": "col4", "label": "EUR", "width": 150}
+                    {"key": "col4", "label": "EUR", "width": 150},
+                    {"key": "col5", "label": f"Total ({base_currency})", "width": 150}
                 ]
                 self.results_table.update_columns(columns)
                 self.results_table.load_data(table_data)
@@ -1,6 +1,7 @@
 """
 Vista Completa de Gestión de Habitaciones
 """
+import queue
 import customtkinter as ctk
 from tkinter import messagebox
 from typing import Optional, Dict, Any
@@ -8,6 +9,16 @@ from config.theme import FONTS, SIZES
 from app.components.data_table import DataTable
 from app.components.form_dialog import FormDialog
 from app.services.room_service import room_service
+from app.services.room_board_service import room_board_client
+
+
+STATUS_DISPLAY = {
+    "available": "Disponible",
+    "occupied": "Ocupada",
+    "cleaning": "Limpieza",
+    "maintenance": "Mantenimiento",
+    "out_of_service": "Fuera de servicio"
+}
 
 
 class RoomsView(ctk.CTkFrame):
@@ -17,8 +28,17 @@ class RoomsView(ctk.CTkFrame):
         super().__init__(parent)
         self.selected_room = None
         self.room_types = []
+        self.rooms = []
+        self.summary = {}
+        self.status_filter = None
         self.setup_ui()
         self.load_rooms()
+        
+        # Actualizaciones en tiempo real del estado de las habitaciones
+        self.board_queue = room_board_client.subscribe()
+        self._board_job = None
+        if self.board_queue is not None:
+            self._board_job = self.after(250, self._poll_room_board)
     
     def setup_ui(self):
         """Configura la interfaz"""
@@ -139,39 +159,42 @@ class RoomsView(ctk.CTkFrame):
             except:
                 self.room_types = []
             
-            # Formatear datos y contar
-            counts = {"available": 0, "occupied": 0, "maintenance": 0, "cleaning": 0}
-            
+            # Formatear datos
             for room in rooms:
                 room['room_type_name'] = room.get('room_type', {}).get('name', 'N/A')
                 
-                # Estado con emoji
+                # Estado
                 status = room.get('status', 'available')
-                status_map = {
-                    "available": "Disponible",
-                    "occupied": "Ocupada",
-                    "cleaning": "Limpieza",
-                    "maintenance": "Mantenimiento",
-                    "out_of_service": "Fuera de servicio"
-                }
-                room['status_display'] = status_map.get(status, status)
+                room['status_display'] = STATUS_DISPLAY.get(status, status)
                 
                 # Activa
                 room['is_active_display'] = "Sí" if room.get('is_active', True) else "No"
-                
-                # Contar
-                if status in counts:
-                    counts[status] += 1
             
+            self.rooms = rooms
+            self.status_filter = None
             self.table.load_data(rooms)
-            self.total_rooms_label.configure(text=f"Total: {len(rooms)}")
-            self.available_label.configure(text=f"Disponibles: {counts['available']}")
-            self.occupied_label.configure(text=f"Ocupadas: {counts['occupied']}")
-            self.maintenance_label.configure(text=f"Mantenimiento: {counts['maintenance']}")
+            self.load_summary()
             
         except Exception as e:
             messagebox.showerror("Error", f"Error al cargar habitaciones:\n{str(e)}")
     
+    def load_summary(self):
+        """Actualiza la cabecera con los conteos calculados en el servidor"""
+        self.summary = room_service.get_summary()
+        self._render_summary()
+    
+    def _render_summary(self):
+        """Muestra los conteos de self.summary en la cabecera"""
+        summary = self.summary
+        counts = summary.get('by_status', {})
+        if self.status_filter:
+            self.total_rooms_label.configure(text=f"Resultados: {len(self.rooms)}")
+        else:
+            self.total_rooms_label.configure(text=f"Total: {summary.get('total', 0)}")
+        self.available_label.configure(text=f"Disponibles: {counts.get('available', 0)}")
+        self.occupied_label.configure(text=f"Ocupadas: {counts.get('occupied', 0)}")
+        self.maintenance_label.configure(text=f"Mantenimiento: {counts.get('maintenance', 0)}")
+    
     def filter_by_status(self, status: str):
         """Filtra por estado"""
         try:
@@ -179,6 +202,7 @@ class RoomsView(ctk.CTkFrame):
                 self.load_rooms()
             else:
                 rooms = room_service.get_all(status=status, limit=500)
+                self.status_filter = status
                 self._format_and_load(rooms)
         except Exception as e:
             messagebox.showerror("Error", f"Error al filtrar:\n{str(e)}")
@@ -187,13 +211,73 @@ class RoomsView(ctk.CTkFrame):
         """Formatea y carga datos"""
         for room in rooms:
             room['room_type_name'] = room.get('room_type', {}).get('name', 'N/A')
-            status_map = {"available": "Disponible", "occupied": "Ocupada", "cleaning": "Limpieza", "maintenance": "Mantenimiento", "out_of_service": "Fuera de servicio"}
-            room['status_display'] = status_map.get(room.get('status', 'available'), 'N/A')
+            room['status_display'] = STATUS_DISPLAY.get(room.get('status', 'available'), 'N/A')
             room['is_active_display'] = "Sí" if room.get('is_active', True) else "No"
         
+        self.rooms = rooms
         self.table.load_data(rooms)
         self.total_rooms_label.configure(text=f"Resultados: {len(rooms)}")
     
+    # ========== TIEMPO REAL ==========
+    def _poll_room_board(self):
+        """Aplica los mensajes del tablero recibidos desde el último sondeo"""
+        changed = False
+        try:
+            while True:
+                changed |= self._apply_board_message(self.board_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if changed:
+            self.table.load_data(self.rooms)
+            self._render_summary()
+        
+        self._board_job = self.after(250, self._poll_room_board)
+    
+    def _apply_board_message(self, message: Dict[str, Any]) -> bool:
+        """Actualiza en sitio las filas afectadas; retorna si hubo cambios"""
+        if message.get("type") == "snapshot":
+            statuses = {room["room_id"]: room["status"] for room in message.get("rooms", [])}
+            counts = {status: 0 for status in STATUS_DISPLAY}
+            for status in statuses.values():
+                counts[status] = counts.get(status, 0) + 1
+            self.summary = dict(self.summary, total=len(statuses), by_status=counts)
+        elif message.get("type") == "room_status":
+            statuses = {change["room_id"]: change["status"] for change in message.get("changes", [])}
+            counts = self.summary.setdefault("by_status", {})
+            known = {room.get("id"): room.get("status") for room in self.rooms}
+            for change in message.get("changes", []):
+                previous = change.get("previous_status") or known.get(change["room_id"])
+                if previous:
+                    counts[previous] = max(counts.get(previous, 0) - 1, 0)
+                else:
+                    self.summary["total"] = self.summary.get("total", 0) + 1
+                counts[change["status"]] = counts.get(change["status"], 0) + 1
+        else:
+            return False
+        
+        rooms = []
+        for room in self.rooms:
+            status = statuses.get(room.get("id"))
+            if status is not None and status != room.get("status"):
+                if self.status_filter and status != self.status_filter:
+                    continue  # Ya no cumple el filtro activo
+                # Nuevo dict: la tabla compara filas para decidir qué redibujar
+                room = dict(room, status=status, status_display=STATUS_DISPLAY.get(status, status))
+                if self.selected_room and self.selected_room.get("id") == room["id"]:
+                    self.selected_room = room
+            rooms.append(room)
+        self.rooms = rooms
+        return True
+    
+    def destroy(self):
+        """Cancela la suscripción al tablero al cerrar la vista"""
+        if self._board_job is not None:
+            self.after_cancel(self._board_job)
+            self._board_job = None
+        room_board_client.unsubscribe(self.board_queue)
+        super().destroy()
+    
     def on_room_select(self, room: Dict[str, Any]):
         """Callback cuando se selecciona una habitación"""
         self.selected_room = room
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark de DataTable con 50.000 filas
+Compara la carga completa contra el modo virtual y mide la recarga con diferencias
+(requiere un entorno gráfico para crear la ventana de Tk)
+"""
+import sys
+import os
+import time
+import random
+
+# Agregar el directorio frontend al path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import customtkinter as ctk
+from app.components.data_table import DataTable
+
+
+ROWS = 50_000
+
+COLUMNS = [
+    {"key": "id", "label": "ID", "width": 60},
+    {"key": "confirmation_code", "label": "Código", "width": 100},
+    {"key": "guest_name", "label": "Huésped", "width": 200},
+    {"key": "status", "label": "Estado", "width": 100, "formatter": lambda v: v.upper()},
+    {"key": "total_amount", "label": "Total", "width": 100, "formatter": lambda v: f"${v:,.2f}"},
+    {"key": "balance", "label": "Balance", "width": 100, "formatter": lambda v: f"${v:,.2f}"}
+]
+
+
+def build_rows(count: int):
+    """Genera filas sintéticas parecidas a las reservas"""
+    statuses = ["pending", "confirmed", "checked_in", "checked_out", "cancelled"]
+    return [
+        {
+            "id": i,
+            "confirmation_code": f"RES{i:08d}",
+            "guest_name": f"Huésped {i}",
+            "status": random.choice(statuses),
+            "total_amount": random.uniform(20, 2000),
+            "balance": random.uniform(0, 200)
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(root, table: DataTable, data) -> float:
+    """Mide el tiempo de load_data incluyendo el procesamiento pendiente de Tk"""
+    start = time.perf_counter()
+    table.load_data(data)
+    root.update_idletasks()
+    return time.perf_counter() - start
+
+
+def main():
+    """Función principal del benchmark"""
+    root = ctk.CTk()
+    root.withdraw()
+
+    rows = build_rows(ROWS)
+
+    # 1% de filas modificadas para medir la recarga incremental
+    changed = [dict(row) for row in rows]
+    for row in random.sample(changed, ROWS // 100):
+        row["balance"] = 0.0
+
+    print("=" * 60)
+    print(f"BENCHMARK DataTable - {ROWS:,} filas")
+    print("=" * 60)
+
+    for virtual in (False, True):
+        table = DataTable(root, columns=COLUMNS, virtual=virtual)
+        table.grid(row=0, column=0, sticky="nsew")
+
+        first = measure(root, table, rows)
+        same = measure(root, table, [dict(row) for row in rows])
+        diff = measure(root, table, changed)
+
+        # Búsqueda de la fila seleccionada (iid -> índice)
+        table.tree.selection_set(table.tree.get_children()[-1])
+        start = time.perf_counter()
+        for _ in range(1000):
+            table.get_selected_item()
+        lookup = (time.perf_counter() - start) / 1000
+
+        mode = "virtual" if virtual else "completo"
+        print(f"\nModo {mode}:")
+        print(f"  Carga inicial:            {first * 1000:10.1f} ms")
+        print(f"  Recarga sin cambios:      {same * 1000:10.1f} ms")
+        print(f"  Recarga con 1% cambios:   {diff * 1000:10.1f} ms")
+        print(f"  get_selected_item():      {lookup * 1_000_000:10.1f} µs")
+        print(f"  Items en el Treeview:     {len(table.tree.get_children()):10,}")
+
+        table.destroy()
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()